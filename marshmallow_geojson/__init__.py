@@ -20,11 +20,13 @@ References:
     https://www.rfc-editor.org/rfc/rfc7946.html
 """
 
+from .arrow import from_arrow, to_arrow, to_arrow_batches
 from .feature import FeatureSchema
 from .feature_collection import FeatureCollectionSchema
 from .geojson import GeoJSONSchema
-from .geometry import GeometriesSchema
+from .geometry import GeometriesSchema, WKBGeometryField
 from .geometry_collection import GeometryCollectionSchema
+from .intern import PropertyTable
 from .line_string import LineStringSchema
 from .multi_line_string import MultiLineStringSchema
 from .multi_point import MultiPointSchema
@@ -33,6 +35,8 @@ from .object_type import GeoJSONType, GeometryType
 from .point import PointSchema
 from .polygon import PolygonSchema
 from .property import PropertiesSchema
+from .tile import tile_index
+from .topojson import from_topojson, to_topojson
 from .validate import (
     Bbox,
     LinearRing,
@@ -41,6 +45,7 @@ from .validate import (
     NoForbiddenMembers,
     NoGeometryMembers,
     PolygonRings,
+    RightHandRule,
 )
 
 __author__ = "Aliaksandr Vaskevich"
@@ -61,6 +66,7 @@ __all__ = (
     "GeoJSONType",
     # property schemas
     "PropertiesSchema",
+    "PropertyTable",
     # schemas
     "PointSchema",
     "MultiPointSchema",
@@ -73,6 +79,17 @@ __all__ = (
     "FeatureCollectionSchema",
     "GeometriesSchema",
     "GeoJSONSchema",
+    # fields
+    "WKBGeometryField",
+    # arrow
+    "to_arrow",
+    "to_arrow_batches",
+    "from_arrow",
+    # topojson
+    "to_topojson",
+    "from_topojson",
+    # tile
+    "tile_index",
     # validators
     "Bbox",
     "LinearRing",
@@ -81,4 +98,5 @@ __all__ = (
     "NoForbiddenMembers",
     "NoGeometryMembers",
     "PolygonRings",
+    "RightHandRule",
 )
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
-from typing import Any
+import math
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import chain
+from typing import Any, TypeVar
 
 import marshmallow as ma
 from marshmallow import ValidationError
-from marshmallow.fields import Float
+from marshmallow.fields import Float, List, Nested
 from marshmallow.validate import Range
 
 lon = Float(
@@ -24,6 +33,166 @@ alt = Float(
 )
 
 
+# struct format characters of floating-point buffers.
+FLOAT_FORMATS = frozenset("efd")
+
+
+def drop_nan_altitudes(positions: list[Any]) -> list[Any]:
+    """Drop the NaN altitude of positions taken from a coordinate matrix."""
+    return [
+        position[:2] if len(position) == 3 and math.isnan(position[2]) else position
+        for position in positions
+    ]
+
+
+class Coordinates(List):
+    """List field for coordinate arrays.
+
+    Behaves like :class:`marshmallow.fields.List`, but on dump also accepts
+    objects supporting the buffer protocol (``array.array``, ``memoryview``,
+    NumPy arrays, ...) holding floating-point numbers. Such buffers, including
+    multi-dimensional ones, are converted to nested lists in a single call
+    instead of serializing every number through the inner field. NaN
+    altitudes, which :func:`position_matrix` gives positions without one, are
+    dropped.
+    """
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        if value is not None and not isinstance(value, list | tuple):
+            try:
+                view = memoryview(value)
+            except TypeError:
+                pass
+            else:
+                with view:
+                    if view.ndim and view.format.lstrip("@=<>!") in FLOAT_FORMATS:
+                        positions: list[Any] | None
+                        try:
+                            positions = view.tolist()
+                        except NotImplementedError:
+                            # Non-native byte order or layout.
+                            positions = value.tolist() if hasattr(value, "tolist") else None
+                        if positions is not None:
+                            return drop_nan_altitudes(positions) if view.ndim == 2 else positions
+        return super()._serialize(value, attr, obj, **kwargs)
+
+
+class SharedNested(Nested):
+    """Nested field using its schema instance as is.
+
+    :class:`marshmallow.fields.Nested` copies a schema instance for every
+    instance of the parent schema. This field loads and dumps with the given
+    instance itself, so one nested schema is shared by every parent schema
+    instance and every thread. The instance must not be modified once shared.
+    Passing ``only``, ``exclude`` or ``many`` falls back to copying.
+    """
+
+    @property
+    def schema(self):
+        if isinstance(self.nested, ma.Schema) and (
+            self.only is None and not self.exclude and not self.many
+        ):
+            return self.nested
+        return super().schema
+
+
+# Schema classes and instances built by ``with_properties`` factories.
+SHARED_LOCK = threading.RLock()
+SHARED_SCHEMAS: dict[Any, Any] = {}
+
+T = TypeVar("T")
+
+
+def shared_schema(key: Any, build: Callable[[], T]) -> T:
+    """Return the schema class or instance cached under a key, building it once.
+
+    Args:
+        key: Cache key, e.g. ``(schema_class, properties_schema)``.
+        build: Callable creating the value on the first call.
+
+    Returns:
+        The cached value. Concurrent first calls build it only once.
+    """
+    with SHARED_LOCK:
+        if key not in SHARED_SCHEMAS:
+            SHARED_SCHEMAS[key] = build()
+        value: T = SHARED_SCHEMAS[key]
+        return value
+
+
+# Load and dump callables of type-specific schemas, by object type.
+Dispatch = dict[str, tuple[Callable[..., Any], Callable[..., Any]]]
+
+# Dispatch tables by (schema class, options), least recently used first.
+DISPATCH_TABLES: OrderedDict[Any, Dispatch] = OrderedDict()
+MAX_DISPATCH_TABLES = 256
+
+
+def options_key(options: Mapping[str, Any]) -> tuple[Any, ...] | None:
+    """Return a hashable form of schema options, or None if one is unhashable.
+
+    Sequences and sets (``only``, ``partial``, ...) are turned into tuples and
+    frozensets.
+    """
+    items = []
+    for name, value in sorted(options.items()):
+        if isinstance(value, list | tuple):
+            value = tuple(value)
+        elif isinstance(value, set | frozenset):
+            value = frozenset(value)
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        items.append((name, value))
+    return tuple(items)
+
+
+def dispatch_table(
+    schemas: Mapping[str, type[BaseSchema]],
+    options: Callable[[type[BaseSchema]], Mapping[str, Any]],
+    key: Any,
+) -> Dispatch:
+    """Return the bound ``load`` and ``dump`` methods of type-specific schemas.
+
+    Every schema is instantiated once per table, and tables are shared by all
+    dispatching schemas with the same key: loading an object is then a dict
+    lookup and a call. The most recently used tables are kept. Schema
+    instances are not modified by loading or dumping, so the tables may be
+    used from several threads.
+
+    Args:
+        schemas: Schema classes by object type.
+        options: Callable returning the options a schema class is
+            instantiated with.
+        key: Cache key, covering the schema classes and options, e.g.
+            ``(type(self), options_key(...))``. None builds a table that is
+            not cached.
+
+    Returns:
+        A dictionary mapping object types to ``(load, dump)`` pairs.
+    """
+
+    def build() -> Dispatch:
+        table = {}
+        for object_type, schema_class in schemas.items():
+            schema = schema_class(**options(schema_class))
+            table[object_type] = (schema.load, schema.dump)
+        return table
+
+    if key is None:
+        return build()
+    with SHARED_LOCK:
+        table = DISPATCH_TABLES.get(key)
+        if table is None:
+            table = DISPATCH_TABLES[key] = build()
+            if len(DISPATCH_TABLES) > MAX_DISPATCH_TABLES:
+                DISPATCH_TABLES.popitem(last=False)
+        else:
+            DISPATCH_TABLES.move_to_end(key)
+    return table
+
+
 def validate_coordinate_values(coords: Any) -> None:
     """Recursively validate coordinate values (longitude and latitude).
 
@@ -68,6 +237,110 @@ def validate_coordinate_values(coords: Any) -> None:
                 validate_coordinate_values(item)
 
 
+def position_matrix(positions: Any) -> memoryview[float] | None:
+    """Validate a list of positions and pack them into a coordinate matrix.
+
+    The checks run over all coordinates at once instead of position by
+    position: every position must be a list of 2 or 3 finite numbers, with
+    longitude in [-180, 180] and latitude in [-90, 90].
+
+    Args:
+        positions: List of positions.
+
+    Returns:
+        A float64 memoryview of shape ``(n, 2)``, or ``(n, 3)`` if any
+        position has an altitude (positions without one then hold NaN). An
+        empty list gives an empty one-dimensional view. None if any position
+        is invalid; the caller falls back to the schema for the errors.
+    """
+    if type(positions) is not list or not set(map(type, positions)) <= {list}:
+        return None
+    lengths = set(map(len, positions))
+    if not lengths <= {2, 3}:
+        return None
+    if not set(map(type, chain.from_iterable(positions))) <= {float, int}:
+        return None
+    try:
+        values = array("d", chain.from_iterable(positions))
+    except OverflowError:
+        return None
+    if not all(map(math.isfinite, values)):
+        return None
+    if not positions:
+        return memoryview(values)
+    dims = max(lengths)
+    if len(lengths) > 1:
+        values = array(
+            "d",
+            chain.from_iterable(
+                position if len(position) == 3 else [*position, math.nan] for position in positions
+            ),
+        )
+    view = memoryview(values)
+    lon = view[0::dims]
+    lat = view[1::dims]
+    if not (-180 <= min(lon) and max(lon) <= 180 and -90 <= min(lat) and max(lat) <= 90):
+        return None
+    return view.cast("B").cast("d", (len(positions), dims))
+
+
+def load_items(
+    load_item: Callable[[Any], Any],
+    items: Sequence[Any],
+    *,
+    threads: int | None = None,
+) -> tuple[list[Any], dict[int, Any]]:
+    """Load a sequence of items, optionally spread across a thread pool.
+
+    With ``threads`` greater than 1 the items are split into contiguous chunks,
+    one per worker, and the results are reassembled in the original order.
+    This pays off when validation releases the GIL (e.g. on free-threaded
+    CPython builds); otherwise the items are loaded sequentially.
+
+    Args:
+        load_item: Callable that deserializes a single item.
+        items: Items to deserialize.
+        threads: Number of worker threads. None or 1 loads sequentially.
+
+    Returns:
+        A tuple ``(result, errors)`` where ``result`` holds the loaded items
+        (or the valid part of failed items) and ``errors`` maps item index to
+        error messages.
+    """
+
+    def load_chunk(start: int, stop: int) -> tuple[list[Any], dict[int, Any]]:
+        result = []
+        errors = {}
+        for idx in range(start, stop):
+            try:
+                result.append(load_item(items[idx]))
+            except ValidationError as error:
+                if error.valid_data is not None:
+                    result.append(error.valid_data)
+                errors[idx] = error.messages
+        return result, errors
+
+    count = len(items)
+    if not threads or threads <= 1 or count <= 1:
+        return load_chunk(0, count)
+
+    size = -(-count // threads)
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        chunks = list(
+            executor.map(
+                lambda start: load_chunk(start, min(start + size, count)),
+                range(0, count, size),
+            )
+        )
+
+    result: list[Any] = []
+    errors: dict[int, Any] = {}
+    for chunk_result, chunk_errors in chunks:
+        result.extend(chunk_result)
+        errors.update(chunk_errors)
+    return result, errors
+
+
 class BaseSchema(ma.Schema):
     """Base schema for all GeoJSON objects.
 
@@ -113,3 +386,70 @@ class BaseSchema(ma.Schema):
                 return result
 
         return data
+
+    def nested_options(self) -> dict[str, Any]:
+        """Return the options passed on to the type-specific schemas of a dispatching schema."""
+        return {
+            "only": self.only,
+            "exclude": self.exclude,
+            "load_only": self.load_only,
+            "dump_only": self.dump_only,
+            "partial": self.partial,
+            "unknown": self.unknown,
+        }
+
+    async def async_load(
+        self,
+        data: Any,
+        *,
+        executor: Executor | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Deserialize and validate data without blocking the event loop.
+
+        The synchronous :meth:`load` call is offloaded to ``executor`` so that
+        large payloads do not stall other coroutines running on the same loop.
+
+        Args:
+            data: Data to deserialize.
+            executor: Executor used to run validation. If None, the event
+                loop's default executor is used.
+            **kwargs: Additional keyword arguments passed to :meth:`load`
+                (e.g. ``many``, ``partial``, ``unknown``).
+
+        Returns:
+            Deserialized and validated data.
+
+        Raises:
+            ValidationError: If validation fails.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(self.load, data, **kwargs))
+
+    async def async_loads(
+        self,
+        json_data: str | bytes | bytearray,
+        *,
+        executor: Executor | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Deserialize and validate a JSON string without blocking the event loop.
+
+        Both JSON decoding and validation run in ``executor``.
+
+        Args:
+            json_data: JSON string to deserialize.
+            executor: Executor used to run decoding and validation. If None,
+                the event loop's default executor is used.
+            **kwargs: Additional keyword arguments passed to :meth:`loads`.
+
+        Returns:
+            Deserialized and validated data.
+
+        Raises:
+            ValidationError: If validation fails.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, functools.partial(self.loads, json_data, **kwargs)
+        )
@@ -0,0 +1,497 @@
+"""Coordinate clipping helpers shared by antimeridian cutting and tiling.
+
+Lines are clipped segment by segment against an axis-aligned box
+(Liang-Barsky), and rings with the Sutherland-Hodgman algorithm, one pass
+over the ring per box edge. Intersection positions are interpolated in all
+dimensions and snapped exactly onto the clip edge.
+
+Sutherland-Hodgman keeps a ring in one piece: a concave ring leaving and
+re-entering the box comes back as a single ring joined along the box edge.
+"""
+
+from __future__ import annotations
+
+import math
+import typing
+from itertools import pairwise
+
+from .object_type import (
+    GEOMETRY_COLLECTION,
+    LINE_STRING,
+    MULTI_LINE_STRING,
+    MULTI_POINT,
+    MULTI_POLYGON,
+    POINT,
+    POLYGON,
+)
+
+Position = list[float]
+Bounds = tuple[float, float, float, float]
+
+ANTIMERIDIAN = 180.0
+
+
+def iter_positions(geometry: typing.Mapping[str, typing.Any] | None) -> typing.Iterator[typing.Any]:
+    """Yield every position of a geometry."""
+    if geometry is None:
+        return
+    if geometry["type"] == GEOMETRY_COLLECTION:
+        for member in geometry["geometries"]:
+            yield from iter_positions(member)
+        return
+    stack = [geometry["coordinates"]]
+    while stack:
+        value = stack.pop()
+        if value and isinstance(value[0], list | tuple):
+            stack.extend(value)
+        else:
+            yield value
+
+
+def interpolate(a: typing.Sequence[float], b: typing.Sequence[float], t: float) -> Position:
+    """Return the position at fraction ``t`` of the segment from a to b."""
+    return [start + (end - start) * t for start, end in zip(a, b, strict=False)]
+
+
+def snap(position: Position, axis: int, value: float) -> Position:
+    """Set a coordinate of a position exactly to a clip edge."""
+    position[axis] = value
+    return position
+
+
+def dedupe(positions: list[Position]) -> list[Position]:
+    """Drop consecutive repeated positions."""
+    result: list[Position] = []
+    for position in positions:
+        if not result or position != result[-1]:
+            result.append(position)
+    return result
+
+
+def clip_line(positions: typing.Sequence[typing.Sequence[float]], bounds: Bounds) -> list[list]:
+    """Clip a line to a box.
+
+    Args:
+        positions: The line positions.
+        bounds: The box as ``(xmin, ymin, xmax, ymax)``.
+
+    Returns:
+        The parts of the line inside the box, each with at least 2 distinct
+        positions.
+    """
+    xmin, ymin, xmax, ymax = bounds
+    parts: list[list[Position]] = []
+    current: list[Position] = []
+    for a, b in pairwise(positions):
+        ax, ay, bx, by = a[0], a[1], b[0], b[1]
+        dx, dy = bx - ax, by - ay
+        t0, t1 = 0.0, 1.0
+        visible = True
+        for p, q in ((-dx, ax - xmin), (dx, xmax - ax), (-dy, ay - ymin), (dy, ymax - ay)):
+            if p == 0:
+                if q < 0:
+                    visible = False
+                    break
+                continue
+            t = q / p
+            if p < 0:
+                t0 = max(t0, t)
+            else:
+                t1 = min(t1, t)
+            if t0 > t1:
+                visible = False
+                break
+        if not visible:
+            if current:
+                parts.append(current)
+                current = []
+            continue
+
+        start = list(a) if t0 == 0 else clamp(interpolate(a, b, t0), bounds)
+        end = list(b) if t1 == 1 else clamp(interpolate(a, b, t1), bounds)
+        if not current:
+            current = [start]
+        current.append(end)
+        if t1 < 1:
+            parts.append(current)
+            current = []
+    if current:
+        parts.append(current)
+    return [part for part in map(dedupe, parts) if len(part) >= 2]
+
+
+def clamp(position: Position, bounds: Bounds) -> Position:
+    """Snap an interpolated position into a box, undoing rounding errors."""
+    xmin, ymin, xmax, ymax = bounds
+    position[0] = min(max(position[0], xmin), xmax)
+    position[1] = min(max(position[1], ymin), ymax)
+    return position
+
+
+def clip_ring(ring: typing.Sequence[typing.Sequence[float]], bounds: Bounds) -> list[Position]:
+    """Clip a closed ring to a box with the Sutherland-Hodgman algorithm.
+
+    Args:
+        ring: The ring positions, first and last being equal.
+        bounds: The box as ``(xmin, ymin, xmax, ymax)``. Infinite values
+            leave that side open.
+
+    Returns:
+        The clipped ring, closed, or an empty list if fewer than 3 distinct
+        positions remain.
+    """
+    xmin, ymin, xmax, ymax = bounds
+    positions = [list(position) for position in ring[:-1]]
+    for axis, value, keep_above in (
+        (0, xmin, True),
+        (0, xmax, False),
+        (1, ymin, True),
+        (1, ymax, False),
+    ):
+        if math.isinf(value) or not positions:
+            continue
+        clipped: list[Position] = []
+        previous = positions[-1]
+        previous_inside = (previous[axis] >= value) if keep_above else (previous[axis] <= value)
+        for position in positions:
+            inside = (position[axis] >= value) if keep_above else (position[axis] <= value)
+            if inside != previous_inside:
+                t = (value - previous[axis]) / (position[axis] - previous[axis])
+                clipped.append(snap(interpolate(previous, position, t), axis, value))
+            if inside:
+                clipped.append(position)
+            previous, previous_inside = position, inside
+        positions = clipped
+
+    positions = dedupe(positions)
+    while len(positions) > 1 and positions[-1] == positions[0]:
+        positions.pop()
+    if len(positions) < 3:
+        return []
+    return positions + [list(positions[0])]
+
+
+def crosses_antimeridian(positions: typing.Sequence[typing.Sequence[float]]) -> bool:
+    """Return whether consecutive positions are more than 180 degrees of longitude apart."""
+    return any(abs(b[0] - a[0]) > ANTIMERIDIAN for a, b in pairwise(positions))
+
+
+def split_line(positions: typing.Sequence[typing.Sequence[float]]) -> list[list[Position]]:
+    """Cut a line where it crosses the antimeridian.
+
+    A segment between positions more than 180 degrees of longitude apart is
+    taken to cross the antimeridian; it is cut at longitude 180 (or -180),
+    with the latitude (and altitude) interpolated along the segment. A step
+    from longitude 180 to -180 (or back) is an existing cut: the line is
+    split there without interpolating.
+
+    Args:
+        positions: The line positions.
+
+    Returns:
+        The parts of the line, each with at least 2 distinct positions.
+    """
+    parts: list[list[Position]] = []
+    current = [list(positions[0])]
+    for a, b in pairwise(positions):
+        dx = b[0] - a[0]
+        if abs(a[0]) == ANTIMERIDIAN and b[0] == -a[0]:
+            parts.append(current)
+            current = [list(b)]
+            continue
+        if abs(dx) > ANTIMERIDIAN:
+            edge = ANTIMERIDIAN if dx < 0 else -ANTIMERIDIAN
+            unwrapped = [b[0] + (360 if dx < 0 else -360), *b[1:]]
+            t = (edge - a[0]) / (unwrapped[0] - a[0])
+            crossing = interpolate(a, unwrapped, t)
+            current.append(snap(list(crossing), 0, edge))
+            parts.append(current)
+            current = [snap(crossing, 0, -edge)]
+        current.append(list(b))
+    parts.append(current)
+    return [part for part in map(dedupe, parts) if len(part) >= 2]
+
+
+def unwrap(ring: typing.Sequence[typing.Sequence[float]]) -> list[Position] | None:
+    """Make the longitudes of a ring continuous across the antimeridian.
+
+    Returns:
+        The ring with longitudes shifted by multiples of 360 so that no two
+        consecutive positions are more than 180 degrees apart, or None if
+        the ring does not close once unwrapped (it goes around a pole).
+    """
+    offset = 0.0
+    result = [list(ring[0])]
+    for a, b in pairwise(ring):
+        dx = b[0] - a[0]
+        if dx > ANTIMERIDIAN:
+            offset -= 360
+        elif dx < -ANTIMERIDIAN:
+            offset += 360
+        result.append([b[0] + offset, *b[1:]])
+    if result[-1][0] != result[0][0]:
+        return None
+    return result
+
+
+def split_polygon(rings: typing.Sequence[typing.Any]) -> list[list[list[Position]]]:
+    """Cut a Polygon where it crosses the antimeridian.
+
+    The rings are unwrapped to continuous longitudes, clipped to each
+    360-degree window they span, and shifted back into [-180, 180]. Holes
+    go with the pieces of the exterior ring they fall in.
+
+    Args:
+        rings: The Polygon coordinates.
+
+    Returns:
+        The Polygon coordinates of the pieces. A polygon that does not cross
+        the antimeridian, that goes around a pole, or that has no area on
+        either side, is returned as the only piece, unchanged.
+    """
+    if not any(crosses_antimeridian(ring) for ring in rings):
+        return [list(rings)]
+    unwrapped = [unwrap(ring) for ring in rings]
+    shell = unwrapped[0]
+    if shell is None or any(ring is None for ring in unwrapped):
+        return [list(rings)]
+
+    xs = [position[0] for position in shell]
+    west, east = min(xs), max(xs)
+    center = (west + east) / 2
+    holes = []
+    for hole in typing.cast(list[list[Position]], unwrapped[1:]):
+        # Bring each hole next to the exterior ring.
+        shift = 360 * round((center - sum(p[0] for p in hole) / len(hole)) / 360)
+        holes.append([[position[0] + shift, *position[1:]] for position in hole])
+
+    pieces = []
+    first = math.floor((west + ANTIMERIDIAN) / 360)
+    last = math.ceil((east + ANTIMERIDIAN) / 360) - 1
+    for window in range(first, last + 1):
+        shift = 360 * window
+        bounds = (shift - ANTIMERIDIAN, -math.inf, shift + ANTIMERIDIAN, math.inf)
+        piece = clip_ring(shell, bounds)
+        if not piece:
+            continue
+        piece_holes = [ring for ring in (clip_ring(hole, bounds) for hole in holes) if ring]
+        pieces.append(
+            [
+                [[position[0] - shift, *position[1:]] for position in ring]
+                for ring in [piece, *piece_holes]
+            ]
+        )
+    return pieces or [list(rings)]
+
+
+def cut_antimeridian(geometry: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    """Cut a LineString, MultiLineString, Polygon or MultiPolygon at the antimeridian.
+
+    Crossing LineStrings and Polygons become MultiLineStrings and
+    MultiPolygons (RFC 7946 Section 3.1.9). Other members are kept, and the
+    bounding box of a cut geometry is recomputed from its pieces, crossing
+    the antimeridian (west > east) where that is narrower.
+
+    Args:
+        geometry: The geometry, with list coordinates.
+
+    Returns:
+        The cut geometry, or the same geometry if it does not cross the
+        antimeridian.
+    """
+    geometry_type = geometry.get("type")
+    coordinates = geometry.get("coordinates")
+    if not coordinates:
+        return geometry
+
+    result: dict[str, typing.Any]
+    if geometry_type == LINE_STRING:
+        if not crosses_antimeridian(coordinates):
+            return geometry
+        lines = split_line(coordinates)
+        if not lines:
+            return geometry
+        if len(lines) == 1:
+            result = {**geometry, "coordinates": lines[0]}
+        else:
+            result = {**geometry, "type": MULTI_LINE_STRING, "coordinates": lines}
+    elif geometry_type == MULTI_LINE_STRING:
+        if not any(crosses_antimeridian(line) for line in coordinates):
+            return geometry
+        lines = [part for line in coordinates for part in split_line(line) or [line]]
+        result = {**geometry, "coordinates": lines}
+    elif geometry_type == POLYGON:
+        polygons = split_polygon(coordinates)
+        if polygons == [coordinates]:
+            return geometry
+        if len(polygons) == 1:
+            result = {**geometry, "coordinates": polygons[0]}
+        else:
+            result = {**geometry, "type": MULTI_POLYGON, "coordinates": polygons}
+    elif geometry_type == MULTI_POLYGON:
+        polygons = [piece for polygon in coordinates for piece in split_polygon(polygon)]
+        if polygons == coordinates:
+            return geometry
+        result = {**geometry, "coordinates": polygons}
+    else:
+        return geometry
+    result.update(bbox_member(geometry, [result], antimeridian=True))
+    return result
+
+
+def geometry_bounds(geometry: typing.Mapping[str, typing.Any] | None) -> Bounds | None:
+    """Return the 2-D bounds of a geometry, or None if it has no positions."""
+    xs: list[float] = []
+    ys: list[float] = []
+    for position in iter_positions(geometry):
+        xs.append(position[0])
+        ys.append(position[1])
+    if not xs:
+        return None
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def clip_geometry(
+    geometry: typing.Mapping[str, typing.Any], bounds: Bounds
+) -> dict[str, typing.Any] | None:
+    """Clip a geometry to a box.
+
+    Lines and polygons are clipped with :func:`clip_line` and
+    :func:`clip_ring`; points outside the box are dropped. A LineString
+    cut in several parts becomes a MultiLineString. Bounding boxes are
+    recomputed.
+
+    Args:
+        geometry: The geometry.
+        bounds: The box as ``(xmin, ymin, xmax, ymax)``.
+
+    Returns:
+        The clipped geometry, or None if nothing of it lies in the box.
+    """
+    geometry_type = geometry["type"]
+    xmin, ymin, xmax, ymax = bounds
+
+    def inside(position: typing.Sequence[float]) -> bool:
+        return xmin <= position[0] <= xmax and ymin <= position[1] <= ymax
+
+    def clip_polygon(rings: typing.Sequence[typing.Any]) -> list[list[Position]] | None:
+        shell = clip_ring(rings[0], bounds)
+        if not shell:
+            return None
+        return [shell, *(ring for ring in (clip_ring(hole, bounds) for hole in rings[1:]) if ring)]
+
+    result: dict[str, typing.Any]
+    if geometry_type == GEOMETRY_COLLECTION:
+        clipped = (clip_geometry(member, bounds) for member in geometry["geometries"])
+        members = [member for member in clipped if member is not None]
+        if not members:
+            return None
+        return {**geometry, "geometries": members, **bbox_member(geometry, members)}
+
+    coordinates = geometry["coordinates"]
+    if geometry_type == POINT:
+        return dict(geometry) if inside(coordinates) else None
+    if geometry_type == MULTI_POINT:
+        coordinates = [list(position) for position in coordinates if inside(position)]
+        result = {**geometry, "coordinates": coordinates}
+    elif geometry_type == LINE_STRING:
+        lines = clip_line(coordinates, bounds)
+        if len(lines) == 1:
+            result = {**geometry, "coordinates": lines[0]}
+        else:
+            result = {**geometry, "type": MULTI_LINE_STRING, "coordinates": lines}
+    elif geometry_type == MULTI_LINE_STRING:
+        lines = [part for line in coordinates for part in clip_line(line, bounds)]
+        result = {**geometry, "coordinates": lines}
+    elif geometry_type == POLYGON:
+        result = {**geometry, "coordinates": clip_polygon(coordinates)}
+    elif geometry_type == MULTI_POLYGON:
+        polygons = [clip_polygon(polygon) for polygon in coordinates]
+        result = {**geometry, "coordinates": [polygon for polygon in polygons if polygon]}
+    else:
+        raise ValueError(f"Cannot clip {geometry_type!r}.")
+
+    if not result["coordinates"]:
+        return None
+    result.update(bbox_member(geometry, [result]))
+    return result
+
+
+def iter_parts(geometry: typing.Mapping[str, typing.Any]) -> typing.Iterator[typing.Any]:
+    """Yield the parts of a geometry: members of Multi* geometries, or the geometry itself."""
+    if geometry["type"] == MULTI_LINE_STRING:
+        for line in geometry["coordinates"]:
+            yield {"type": LINE_STRING, "coordinates": line}
+    elif geometry["type"] == MULTI_POLYGON:
+        for polygon in geometry["coordinates"]:
+            yield {"type": POLYGON, "coordinates": polygon}
+    else:
+        yield geometry
+
+
+def longitude_range(intervals: list[tuple[float, float]]) -> tuple[float, float]:
+    """Return the narrowest longitude range covering intervals, as ``(west, east)``.
+
+    The range crosses the antimeridian (west > east, RFC 7946 Section 5.2)
+    when that leaves out a wider gap than ``[min west, max east]`` does.
+    """
+    merged: list[list[float]] = []
+    for west, east in sorted(intervals):
+        if merged and west <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], east)
+        else:
+            merged.append([west, east])
+    # Largest gap without a part: across the antimeridian, or between ranges.
+    gap = merged[0][0] + 360 - merged[-1][1]
+    west, east = merged[0][0], merged[-1][1]
+    for before, after in pairwise(merged):
+        if after[0] - before[1] > gap:
+            gap = after[0] - before[1]
+            west, east = after[0], before[1]
+    return west, east
+
+
+def bbox_member(
+    geometry: typing.Mapping[str, typing.Any],
+    clipped: list[dict[str, typing.Any]],
+    *,
+    antimeridian: bool = False,
+) -> dict[str, list[float]]:
+    """Return the recomputed "bbox" member of a clipped geometry, if it had one.
+
+    The bbox has the dimensions of the original one; altitudes are kept
+    when the clipped positions have none.
+
+    Args:
+        geometry: The original geometry.
+        clipped: The geometries it was clipped to.
+        antimeridian: Whether the parts were cut at the antimeridian. The
+            bbox then crosses it where that is narrower.
+
+    Returns:
+        A dictionary with the "bbox" member, or an empty one.
+    """
+    bbox = geometry.get("bbox")
+    if bbox is None:
+        return {}
+    intervals: list[tuple[float, float]] = []
+    ys: list[float] = []
+    zs: list[float] = []
+    for member in clipped:
+        for part in iter_parts(member) if antimeridian else [member]:
+            xs = []
+            for position in iter_positions(part):
+                xs.append(position[0])
+                ys.append(position[1])
+                if len(position) > 2:
+                    zs.append(position[2])
+            if xs:
+                intervals.append((min(xs), max(xs)))
+    if antimeridian:
+        west, east = longitude_range(intervals)
+    else:
+        west, east = min(w for w, _ in intervals), max(e for _, e in intervals)
+    if len(bbox) == 6:
+        bottom, top = (min(zs), max(zs)) if zs else (bbox[2], bbox[5])
+        return {"bbox": [west, min(ys), bottom, east, max(ys), top]}
+    return {"bbox": [west, min(ys), east, max(ys)]}
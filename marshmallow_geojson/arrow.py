@@ -0,0 +1,503 @@
+"""Apache Arrow (GeoArrow) export and import of FeatureCollections.
+
+Validated FeatureCollections are converted to Arrow record batches with one
+"geometry" column in a GeoArrow native encoding (point, linestring, polygon,
+multipoint, multilinestring or multipolygon, with separated ``x``/``y``/``z``
+coordinates), an optional "id" column, and one column per property key.
+
+Property columns are typed from the fields of a :class:`PropertiesSchema`
+subclass when one is given, and inferred from the values otherwise. Values
+that have no Arrow counterpart (objects, arrays, mixed types) are stored as
+JSON text in columns tagged with the ``arrow.json`` extension name.
+
+This module requires ``pyarrow``, which is an optional dependency::
+
+    pip install marshmallow-geojson[arrow]
+
+References:
+    https://geoarrow.org/format.html
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import typing
+from array import array
+
+from marshmallow import fields
+
+from .columnar import ColumnarBuilder
+from .object_type import (
+    FEATURE,
+    FEATURE_COLLECTION,
+    GEOMETRY_COLLECTION,
+    LINE_STRING,
+    MULTI_LINE_STRING,
+    MULTI_POINT,
+    MULTI_POLYGON,
+    POINT,
+    POLYGON,
+)
+from .property import PropertiesSchema
+
+if typing.TYPE_CHECKING:
+    import pyarrow as pa
+
+BATCH_SIZE = 65536
+
+GEOMETRY_COLUMN = "geometry"
+ID_COLUMN = "id"
+
+EXTENSION_NAME = b"ARROW:extension:name"
+EXTENSION_METADATA = b"ARROW:extension:metadata"
+JSON_EXTENSION = b"arrow.json"
+
+# GeoArrow native encoding of each geometry type, and the encoding covering
+# a single geometry type together with its multi-part counterpart.
+ENCODINGS = {
+    POINT: "point",
+    LINE_STRING: "linestring",
+    POLYGON: "polygon",
+    MULTI_POINT: "multipoint",
+    MULTI_LINE_STRING: "multilinestring",
+    MULTI_POLYGON: "multipolygon",
+}
+MULTI_ENCODINGS = {
+    frozenset({POINT, MULTI_POINT}): "multipoint",
+    frozenset({LINE_STRING, MULTI_LINE_STRING}): "multilinestring",
+    frozenset({POLYGON, MULTI_POLYGON}): "multipolygon",
+}
+
+# Nesting depth of the coordinates of each encoding.
+DEPTHS = {
+    "point": 0,
+    "linestring": 1,
+    "multipoint": 1,
+    "polygon": 2,
+    "multilinestring": 2,
+    "multipolygon": 3,
+}
+
+# Geometry type of the features read back from each encoding.
+ENCODING_TYPES = {encoding: geometry_type for geometry_type, encoding in ENCODINGS.items()}
+
+
+def import_pyarrow() -> typing.Any:
+    """Import pyarrow, explaining how to install it when it is missing.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError as error:  # pragma: no cover
+        raise ImportError(
+            "Arrow support requires pyarrow. Install it with "
+            "'pip install marshmallow-geojson[arrow]'."
+        ) from error
+    return pyarrow
+
+
+def choose_encoding(geometry_types: set[str | None]) -> str:
+    """Choose the GeoArrow native encoding for a set of geometry types.
+
+    Args:
+        geometry_types: Geometry types present in the collection. None
+            stands for null geometries.
+
+    Returns:
+        The encoding name.
+
+    Raises:
+        ValueError: If the geometry types cannot share a native encoding.
+    """
+    types = frozenset(geometry_types) - {None}
+    if not types:
+        return "point"
+    if len(types) == 1 and GEOMETRY_COLLECTION not in types:
+        return ENCODINGS[typing.cast(str, next(iter(types)))]
+    for multi_types, encoding in MULTI_ENCODINGS.items():
+        if types <= multi_types:
+            return encoding
+    raise ValueError(
+        f"Geometry types {sorted(typing.cast(frozenset[str], types))} cannot be "
+        "stored in a single GeoArrow native encoding."
+    )
+
+
+def property_type(field: fields.Field) -> tuple[pa.DataType, typing.Callable | None]:
+    """Map a marshmallow field to an Arrow type.
+
+    Args:
+        field: Field of a properties schema.
+
+    Returns:
+        A tuple ``(arrow_type, converter)``. ``converter`` is applied to
+        non-null values before they are stored, or None.
+    """
+    pa = import_pyarrow()
+    if isinstance(field, fields.Boolean):
+        return pa.bool_(), None
+    if isinstance(field, fields.Integer):
+        return pa.int64(), None
+    if isinstance(field, fields.Float | fields.Decimal):
+        return pa.float64(), float
+    if isinstance(field, fields.DateTime):
+        return pa.timestamp("us"), None
+    if isinstance(field, fields.Date):
+        return pa.date32(), None
+    if isinstance(field, fields.String | fields.UUID):
+        return pa.string(), str
+    return pa.string(), json.dumps
+
+
+def infer_type(value_types: set[type]) -> tuple[pa.DataType, typing.Callable | None]:
+    """Infer the Arrow type of a column from the Python types of its values.
+
+    Args:
+        value_types: Types of the non-null values.
+
+    Returns:
+        A tuple ``(arrow_type, converter)`` like :func:`property_type`.
+    """
+    pa = import_pyarrow()
+    if not value_types:
+        return pa.null(), None
+    if value_types == {bool}:
+        return pa.bool_(), None
+    if value_types == {int}:
+        return pa.int64(), None
+    if value_types <= {int, float}:
+        return pa.float64(), float
+    if value_types == {str}:
+        return pa.string(), None
+    return pa.string(), json.dumps
+
+
+class ArrowLayout:
+    """Arrow schema of a FeatureCollection and how to fill it.
+
+    Args:
+        features: The validated features.
+        properties_schema: Optional properties schema (class or instance)
+            whose fields type the property columns.
+    """
+
+    def __init__(
+        self,
+        features: list[typing.Any],
+        properties_schema: type[PropertiesSchema] | PropertiesSchema | None = None,
+    ):
+        pa = import_pyarrow()
+        declared: dict[str, fields.Field] = {}
+        if properties_schema is not None:
+            schema = (
+                properties_schema() if isinstance(properties_schema, type) else properties_schema
+            )
+            declared = {
+                field.data_key or name: field
+                for name, field in schema.fields.items()
+                if not field.load_only
+            }
+
+        geometry_types: set[str | None] = set()
+        id_types: set[type] = set()
+        value_types: dict[str, set[type]] = {key: set() for key in declared}
+        self.has_z = False
+        for feature in features:
+            geometry = feature.get("geometry")
+            geometry_types.add(geometry["type"] if geometry is not None else None)
+            if geometry is not None and not self.has_z:
+                self.has_z = len(first_position(geometry)) > 2
+            if feature.get("id") is not None:
+                id_types.add(type(feature["id"]))
+            for key, value in (feature.get("properties") or {}).items():
+                types = value_types.setdefault(key, set())
+                if value is not None and key not in declared:
+                    types.add(type(value))
+
+        self.encoding = choose_encoding(geometry_types)
+        self.has_ids = bool(id_types)
+        self.id_type, self.id_converter = infer_type(id_types)
+        if len(id_types) > 1:
+            self.id_type, self.id_converter = pa.string(), str
+
+        self.properties: dict[str, tuple[typing.Any, typing.Callable | None]] = {}
+        for key, types in value_types.items():
+            if key in (GEOMETRY_COLUMN, ID_COLUMN):
+                raise ValueError(f"Property {key!r} clashes with the {key!r} column.")
+            if key in declared:
+                self.properties[key] = property_type(declared[key])
+            else:
+                self.properties[key] = infer_type(types)
+
+        schema_fields = []
+        if self.has_ids:
+            schema_fields.append(pa.field(ID_COLUMN, self.id_type))
+        schema_fields.append(
+            pa.field(
+                GEOMETRY_COLUMN,
+                self.geometry_type(),
+                metadata={
+                    EXTENSION_NAME: f"geoarrow.{self.encoding}".encode(),
+                    EXTENSION_METADATA: b"{}",
+                },
+            )
+        )
+        for key, (arrow_type, converter) in self.properties.items():
+            metadata = {EXTENSION_NAME: JSON_EXTENSION} if converter is json.dumps else None
+            schema_fields.append(pa.field(key, arrow_type, metadata=metadata))
+        self.schema = pa.schema(schema_fields)
+
+    def coordinate_type(self) -> pa.DataType:
+        """Return the Arrow type of a position (separated coordinates)."""
+        pa = import_pyarrow()
+        names = "xyz" if self.has_z else "xy"
+        return pa.struct([pa.field(name, pa.float64(), nullable=False) for name in names])
+
+    def geometry_type(self) -> pa.DataType:
+        """Return the Arrow type of the geometry column."""
+        pa = import_pyarrow()
+        arrow_type = self.coordinate_type()
+        names = {
+            "linestring": ["vertices"],
+            "multipoint": ["points"],
+            "polygon": ["vertices", "rings"],
+            "multilinestring": ["vertices", "linestrings"],
+            "multipolygon": ["vertices", "rings", "polygons"],
+        }.get(self.encoding, [])
+        for name in names:
+            arrow_type = pa.list_(pa.field(name, arrow_type, nullable=False))
+        return arrow_type
+
+    def record_batch(self, features: list[typing.Any]) -> pa.RecordBatch:
+        """Convert a batch of features to a record batch.
+
+        Args:
+            features: The validated features of the batch.
+
+        Returns:
+            The record batch.
+        """
+        pa = import_pyarrow()
+        builder = ColumnarBuilder()
+        for feature in features:
+            builder.append(feature)
+        if builder.has_z and not self.has_z:
+            # Dimensions are detected from the first position of each geometry.
+            raise ValueError("Geometries mixing 2-D and 3-D positions are not supported.")
+
+        columns = []
+        if self.has_ids:
+            columns.append(convert_column(builder.ids, self.id_type, self.id_converter))
+        columns.append(self.geometry_array(builder))
+        for key, (arrow_type, converter) in self.properties.items():
+            values = builder.properties.get(key) or [None] * builder.length
+            columns.append(convert_column(values, arrow_type, converter))
+        return pa.RecordBatch.from_arrays(columns, schema=self.schema)
+
+    def geometry_array(self, builder: ColumnarBuilder) -> pa.Array:
+        """Build the geometry column from the columns of a batch."""
+        pa = import_pyarrow()
+        names = "xyz" if self.has_z else "xy"
+        buffers = {"x": builder.x, "y": builder.y, "z": builder.z}
+        coordinates = pa.StructArray.from_arrays(
+            [float_array(buffers[name]) for name in names],
+            fields=list(self.coordinate_type()),
+        )
+
+        geometry_offsets = list(builder.geometry_offsets)
+        part_offsets = list(builder.part_offsets)
+        ring_offsets = list(builder.ring_offsets)
+        nulls = [geometry_type is None for geometry_type in builder.geometry_types]
+        mask = pa.array(nulls)
+        geometry_type = self.geometry_type()
+
+        def nest(offsets: list[int], values: typing.Any, arrow_type: typing.Any, **kwargs):
+            return pa.ListArray.from_arrays(
+                pa.array(offsets, pa.int32()), values, type=arrow_type, **kwargs
+            )
+
+        if self.encoding == "point":
+            indices = [None if null else geometry_offsets[idx] for idx, null in enumerate(nulls)]
+            return coordinates.take(pa.array(indices, pa.int64()))
+        if self.encoding == "multipoint":
+            return nest(geometry_offsets, coordinates, geometry_type, mask=mask)
+        if self.encoding == "linestring":
+            offsets = [ring_offsets[idx] for idx in geometry_offsets]
+            return nest(offsets, coordinates, geometry_type, mask=mask)
+        if self.encoding == "multilinestring":
+            lines = nest(ring_offsets, coordinates, geometry_type.value_type)
+            return nest(geometry_offsets, lines, geometry_type, mask=mask)
+        if self.encoding == "polygon":
+            rings = nest(ring_offsets, coordinates, geometry_type.value_type)
+            offsets = [part_offsets[idx] for idx in geometry_offsets]
+            return nest(offsets, rings, geometry_type, mask=mask)
+        rings = nest(ring_offsets, coordinates, geometry_type.value_type.value_type)
+        polygons = nest(part_offsets, rings, geometry_type.value_type)
+        return nest(geometry_offsets, polygons, geometry_type, mask=mask)
+
+
+def first_position(geometry: typing.Mapping[str, typing.Any]) -> typing.Any:
+    """Return the first position of a geometry, or an empty list if it has none."""
+    if geometry["type"] == GEOMETRY_COLLECTION:
+        return []
+    coordinates = geometry["coordinates"]
+    while coordinates and isinstance(coordinates[0], list | tuple):
+        coordinates = coordinates[0]
+    return coordinates
+
+
+def float_array(values: array) -> pa.Array:
+    """Wrap an ``array('d')`` in an Arrow array without copying it."""
+    pa = import_pyarrow()
+    return pa.Array.from_buffers(pa.float64(), len(values), [None, pa.py_buffer(values)])
+
+
+def convert_column(
+    values: list[typing.Any], arrow_type: pa.DataType, converter: typing.Callable | None
+) -> pa.Array:
+    """Build an Arrow array from a column of property values."""
+    pa = import_pyarrow()
+    if converter is not None:
+        values = [None if value is None else converter(value) for value in values]
+    return pa.array(values, type=arrow_type)
+
+
+def to_arrow_batches(
+    validated: typing.Mapping[str, typing.Any],
+    *,
+    properties_schema: type[PropertiesSchema] | PropertiesSchema | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> typing.Iterator[pa.RecordBatch]:
+    """Convert a validated FeatureCollection to Arrow record batches.
+
+    The Arrow schema is worked out in one pass over the features before the
+    first batch is built, so every batch shares the same schema. Only one
+    batch is converted at a time.
+
+    Args:
+        validated: A FeatureCollection returned by
+            :meth:`FeatureCollectionSchema.load`.
+        properties_schema: Optional :class:`PropertiesSchema` subclass (or
+            instance) whose fields type the property columns. Other property
+            columns are inferred from their values.
+        batch_size: Maximum number of features per record batch.
+
+    Yields:
+        Record batches of at most ``batch_size`` rows.
+
+    Raises:
+        ValueError: If the geometry types cannot share a GeoArrow native
+            encoding (e.g. Points mixed with Polygons, or GeometryCollections),
+            or a property is named "geometry" or "id".
+    """
+    features = validated["features"]
+    layout = ArrowLayout(features, properties_schema)
+    for start in range(0, len(features), batch_size):
+        yield layout.record_batch(features[start : start + batch_size])
+
+
+def to_arrow(
+    validated: typing.Mapping[str, typing.Any],
+    *,
+    properties_schema: type[PropertiesSchema] | PropertiesSchema | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> pa.Table:
+    """Convert a validated FeatureCollection to an Arrow table.
+
+    Args:
+        validated: A FeatureCollection returned by
+            :meth:`FeatureCollectionSchema.load`.
+        properties_schema: Optional :class:`PropertiesSchema` subclass (or
+            instance) whose fields type the property columns.
+        batch_size: Maximum number of features per record batch (chunk) of
+            the table.
+
+    Returns:
+        The Arrow table (see :func:`to_arrow_batches`).
+
+    Raises:
+        ValueError: See :func:`to_arrow_batches`.
+    """
+    pa = import_pyarrow()
+    features = validated["features"]
+    layout = ArrowLayout(features, properties_schema)
+    batches = [
+        layout.record_batch(features[start : start + batch_size])
+        for start in range(0, len(features), batch_size)
+    ]
+    return pa.Table.from_batches(batches, schema=layout.schema)
+
+
+def from_arrow(data: typing.Any) -> dict[str, typing.Any]:
+    """Convert Arrow data written by :func:`to_arrow` back to a FeatureCollection.
+
+    Args:
+        data: An Arrow table, a record batch, or an iterable of record
+            batches (e.g. a ``RecordBatchReader``). The "geometry" column must
+            use a GeoArrow native encoding.
+
+    Returns:
+        A FeatureCollection dictionary, ready to be validated with
+        :meth:`FeatureCollectionSchema.load`.
+
+    Raises:
+        ValueError: If there is no "geometry" column with a GeoArrow native
+            encoding.
+    """
+    pa = import_pyarrow()
+    if isinstance(data, pa.Table):
+        batches: typing.Iterable[typing.Any] = data.to_batches()
+    elif isinstance(data, pa.RecordBatch):
+        batches = [data]
+    else:
+        batches = data
+
+    features: list[dict[str, typing.Any]] = []
+    for batch in batches:
+        schema = batch.schema
+        if GEOMETRY_COLUMN not in schema.names:
+            raise ValueError(f"Arrow data has no {GEOMETRY_COLUMN!r} column.")
+        metadata = schema.field(GEOMETRY_COLUMN).metadata or {}
+        encoding = metadata.get(EXTENSION_NAME, b"").decode().removeprefix("geoarrow.")
+        if encoding not in DEPTHS:
+            raise ValueError(f"Unsupported geometry encoding {encoding!r}.")
+
+        geometries = batch.column(GEOMETRY_COLUMN).to_pylist()
+        ids = batch.column(ID_COLUMN).to_pylist() if ID_COLUMN in schema.names else None
+        properties = {}
+        for field in schema:
+            if field.name in (GEOMETRY_COLUMN, ID_COLUMN):
+                continue
+            values = batch.column(field.name).to_pylist()
+            if (field.metadata or {}).get(EXTENSION_NAME) == JSON_EXTENSION:
+                values = [None if value is None else json.loads(value) for value in values]
+            properties[field.name] = values
+
+        for idx, coordinates in enumerate(geometries):
+            geometry = None
+            if coordinates is not None:
+                geometry = {
+                    "type": ENCODING_TYPES[encoding],
+                    "coordinates": decode_coordinates(coordinates, DEPTHS[encoding]),
+                }
+            feature: dict[str, typing.Any] = {"type": FEATURE}
+            if ids is not None and ids[idx] is not None:
+                feature["id"] = ids[idx]
+            feature["geometry"] = geometry
+            feature["properties"] = {key: values[idx] for key, values in properties.items()}
+            features.append(feature)
+
+    return {"type": FEATURE_COLLECTION, "features": features}
+
+
+def decode_coordinates(value: typing.Any, depth: int) -> typing.Any:
+    """Convert nested GeoArrow coordinates to GeoJSON coordinates."""
+    if depth:
+        return [decode_coordinates(item, depth - 1) for item in value]
+    z = value.get("z")
+    if z is None or math.isnan(z):
+        return [value["x"], value["y"]]
+    return [value["x"], value["y"], z]
@@ -0,0 +1,514 @@
+"""Compact binary encoding of GeoJSON objects, in the style of Geobuf.
+
+The encoding is designed to be much smaller than JSON:
+
+- Coordinates are quantized to integers (``round(value * 10 ** precision)``)
+  and each coordinate sequence is delta-encoded, so neighbouring positions
+  take one or two bytes per number. Coordinates that need more than
+  ``MAX_PRECISION`` digits are written as doubles instead (``FLAG_DOUBLES``).
+- Integers are written as variable-length integers (varints), signed ones
+  zigzag-encoded.
+- Object keys (property names and other members) are written once in a key
+  dictionary and referenced by index.
+
+Layout::
+
+    payload  = MAGIC flags:varint precision:varint keys body
+    keys     = count:varint (length:varint utf8)*
+    body     = object | count:varint object*          (depending on flags)
+    object   = kind:varint members...
+
+Geometry objects are followed by their number of dimensions and their
+coordinates; Features by whether they have an id, their id (if any),
+geometry and properties;
+FeatureCollections by their features. Every object ends with its remaining
+members (e.g. "bbox" or foreign members) encoded as a generic value.
+
+References:
+    https://github.com/mapbox/geobuf
+"""
+
+from __future__ import annotations
+
+import struct
+import typing
+
+from marshmallow import ValidationError
+
+from .object_type import (
+    FEATURE,
+    FEATURE_COLLECTION,
+    GEOMETRY_COLLECTION,
+    LINE_STRING,
+    MULTI_LINE_STRING,
+    MULTI_POINT,
+    MULTI_POLYGON,
+    POINT,
+    POLYGON,
+)
+
+MAGIC = b"GJB\x01"
+FLAG_MANY = 1
+FLAG_DOUBLES = 2
+MAX_PRECISION = 7
+
+KINDS = {
+    POINT: 1,
+    MULTI_POINT: 2,
+    LINE_STRING: 3,
+    MULTI_LINE_STRING: 4,
+    POLYGON: 5,
+    MULTI_POLYGON: 6,
+    GEOMETRY_COLLECTION: 7,
+    FEATURE: 8,
+    FEATURE_COLLECTION: 9,
+}
+KIND_TYPES = {kind: object_type for object_type, kind in KINDS.items()}
+
+# Nesting depth of the coordinates of each geometry type.
+DEPTHS = {
+    POINT: 0,
+    MULTI_POINT: 1,
+    LINE_STRING: 1,
+    MULTI_LINE_STRING: 2,
+    POLYGON: 2,
+    MULTI_POLYGON: 3,
+}
+
+# Members encoded as part of each kind of object.
+STRUCTURAL_MEMBERS = {
+    "geometry": ("type", "coordinates"),
+    GEOMETRY_COLLECTION: ("type", "geometries"),
+    FEATURE: ("type", "id", "geometry", "properties"),
+    FEATURE_COLLECTION: ("type", "features"),
+}
+
+# Value tags.
+NULL, FALSE, TRUE, UINT, NINT, DOUBLE, STRING, ARRAY, OBJECT = range(9)
+
+DOUBLE_FORMAT = struct.Struct("<d")
+
+
+def binary_error(message: str) -> ValidationError:
+    """Build the error raised for malformed binary payloads."""
+    return ValidationError({"_schema": [f"Invalid binary GeoJSON: {message}"]})
+
+
+def detect_precision(obj: typing.Any, limit: int = MAX_PRECISION) -> int | None:
+    """Find the number of decimal digits needed to represent all coordinates.
+
+    Args:
+        obj: GeoJSON object, or list of objects.
+        limit: Maximum number of digits.
+
+    Returns:
+        The smallest precision with which every coordinate survives
+        quantization unchanged, or None if that takes more than ``limit``
+        digits.
+    """
+    factors = [10**digits for digits in range(limit + 1)]
+    precision = 0
+    for value in iter_coordinate_values(obj):
+        while round(value * factors[precision]) / factors[precision] != value:
+            if precision == limit:
+                return None
+            precision += 1
+    return precision
+
+
+def iter_coordinate_values(obj: typing.Any) -> typing.Iterator[float]:
+    """Iterate over all coordinate values of GeoJSON objects."""
+    if isinstance(obj, list):
+        for item in obj:
+            yield from iter_coordinate_values(item)
+    elif isinstance(obj, dict):
+        if "coordinates" in obj:
+            yield from flatten(obj["coordinates"])
+        for member in ("geometries", "features"):
+            if isinstance(obj.get(member), list):
+                yield from iter_coordinate_values(obj[member])
+        if isinstance(obj.get("geometry"), dict):
+            yield from iter_coordinate_values(obj["geometry"])
+
+
+def flatten(coordinates: typing.Any) -> typing.Iterator[float]:
+    """Iterate over the numbers of nested coordinates."""
+    for item in coordinates:
+        if isinstance(item, list | tuple):
+            yield from flatten(item)
+        else:
+            yield item
+
+
+class BinaryEncoder:
+    """Encodes GeoJSON objects.
+
+    Args:
+        precision: Number of decimal digits kept for coordinates, or None to
+            write them as doubles.
+    """
+
+    def __init__(self, precision: int | None):
+        self.precision = precision
+        self.factor = None if precision is None else 10**precision
+        self.out = bytearray()
+        self.keys: dict[str, int] = {}
+
+    def varint(self, value: int) -> None:
+        """Write an unsigned varint."""
+        out = self.out
+        while value > 0x7F:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+    def svarint(self, value: int) -> None:
+        """Write a zigzag-encoded signed varint."""
+        self.varint(value * 2 if value >= 0 else -value * 2 - 1)
+
+    def string(self, value: str) -> None:
+        data = value.encode()
+        self.varint(len(data))
+        self.out += data
+
+    def key(self, key: str) -> None:
+        """Write a reference to a key in the key dictionary."""
+        index = self.keys.get(key)
+        if index is None:
+            index = self.keys[key] = len(self.keys)
+        self.varint(index)
+
+    def value(self, value: typing.Any) -> None:
+        """Write a generic JSON value."""
+        if value is None:
+            self.out.append(NULL)
+        elif value is True or value is False:
+            self.out.append(TRUE if value else FALSE)
+        elif isinstance(value, int):
+            if value >= 0:
+                self.out.append(UINT)
+                self.varint(value)
+            else:
+                self.out.append(NINT)
+                self.varint(-value - 1)
+        elif isinstance(value, float):
+            self.out.append(DOUBLE)
+            self.out += DOUBLE_FORMAT.pack(value)
+        elif isinstance(value, str):
+            self.out.append(STRING)
+            self.string(value)
+        elif isinstance(value, list | tuple):
+            self.out.append(ARRAY)
+            self.varint(len(value))
+            for item in value:
+                self.value(item)
+        elif isinstance(value, dict):
+            self.out.append(OBJECT)
+            self.members(value, ())
+        else:
+            raise ValueError(f"Cannot encode value of type {type(value).__name__}.")
+
+    def members(self, obj: typing.Mapping[str, typing.Any], skip: tuple[str, ...]) -> None:
+        """Write the members of an object, except those in ``skip``."""
+        items = [(key, value) for key, value in obj.items() if key not in skip]
+        self.varint(len(items))
+        for key, value in items:
+            self.key(key)
+            self.value(value)
+
+    def object(self, obj: typing.Mapping[str, typing.Any]) -> None:
+        """Write a GeoJSON object."""
+        object_type = obj["type"]
+        kind = KINDS.get(object_type)
+        if kind is None:
+            raise ValueError(f"Cannot encode object of type {object_type!r}.")
+        self.varint(kind)
+
+        if object_type == FEATURE_COLLECTION:
+            self.varint(len(obj["features"]))
+            for feature in obj["features"]:
+                self.object(feature)
+        elif object_type == FEATURE:
+            self.varint(1 if "id" in obj else 0)
+            if "id" in obj:
+                self.value(obj["id"])
+            if obj.get("geometry") is None:
+                self.varint(0)
+            else:
+                self.object(obj["geometry"])
+            self.value(obj.get("properties"))
+        elif object_type == GEOMETRY_COLLECTION:
+            self.varint(len(obj["geometries"]))
+            for geometry in obj["geometries"]:
+                self.object(geometry)
+        else:
+            self.coordinates(obj["coordinates"], DEPTHS[object_type])
+        self.members(obj, STRUCTURAL_MEMBERS.get(object_type, STRUCTURAL_MEMBERS["geometry"]))
+
+    def coordinates(self, coordinates: typing.Any, depth: int) -> None:
+        """Write the coordinates of a geometry."""
+        position = coordinates
+        for _ in range(depth):
+            position = position[0] if position else ()
+        dimensions = len(position) or 2
+        self.varint(dimensions)
+        if depth == 0:
+            self.sequence([coordinates], dimensions)
+        else:
+            self.nested(coordinates, depth, dimensions)
+
+    def nested(self, coordinates: typing.Any, depth: int, dimensions: int) -> None:
+        if depth == 1:
+            self.varint(len(coordinates))
+            self.sequence(coordinates, dimensions)
+            return
+        self.varint(len(coordinates))
+        for item in coordinates:
+            self.nested(item, depth - 1, dimensions)
+
+    def sequence(self, positions: typing.Sequence[typing.Any], dimensions: int) -> None:
+        """Write a delta-encoded sequence of quantized positions, or doubles."""
+        if any(len(position) != dimensions for position in positions):
+            raise ValueError("Cannot encode geometries mixing 2-D and 3-D positions.")
+        factor = self.factor
+        if factor is None:
+            values = [value for position in positions for value in position]
+            self.out += struct.pack(f"<{len(values)}d", *values)
+            return
+        previous = [0] * dimensions
+        for position in positions:
+            for axis, value in enumerate(position):
+                quantized = round(value * factor)
+                self.svarint(quantized - previous[axis])
+                previous[axis] = quantized
+
+
+class BinaryDecoder:
+    """Decodes GeoJSON objects.
+
+    Args:
+        data: The payload, without the header.
+        offset: Offset of the body.
+        precision: Number of decimal digits of the coordinates, or None if
+            they are doubles.
+        keys: Key dictionary.
+    """
+
+    def __init__(self, data: bytes, offset: int, precision: int | None, keys: list[str]):
+        self.data = data
+        self.offset = offset
+        self.factor = None if precision is None else 10**precision
+        self.keys = keys
+
+    def varint(self) -> int:
+        data = self.data
+        offset = self.offset
+        result = 0
+        shift = 0
+        while True:
+            try:
+                byte = data[offset]
+            except IndexError:
+                raise binary_error("unexpected end of data.") from None
+            offset += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                self.offset = offset
+                return result
+            shift += 7
+
+    def svarint(self) -> int:
+        value = self.varint()
+        return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+    def count(self) -> int:
+        """Read an element count, checking it against the remaining data."""
+        count = self.varint()
+        if count > len(self.data) - self.offset:
+            raise binary_error("unexpected end of data.")
+        return count
+
+    def string(self) -> str:
+        size = self.count()
+        start = self.offset
+        self.offset += size
+        try:
+            return self.data[start : self.offset].decode()
+        except UnicodeDecodeError:
+            raise binary_error("invalid string.") from None
+
+    def key(self) -> str:
+        index = self.varint()
+        if index >= len(self.keys):
+            raise binary_error(f"unknown key index {index}.")
+        return self.keys[index]
+
+    def value(self) -> typing.Any:
+        """Read a generic JSON value."""
+        if self.offset >= len(self.data):
+            raise binary_error("unexpected end of data.")
+        tag = self.data[self.offset]
+        self.offset += 1
+        if tag == NULL:
+            return None
+        if tag in (FALSE, TRUE):
+            return tag == TRUE
+        if tag == UINT:
+            return self.varint()
+        if tag == NINT:
+            return -self.varint() - 1
+        if tag == DOUBLE:
+            if self.offset + 8 > len(self.data):
+                raise binary_error("unexpected end of data.")
+            (number,) = DOUBLE_FORMAT.unpack_from(self.data, self.offset)
+            self.offset += 8
+            return number
+        if tag == STRING:
+            return self.string()
+        if tag == ARRAY:
+            return [self.value() for _ in range(self.count())]
+        if tag == OBJECT:
+            return self.members({})
+        raise binary_error(f"unknown value tag {tag}.")
+
+    def members(self, obj: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        for _ in range(self.count()):
+            key = self.key()
+            obj[key] = self.value()
+        return obj
+
+    def object(self) -> dict[str, typing.Any] | None:
+        """Read a GeoJSON object (None for a null Feature geometry)."""
+        kind = self.varint()
+        if kind == 0:
+            return None
+        object_type = KIND_TYPES.get(kind)
+        if object_type is None:
+            raise binary_error(f"unknown object kind {kind}.")
+
+        obj: dict[str, typing.Any] = {"type": object_type}
+        if object_type == FEATURE_COLLECTION:
+            obj["features"] = [self.object() for _ in range(self.count())]
+        elif object_type == FEATURE:
+            if self.varint():
+                obj["id"] = self.value()
+            obj["geometry"] = self.object()
+            obj["properties"] = self.value()
+        elif object_type == GEOMETRY_COLLECTION:
+            obj["geometries"] = [self.object() for _ in range(self.count())]
+        else:
+            dimensions = self.varint()
+            depth = DEPTHS[object_type]
+            if depth == 0:
+                obj["coordinates"] = self.sequence(1, dimensions)[0]
+            else:
+                obj["coordinates"] = self.nested(depth, dimensions)
+        return self.members(obj)
+
+    def nested(self, depth: int, dimensions: int) -> list[typing.Any]:
+        count = self.count()
+        if depth == 1:
+            return self.sequence(count, dimensions)
+        return [self.nested(depth - 1, dimensions) for _ in range(count)]
+
+    def sequence(self, count: int, dimensions: int) -> list[list[float]]:
+        """Read a delta-encoded sequence of quantized positions, or doubles."""
+        factor = self.factor
+        if factor is None:
+            size = count * dimensions * DOUBLE_FORMAT.size
+            if self.offset + size > len(self.data):
+                raise binary_error("unexpected end of data.")
+            values = struct.unpack_from(f"<{count * dimensions}d", self.data, self.offset)
+            self.offset += size
+            return [
+                list(values[idx : idx + dimensions]) for idx in range(0, len(values), dimensions)
+            ]
+        previous = [0] * dimensions
+        positions = []
+        for _ in range(count):
+            position = []
+            for axis in range(dimensions):
+                previous[axis] += self.svarint()
+                position.append(previous[axis] / factor)
+            positions.append(position)
+        return positions
+
+
+def encode_binary(obj: typing.Any, *, precision: int | None = None) -> bytes:
+    """Encode GeoJSON object(s) in the compact binary format.
+
+    Args:
+        obj: A GeoJSON object, or a list of GeoJSON objects.
+        precision: Number of decimal digits kept for coordinates; other
+            digits are rounded away. If None, the smallest precision
+            representing every coordinate exactly is used, up to
+            ``MAX_PRECISION`` digits (about 1 cm). Coordinates needing more
+            digits are then written as doubles, so nothing is lost.
+
+    Returns:
+        The encoded payload.
+
+    Raises:
+        ValueError: If the object cannot be encoded: it is not a GeoJSON
+            object, a member value is not JSON, or a geometry mixes 2-D and
+            3-D positions (every position of a geometry is written with the
+            same number of dimensions).
+    """
+    if precision is None:
+        precision = detect_precision(obj)
+    many = isinstance(obj, list)
+    flags = (FLAG_MANY if many else 0) | (FLAG_DOUBLES if precision is None else 0)
+
+    encoder = BinaryEncoder(precision)
+    if many:
+        encoder.varint(len(obj))
+        for item in obj:
+            encoder.object(item)
+    else:
+        encoder.object(obj)
+    body = encoder.out
+
+    header = BinaryEncoder(precision)
+    header.out += MAGIC
+    header.varint(flags)
+    header.varint(precision or 0)
+    header.varint(len(encoder.keys))
+    for key in encoder.keys:
+        header.string(key)
+    return bytes(header.out + body)
+
+
+def decode_binary(data: bytes | bytearray | memoryview) -> typing.Any:
+    """Decode a payload produced by :func:`encode_binary`.
+
+    The result is not validated.
+
+    Args:
+        data: The encoded payload.
+
+    Returns:
+        The GeoJSON object, or list of objects.
+
+    Raises:
+        ValidationError: If the payload is malformed.
+    """
+    data = bytes(data)
+    if not data.startswith(MAGIC):
+        raise binary_error("missing header.")
+    header = BinaryDecoder(data, len(MAGIC), 0, [])
+    flags = header.varint()
+    precision = header.varint()
+    if precision > 2 * MAX_PRECISION:
+        raise binary_error(f"unsupported precision {precision}.")
+    keys = [header.string() for _ in range(header.count())]
+
+    decoder = BinaryDecoder(data, header.offset, None if flags & FLAG_DOUBLES else precision, keys)
+    if flags & FLAG_MANY:
+        result: typing.Any = [decoder.object() for _ in range(decoder.count())]
+    else:
+        result = decoder.object()
+    if decoder.offset != len(data):
+        raise binary_error("unexpected data after the payload.")
+    if result is None or (isinstance(result, list) and None in result):
+        raise binary_error("null object.")
+    return result
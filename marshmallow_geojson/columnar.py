@@ -0,0 +1,254 @@
+"""Columnar (struct-of-arrays) representation of FeatureCollections.
+
+In the columnar layout the "features" array of a FeatureCollection is
+replaced by a "columns" member holding one column per attribute instead of
+one dictionary per feature:
+
+- "id": feature ids (None when absent).
+- "geometry_type": geometry type names (None for null geometries).
+- "x", "y", "z": flat ``array('d')`` coordinate buffers. "z" is None when no
+  position has an altitude; otherwise positions without one hold NaN.
+- "geometry_offsets", "part_offsets", "ring_offsets": ``array('q')`` offsets
+  in the style of GeoArrow. Geometry ``i`` consists of parts
+  ``geometry_offsets[i]:geometry_offsets[i + 1]``, part ``j`` of rings
+  ``part_offsets[j]:part_offsets[j + 1]`` and ring ``k`` of positions
+  ``ring_offsets[k]:ring_offsets[k + 1]``. Every geometry type is mapped onto
+  these three levels (a Point is one part of one ring of one position, a
+  LineString one part of one ring, a Polygon one part of several rings, ...).
+- "geometry_collections": GeometryCollections, which do not fit the offsets,
+  keyed by feature index.
+- "properties": one list per property key. Features without a key (or with
+  null properties) hold None in that column.
+
+Other members of the FeatureCollection (e.g. "bbox" or foreign members) are
+kept as they are. Members of individual features or geometries other than
+the ones above are not part of the layout.
+"""
+
+from __future__ import annotations
+
+import math
+import typing
+from array import array
+
+from marshmallow import ValidationError
+
+from .object_type import (
+    FEATURE,
+    FEATURE_COLLECTION,
+    GEOMETRY_COLLECTION,
+    LINE_STRING,
+    MULTI_LINE_STRING,
+    MULTI_POINT,
+    MULTI_POLYGON,
+    POINT,
+    POLYGON,
+)
+
+COLUMNAR: typing.Final = "columnar"
+FEATURES: typing.Final = "features"
+LAYOUTS = (FEATURES, COLUMNAR)
+
+INVALID_MESSAGE = "Coordinates must be arrays of numbers."
+
+# Member holding the columns in place of "features".
+COLUMNS_MEMBER: typing.Final = "columns"
+
+COLUMNS = (
+    "id",
+    "geometry_type",
+    "x",
+    "y",
+    "z",
+    "geometry_offsets",
+    "part_offsets",
+    "ring_offsets",
+    "geometry_collections",
+    "properties",
+)
+
+# Conversions between the coordinates of each geometry type and a list of
+# parts, each a list of rings, each a list of positions.
+TO_PARTS: dict[str, typing.Callable[[typing.Any], typing.Any]] = {
+    POINT: lambda coordinates: [[[coordinates]]],
+    MULTI_POINT: lambda coordinates: [[[position]] for position in coordinates],
+    LINE_STRING: lambda coordinates: [[coordinates]],
+    MULTI_LINE_STRING: lambda coordinates: [[line] for line in coordinates],
+    POLYGON: lambda coordinates: [coordinates],
+    MULTI_POLYGON: lambda coordinates: coordinates,
+}
+
+FROM_PARTS: dict[str, typing.Callable[[typing.Any], typing.Any]] = {
+    POINT: lambda parts: parts[0][0][0],
+    MULTI_POINT: lambda parts: [part[0][0] for part in parts],
+    LINE_STRING: lambda parts: parts[0][0],
+    MULTI_LINE_STRING: lambda parts: [part[0] for part in parts],
+    POLYGON: lambda parts: parts[0],
+    MULTI_POLYGON: lambda parts: parts,
+}
+
+
+def check_layout(layout: str) -> None:
+    """Check a layout option.
+
+    Args:
+        layout: Layout name, "features" or "columnar".
+
+    Raises:
+        ValueError: If the layout is unknown.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"layout must be one of {LAYOUTS}, not {layout!r}.")
+
+
+def is_columnar(obj: typing.Any) -> bool:
+    """Check whether an object is a FeatureCollection in the columnar layout.
+
+    The object must have no "features" member and a "columns" member with
+    every column, coordinates and offsets being arrays.
+    """
+    if (
+        not isinstance(obj, typing.Mapping)
+        or obj.get("type") != FEATURE_COLLECTION
+        or FEATURES in obj
+    ):
+        return False
+    columns = obj.get(COLUMNS_MEMBER)
+    if not isinstance(columns, typing.Mapping) or not all(name in columns for name in COLUMNS):
+        return False
+    return all(
+        isinstance(columns[name], array)
+        for name in ("x", "y", "geometry_offsets", "part_offsets", "ring_offsets")
+    )
+
+
+class ColumnarBuilder:
+    """Accumulates validated features into columns, one feature at a time."""
+
+    def __init__(self):
+        self.length = 0
+        self.ids: list[typing.Any] = []
+        self.geometry_types: list[str | None] = []
+        self.x = array("d")
+        self.y = array("d")
+        self.z = array("d")
+        self.has_z = False
+        self.geometry_offsets = array("q", [0])
+        self.part_offsets = array("q", [0])
+        self.ring_offsets = array("q", [0])
+        self.geometry_collections: dict[int, typing.Any] = {}
+        self.properties: dict[str, list[typing.Any]] = {}
+
+    def append(self, feature: typing.Mapping[str, typing.Any]) -> None:
+        """Append a feature.
+
+        Features outside the sample of a "sample" mode load only had a
+        structural check, so coordinates that do not fit the columns are
+        reported here. The builder must not be used after an error.
+
+        Args:
+            feature: The feature to append.
+
+        Raises:
+            ValidationError: If the coordinates are not numbers in nested
+                lists, or the properties are not a mapping.
+        """
+        properties = feature.get("properties") or {}
+        if not isinstance(properties, typing.Mapping):
+            raise ValidationError({"properties": ["Not a valid mapping type."]})
+        try:
+            self._append_geometry(feature.get("geometry"))
+        except (TypeError, ValueError, IndexError) as error:
+            raise ValidationError({"geometry": {"coordinates": [INVALID_MESSAGE]}}) from error
+        self.ids.append(feature.get("id"))
+
+        for key in properties:
+            if key not in self.properties:
+                self.properties[key] = [None] * self.length
+        for key, column in self.properties.items():
+            column.append(properties.get(key))
+        self.length += 1
+
+    def _append_geometry(self, geometry: typing.Any) -> None:
+        geometry_type = geometry["type"] if geometry is not None else None
+        self.geometry_types.append(geometry_type)
+        if geometry_type == GEOMETRY_COLLECTION:
+            self.geometry_collections[self.length] = geometry
+        elif geometry_type is not None:
+            x, y, z = self.x, self.y, self.z
+            for part in TO_PARTS[geometry_type](geometry["coordinates"]):
+                for ring in part:
+                    for position in ring:
+                        x.append(position[0])
+                        y.append(position[1])
+                        if len(position) > 2:
+                            z.append(position[2])
+                            self.has_z = True
+                        else:
+                            z.append(math.nan)
+                    self.ring_offsets.append(len(x))
+                self.part_offsets.append(len(self.ring_offsets) - 1)
+        self.geometry_offsets.append(len(self.part_offsets) - 1)
+
+    def finish(self) -> dict[str, typing.Any]:
+        """Return the accumulated columns."""
+        return {
+            "id": self.ids,
+            "geometry_type": self.geometry_types,
+            "x": self.x,
+            "y": self.y,
+            "z": self.z if self.has_z else None,
+            "geometry_offsets": self.geometry_offsets,
+            "part_offsets": self.part_offsets,
+            "ring_offsets": self.ring_offsets,
+            "geometry_collections": self.geometry_collections,
+            "properties": self.properties,
+        }
+
+
+def from_columnar(collection: typing.Mapping[str, typing.Any]) -> dict[str, typing.Any]:
+    """Convert a columnar FeatureCollection back to a regular one.
+
+    Args:
+        collection: FeatureCollection in the columnar layout.
+
+    Returns:
+        The FeatureCollection with a "features" array.
+    """
+    columns = collection[COLUMNS_MEMBER]
+    x, y, z = columns["x"], columns["y"], columns["z"]
+    geometry_offsets = columns["geometry_offsets"]
+    part_offsets = columns["part_offsets"]
+    ring_offsets = columns["ring_offsets"]
+    properties = columns["properties"]
+
+    def position(idx: int) -> list[float]:
+        if z is None or math.isnan(z[idx]):
+            return [x[idx], y[idx]]
+        return [x[idx], y[idx], z[idx]]
+
+    features = []
+    for idx, geometry_type in enumerate(columns["geometry_type"]):
+        geometry: typing.Any = None
+        if geometry_type == GEOMETRY_COLLECTION:
+            geometry = columns["geometry_collections"][idx]
+        elif geometry_type is not None:
+            parts = [
+                [
+                    [position(i) for i in range(ring_offsets[ring], ring_offsets[ring + 1])]
+                    for ring in range(part_offsets[part], part_offsets[part + 1])
+                ]
+                for part in range(geometry_offsets[idx], geometry_offsets[idx + 1])
+            ]
+            geometry = {"type": geometry_type, "coordinates": FROM_PARTS[geometry_type](parts)}
+
+        feature: dict[str, typing.Any] = {"type": FEATURE}
+        if columns["id"][idx] is not None:
+            feature["id"] = columns["id"][idx]
+        feature["geometry"] = geometry
+        feature["properties"] = {key: column[idx] for key, column in properties.items()}
+        features.append(feature)
+
+    result = {key: value for key, value in collection.items() if key != COLUMNS_MEMBER}
+    result["features"] = features
+    return result
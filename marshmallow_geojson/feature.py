@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import builtins
+import typing
+
 from marshmallow import pre_load
-from marshmallow.fields import Dict, Float, List, Nested, Raw, Str
+from marshmallow.fields import Float, List, Nested, Raw, Str
 from marshmallow.validate import OneOf
 
 from ._base import BaseSchema
 from .geometry import GeometriesSchema
 from .object_type import FEATURE
+from .property import PropertiesField, PropertiesSchema, properties_subclass
 from .validate import Bbox, NoGeometryMembers
 
 
@@ -33,8 +37,16 @@ class FeatureSchema(BaseSchema):
             According to RFC 7946 Section 3.2, this member is required.
         id: Optional feature identifier. Can be a string or integer, or None.
         bbox: Optional bounding box array.
+        properties_schema: Optional :class:`PropertiesSchema` subclass the
+            properties are validated with, see :meth:`with_properties`. The
+            schema is compiled once into a single function (see
+            :func:`~marshmallow_geojson.property.compile_properties`), which
+            is much faster than a ``Nested`` properties field. Properties
+            must then be a JSON object or null.
     """
 
+    properties_schema: typing.ClassVar[type[PropertiesSchema] | None] = None
+
     type = Str(
         required=True,
         validate=OneOf(
@@ -63,7 +75,7 @@ class FeatureSchema(BaseSchema):
         },
     )
 
-    properties = Dict(
+    properties = PropertiesField(
         required=True,
         allow_none=True,
         metadata={
@@ -105,6 +117,33 @@ class FeatureSchema(BaseSchema):
         },
     )
 
+    @classmethod
+    def with_properties(
+        cls, properties_schema: builtins.type[PropertiesSchema]
+    ) -> builtins.type[FeatureSchema]:
+        """Return a subclass validating properties with a properties schema.
+
+        The subclass sets :attr:`properties_schema`. It is created once per
+        schema class and properties schema; later calls, from any thread,
+        return the same class.
+
+        Args:
+            properties_schema: The :class:`PropertiesSchema` subclass.
+
+        Returns:
+            The FeatureSchema subclass.
+
+        Raises:
+            TypeError: If ``properties_schema`` is not a schema class.
+
+        Example:
+            >>> CityFeatureSchema = FeatureSchema.with_properties(CityPropertiesSchema)
+            >>> city = CityFeatureSchema().load(data)
+        """
+        return typing.cast(
+            "builtins.type[FeatureSchema]", properties_subclass(cls, properties_schema)
+        )
+
     @pre_load
     def validate_no_geometry_members(self, data, **kwargs):
         """Validate that Feature does not contain Geometry-defining members.
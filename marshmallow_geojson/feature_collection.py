@@ -2,16 +2,148 @@
 
 from __future__ import annotations
 
-from marshmallow import pre_load
+import builtins
+import copy
+import hashlib
+import json
+import typing
+from typing import Literal
+
+from marshmallow import ValidationError, pre_load, types, utils
 from marshmallow.fields import Float, List, Nested, Str
 from marshmallow.validate import OneOf
 
-from ._base import BaseSchema
+from ._base import BaseSchema, SharedNested, load_items, shared_schema
+from .columnar import (
+    COLUMNAR,
+    COLUMNS_MEMBER,
+    ColumnarBuilder,
+    check_layout,
+    from_columnar,
+    is_columnar,
+)
 from .feature import FeatureSchema
+from .intern import PropertyTable, property_table
 from .object_type import FEATURE_COLLECTION
+from .property import PropertiesSchema, properties_subclass
+from .sample import (
+    FULL,
+    SAMPLE,
+    check_feature_structure,
+    check_validation_mode,
+    sample_indices,
+    sample_report,
+)
+from .stream import BATCH_SIZE
 from .validate import Bbox, NoForbiddenMembers
 
 
+def geometry_key(geometry: typing.Any) -> bytes | None:
+    """Return a digest identifying a geometry by its JSON serialization.
+
+    Geometries with equal members, in the same order, get the same key.
+
+    Args:
+        geometry: The geometry member of a feature, before validation.
+
+    Returns:
+        A 16-byte BLAKE2 digest, or None for null and non-JSON geometries.
+    """
+    if not isinstance(geometry, typing.Mapping):
+        return None
+    try:
+        text = json.dumps(geometry, separators=(",", ":"), check_circular=False)
+    except (TypeError, ValueError, RecursionError):
+        return None
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class FeatureList(List):
+    """List field for the "features" member of a FeatureCollection.
+
+    Behaves like :class:`marshmallow.fields.List` but honours the loading
+    options of the parent :class:`FeatureCollectionSchema` (e.g. ``threads``,
+    ``validation``, ``intern_properties`` and ``dedupe_geometries``).
+    """
+
+    def load_features(
+        self,
+        features: list[typing.Any],
+        sampled: set[int] | None = None,
+        geometries: dict[bytes, typing.Any] | None = None,
+        **kwargs: typing.Any,
+    ) -> tuple[list[typing.Any], dict[int, typing.Any]]:
+        """Validate a list of features.
+
+        Args:
+            features: Feature objects to validate.
+            sampled: Indices of the features that get full validation. The
+                other features only get a structural check and are returned
+                as given. None validates every feature.
+            geometries: Validated geometries by :func:`geometry_key`, used
+                and filled when the parent schema has ``dedupe_geometries``
+                set. Pass the same dictionary for the batches of one
+                collection; None uses a new one.
+            **kwargs: Additional keyword arguments passed to the inner field.
+
+        Returns:
+            A tuple ``(result, errors)`` with errors keyed by feature index.
+        """
+
+        table = getattr(self.parent, "property_table", None)
+        if not getattr(self.parent, "dedupe_geometries", False) or not self.nullable_geometry():
+            geometries = None
+        elif geometries is None:
+            geometries = {}
+
+        def deserialize(feature: typing.Any) -> typing.Any:
+            if geometries is None or not isinstance(feature, typing.Mapping):
+                return self.inner.deserialize(feature, **kwargs)
+            key = geometry_key(feature.get("geometry"))
+            if key is None:
+                return self.inner.deserialize(feature, **kwargs)
+            geometry = geometries.get(key)
+            if geometry is not None:
+                result = self.inner.deserialize({**feature, "geometry": None}, **kwargs)
+                result["geometry"] = geometry
+                return result
+            result = self.inner.deserialize(feature, **kwargs)
+            geometries[key] = result["geometry"]
+            return result
+
+        def load_feature(idx: int) -> typing.Any:
+            if sampled is None or idx in sampled:
+                feature = deserialize(features[idx])
+                return feature if table is None else table.intern(feature)
+            check_feature_structure(features[idx])
+            return features[idx]
+
+        return load_items(
+            load_feature,
+            range(len(features)),
+            threads=getattr(self.parent, "threads", None),
+        )
+
+    def nullable_geometry(self) -> bool:
+        """Return whether the nested feature schema accepts a null geometry."""
+        schema = getattr(self.inner, "schema", None)
+        field = getattr(schema, "fields", {}).get("geometry")
+        return field is not None and field.allow_none
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if not utils.is_collection(value):
+            raise self.make_error("invalid")
+
+        features = value if isinstance(value, list) else list(value)
+        sampled = None
+        if getattr(self.parent, "validation", FULL) == SAMPLE:
+            sampled = typing.cast("FeatureCollectionSchema", self.parent).sample(len(features))
+        result, errors = self.load_features(features, sampled, **kwargs)
+        if errors:
+            raise ValidationError(errors, valid_data=result)
+        return result
+
+
 class FeatureCollectionSchema(BaseSchema):
     """Schema for FeatureCollection object in GeoJSON format.
 
@@ -24,6 +156,14 @@ class FeatureCollectionSchema(BaseSchema):
         type: The object type, must be "FeatureCollection".
         features: An array of Feature objects.
         bbox: Optional bounding box array.
+        threads: Number of worker threads used to validate features. None
+            validates features sequentially.
+        validation: Validation mode, "full" or "sample".
+        sample_rate: Fraction of features fully validated in "sample" mode.
+        sample_seed: Seed used to choose the sampled features.
+        property_table: Table sharing property keys and values between
+            features, or None (see ``intern_properties``).
+        dedupe_geometries: Whether equal geometries are validated once.
     """
 
     type = Str(
@@ -39,7 +179,7 @@ class FeatureCollectionSchema(BaseSchema):
         },
     )
 
-    features = List(
+    features = FeatureList(
         Nested(FeatureSchema()),
         required=True,
         metadata={
@@ -75,6 +215,351 @@ class FeatureCollectionSchema(BaseSchema):
         },
     )
 
+    def __init__(
+        self,
+        *,
+        threads: int | None = None,
+        validation: Literal["full", "sample"] = FULL,
+        sample_rate: float = 0.1,
+        sample_seed: typing.Any = None,
+        intern_properties: bool | PropertyTable = False,
+        dedupe_geometries: bool = False,
+        **kwargs: typing.Any,
+    ):
+        """Initialize FeatureCollectionSchema.
+
+        Args:
+            threads: Number of worker threads used to validate features. The
+                features are split into one contiguous chunk per thread and
+                reassembled in order. None or 1 validates sequentially.
+            validation: Validation mode. In "full" mode every feature is
+                validated. In "sample" mode every feature gets a structural
+                check ("type" and forbidden members), but coordinates, linear
+                rings and other members are only validated for a seeded random
+                sample of features. Features outside the sample are returned
+                as given.
+            sample_rate: Fraction of features fully validated in "sample" mode.
+            sample_seed: Seed used to choose the sampled features. None picks
+                a different sample on every load.
+            intern_properties: Whether validated features share their
+                property keys and short string values through a bounded
+                :class:`PropertyTable`, as each feature (or, for streamed
+                files, each batch) is loaded. Saves memory on large
+                collections with repetitive properties. Pass a table to
+                share it with other schemas; True creates one for this
+                schema, kept across loads.
+            dedupe_geometries: Whether features with equal geometries (same
+                JSON serialization, see :func:`geometry_key`) share them: each
+                distinct geometry is validated once, and later features
+                reference the same validated object, so mutating it affects
+                all of them. Streamed files are deduplicated across batches.
+            **kwargs: Additional keyword arguments passed to the base schema.
+
+        Raises:
+            ValueError: If ``validation`` or ``sample_rate`` is invalid.
+        """
+        super().__init__(**kwargs)
+        check_validation_mode(validation, sample_rate)
+        self.threads = threads
+        self.validation = validation
+        self.sample_rate = sample_rate
+        self.sample_seed = sample_seed
+        self.property_table = property_table(intern_properties)
+        self.dedupe_geometries = dedupe_geometries
+
+    @classmethod
+    def with_properties(
+        cls, properties_schema: builtins.type[PropertiesSchema]
+    ) -> builtins.type[FeatureCollectionSchema]:
+        """Return a subclass validating feature properties with a properties schema.
+
+        Features are loaded with ``FeatureSchema.with_properties(properties_schema)``
+        (or the ``with_properties`` subclass of the feature schema this class
+        nests). A single instance of that feature schema is shared by every
+        instance of the subclass, and by every other collection schema built
+        for the same properties schema, instead of one copy per collection
+        schema instance. The subclass is created once per schema class and
+        properties schema; both are safe to use from several threads.
+
+        Args:
+            properties_schema: The :class:`PropertiesSchema` subclass.
+
+        Returns:
+            The FeatureCollectionSchema subclass.
+
+        Raises:
+            TypeError: If ``properties_schema`` is not a schema class.
+
+        Example:
+            >>> CitiesSchema = FeatureCollectionSchema.with_properties(CityPropertiesSchema)
+            >>> cities = CitiesSchema(threads=4).load(data)
+        """
+
+        def namespace() -> dict[str, typing.Any]:
+            features = copy.copy(typing.cast("List", cls._declared_fields["features"]))
+            nested = typing.cast("Nested", features.inner).nested
+            feature_class = nested if isinstance(nested, builtins.type) else builtins.type(nested)
+            feature_schema = typing.cast("builtins.type[FeatureSchema]", feature_class)
+            feature_schema = feature_schema.with_properties(properties_schema)
+            # One instance per feature schema class, shared by all collections.
+            features.inner = SharedNested(shared_schema(feature_schema, feature_schema))
+            return {"features": features}
+
+        subclass = properties_subclass(cls, properties_schema, namespace)
+        return typing.cast("builtins.type[FeatureCollectionSchema]", subclass)
+
+    def load(
+        self,
+        data: typing.Any,
+        *,
+        many: bool | None = None,
+        partial: bool | types.StrSequenceOrSet | None = None,
+        unknown: Literal["exclude", "include", "raise"] | None = None,
+        layout: Literal["features", "columnar"] = "features",
+    ):
+        """Deserialize and validate a FeatureCollection.
+
+        Args:
+            data: FeatureCollection(s) to deserialize.
+            many: Whether to deserialize multiple FeatureCollections. If None,
+                uses the schema's default.
+            partial: Whether to allow partial data. Can be True/False or a
+                sequence of field names.
+            unknown: How to handle unknown fields. Can be 'raise', 'exclude', or
+                'include'.
+            layout: Layout of the result. "features" returns a regular
+                FeatureCollection. "columnar" appends each feature to columns
+                as soon as it is validated, without keeping per-feature
+                dictionaries (see :mod:`marshmallow_geojson.columnar`).
+
+        Returns:
+            Deserialized and validated data.
+
+        Raises:
+            ValidationError: If validation fails.
+            ValueError: If ``layout`` is invalid.
+        """
+        check_layout(layout)
+        many = self.many if many is None else bool(many)
+        if layout != COLUMNAR:
+            return super().load(data, many=many, partial=partial, unknown=unknown)
+        if many:
+            return [
+                self.load(item, partial=partial, unknown=unknown, layout=layout) for item in data
+            ]
+
+        features = data.get("features") if isinstance(data, typing.Mapping) else None
+        if not isinstance(features, list):
+            # Let regular loading report the invalid input.
+            result = super().load(data, partial=partial, unknown=unknown)
+            features = result.pop("features")
+        else:
+            result = super().load({**data, "features": []}, partial=partial, unknown=unknown)
+            result.pop("features")
+        if COLUMNS_MEMBER in result:
+            raise ValidationError(
+                {COLUMNS_MEMBER: [f'Member "{COLUMNS_MEMBER}" is reserved in the columnar layout.']}
+            )
+
+        sampled = self.sample(len(features)) if self.validation == SAMPLE else None
+        field = typing.cast(FeatureList, self.fields["features"])
+        builder = ColumnarBuilder()
+        errors: dict[int, typing.Any] = {}
+        geometries: dict[bytes, typing.Any] = {}
+        for start in range(0, len(features), BATCH_SIZE):
+            batch = features[start : start + BATCH_SIZE]
+            batch_sampled = None
+            if sampled is not None:
+                batch_sampled = {idx for idx in range(len(batch)) if start + idx in sampled}
+            loaded, batch_errors = field.load_features(
+                batch, batch_sampled, geometries, partial=partial
+            )
+            errors.update((start + idx, messages) for idx, messages in batch_errors.items())
+            if not batch_errors:
+                for idx, feature in enumerate(loaded, start):
+                    try:
+                        builder.append(feature)
+                    except ValidationError as error:
+                        errors[idx] = error.messages
+        if errors:
+            raise ValidationError({"features": errors})
+
+        result[COLUMNS_MEMBER] = builder.finish()
+        return result
+
+    def dump(self, obj: typing.Any, *, many: bool | None = None):
+        """Serialize FeatureCollection(s), accepting the columnar layout.
+
+        Args:
+            obj: FeatureCollection(s) to serialize, either regular or in the
+                columnar layout returned by ``load(..., layout="columnar")``.
+            many: Whether to serialize multiple FeatureCollections. If None,
+                uses the schema's default.
+
+        Returns:
+            Serialized FeatureCollection(s).
+        """
+        many = self.many if many is None else bool(many)
+        if many:
+            obj = [from_columnar(item) if is_columnar(item) else item for item in obj]
+        elif is_columnar(obj):
+            obj = from_columnar(obj)
+        return super().dump(obj, many=many)
+
+    def sample(self, count: int) -> set[int]:
+        """Choose the features that get full validation in "sample" mode.
+
+        Args:
+            count: Number of features.
+
+        Returns:
+            Set of sampled feature indices.
+        """
+        return sample_indices(count, self.sample_rate, self.sample_seed)
+
+    def load_sampled(
+        self,
+        data: typing.Mapping[str, typing.Any],
+        *,
+        partial: bool | types.StrSequenceOrSet | None = None,
+        unknown: Literal["exclude", "include", "raise"] | None = None,
+    ) -> tuple[dict[str, typing.Any], dict[str, typing.Any]]:
+        """Validate a sample of the features and report the observed error rate.
+
+        Works like :meth:`load` in "sample" mode (whatever the configured
+        ``validation`` mode), but errors in sampled features are reported
+        instead of raised.
+
+        Args:
+            data: FeatureCollection to deserialize.
+            partial: Whether to allow partial data. Can be True/False or a
+                sequence of field names.
+            unknown: How to handle unknown fields. Can be 'raise', 'exclude', or
+                'include'.
+
+        Returns:
+            A tuple ``(result, report)``. ``report`` holds the sampled
+            indices, the errors of the sampled features keyed by index, the
+            observed error rate and the extrapolated number of invalid
+            features (see :func:`marshmallow_geojson.sample.sample_report`).
+
+        Raises:
+            ValidationError: If the FeatureCollection members or any feature
+                fail the structural check.
+        """
+        features = data.get("features") if isinstance(data, typing.Mapping) else None
+        if not isinstance(features, list):
+            result = self.load(data, partial=partial, unknown=unknown)
+            return result, sample_report(0, set(), {})
+
+        result = self.load({**data, "features": []}, partial=partial, unknown=unknown)
+
+        sampled = self.sample(len(features))
+        field = typing.cast(FeatureList, self.fields["features"])
+        result["features"], errors = field.load_features(features, sampled, partial=partial)
+
+        structural = {idx: messages for idx, messages in errors.items() if idx not in sampled}
+        if structural:
+            raise ValidationError({"features": structural}, valid_data=result)
+        return result, sample_report(len(features), sampled, errors)
+
+    def load_incremental(
+        self,
+        data: typing.Mapping[str, typing.Any],
+        previous: typing.Mapping[str, typing.Any],
+        *,
+        partial: bool | types.StrSequenceOrSet | None = None,
+        unknown: Literal["exclude", "include", "raise"] | None = None,
+    ) -> tuple[dict[str, typing.Any], dict[str, list[int]]]:
+        """Re-validate a FeatureCollection against a previously validated version.
+
+        Features are matched to the previous result by "id" when present and
+        by position otherwise. A matched feature whose content is equal to the
+        previously validated feature is reused as-is; all other features are
+        validated again. The FeatureCollection members other than "features"
+        are always validated.
+
+        Args:
+            data: The new FeatureCollection payload.
+            previous: The result of a previous :meth:`load` (or
+                :meth:`load_incremental`) call.
+            partial: Whether to allow partial data. Can be True/False or a
+                sequence of field names.
+            unknown: How to handle unknown fields. Can be 'raise', 'exclude', or
+                'include'.
+
+        Returns:
+            A tuple ``(result, changes)``. ``result`` is the merged validated
+            FeatureCollection. ``changes`` maps "added", "changed", "removed"
+            and "unchanged" to lists of feature indices; "removed" indices
+            refer to ``previous``, all others to the new payload.
+
+        Raises:
+            ValidationError: If validation fails. Feature errors are keyed by
+                their index in the new payload.
+        """
+        previous_features = previous.get("features") or []
+        features = data.get("features") if isinstance(data, typing.Mapping) else None
+        if not isinstance(features, list):
+            result = self.load(data, partial=partial, unknown=unknown)
+            return result, {
+                "added": list(range(len(result["features"]))),
+                "changed": [],
+                "removed": list(range(len(previous_features))),
+                "unchanged": [],
+            }
+
+        result = self.load({**data, "features": []}, partial=partial, unknown=unknown)
+
+        previous_by_id = {
+            feature["id"]: idx
+            for idx, feature in enumerate(previous_features)
+            if feature.get("id") is not None
+        }
+
+        merged: list[typing.Any] = []
+        matched = set()
+        changes: dict[str, list[int]] = {"added": [], "changed": [], "removed": [], "unchanged": []}
+        pending = []
+        for idx, feature in enumerate(features):
+            feature_id = feature.get("id") if isinstance(feature, dict) else None
+            if feature_id is not None:
+                match = previous_by_id.get(feature_id)
+            elif idx < len(previous_features) and previous_features[idx].get("id") is None:
+                match = idx
+            else:
+                match = None
+
+            if match is not None:
+                matched.add(match)
+                if previous_features[match] == feature:
+                    merged.append(previous_features[match])
+                    changes["unchanged"].append(idx)
+                    continue
+                changes["changed"].append(idx)
+            else:
+                changes["added"].append(idx)
+            merged.append(None)
+            pending.append(idx)
+
+        changes["removed"] = [idx for idx in range(len(previous_features)) if idx not in matched]
+
+        field = typing.cast(List, self.fields["features"])
+        loaded, pending_errors = load_items(
+            lambda idx: field.inner.deserialize(features[idx], partial=partial),
+            pending,
+            threads=self.threads,
+        )
+        result["features"] = merged
+        if pending_errors:
+            errors = {pending[idx]: messages for idx, messages in pending_errors.items()}
+            raise ValidationError({"features": errors}, valid_data=result)
+
+        table = self.property_table
+        for idx, value in zip(pending, loaded, strict=True):
+            merged[idx] = value if table is None else table.intern(value)
+        return result, changes
+
     @pre_load
     def validate_no_forbidden_members(self, data, **kwargs):
         """Validate that FeatureCollection does not contain forbidden members.
@@ -1,22 +1,45 @@
 from __future__ import annotations
 
+import os
 import typing
 from typing import Literal
 
 import marshmallow as ma
 from marshmallow import types
 
-from ._base import BaseSchema
+from ._base import BaseSchema, Dispatch, dispatch_table, load_items, options_key
+from .binary import decode_binary, encode_binary
 from .feature import FeatureSchema
-from .feature_collection import FeatureCollectionSchema
+from .feature_collection import FeatureCollectionSchema, FeatureList
+from .geometry import GeometriesSchema
 from .geometry_collection import GeometryCollectionSchema
+from .intern import PropertyTable, property_table
+from .limits import InputLimits, check_limits, checked, exceeded
 from .line_string import LineStringSchema
 from .multi_line_string import MultiLineStringSchema
 from .multi_point import MultiPointSchema
 from .multi_polygon import MultiPolygonSchema
 from .object_type import GeoJSONType
-from .point import PointSchema
+from .patch import (
+    COLLECTION_MEMBER,
+    FEATURE_GEOMETRY,
+    FEATURE_MEMBER,
+    PatchedDocument,
+    merge_errors,
+    nest_errors,
+)
+from .point import PointSchema, plain_point
 from .polygon import PolygonSchema
+from .sample import (
+    FULL,
+    SAMPLE,
+    check_object_structure,
+    check_validation_mode,
+    sample_indices,
+    sample_report,
+)
+from .stream import TextStream, iter_array, iter_batches, iter_members, map_file
+from .winding import rewind
 
 
 class GeoJSONSchema(BaseSchema):
@@ -37,6 +60,23 @@ class GeoJSONSchema(BaseSchema):
         geometry_collection_schema: Schema class for GeometryCollection.
         feature_schema: Schema class for Feature objects.
         feature_collection_schema: Schema class for FeatureCollection objects.
+        threads: Number of worker threads used to validate objects in
+            ``many=True`` mode and features of a FeatureCollection.
+        validation: Validation mode, "full" or "sample".
+        sample_rate: Fraction of objects fully validated in "sample" mode.
+        sample_seed: Seed used to choose the sampled objects.
+        rewind: Whether Polygon and MultiPolygon rings are oriented following
+            the right-hand rule on load and dump.
+        max_bytes: Maximum size in bytes of the input of :meth:`loads` and
+            :meth:`load_file`.
+        max_features: Maximum number of Features in the input of
+            :meth:`loads` and :meth:`load_file`.
+        max_vertices_per_geometry: Maximum number of positions of a single
+            geometry in the input of :meth:`loads` and :meth:`load_file`.
+        max_total_vertices: Maximum number of positions in the input of
+            :meth:`loads` and :meth:`load_file`.
+        max_properties: Maximum number of properties of a Feature in the
+            input of :meth:`loads` and :meth:`load_file`.
     """
 
     point_schema = PointSchema
@@ -63,6 +103,18 @@ class GeoJSONSchema(BaseSchema):
         dump_only: types.StrSequenceOrSet = (),
         partial: bool | types.StrSequenceOrSet = False,
         unknown: Literal["exclude", "include", "raise"] | None = None,
+        threads: int | None = None,
+        validation: Literal["full", "sample"] = FULL,
+        sample_rate: float = 0.1,
+        sample_seed: typing.Any = None,
+        rewind: bool = False,
+        intern_properties: bool | PropertyTable = False,
+        dedupe_geometries: bool = False,
+        max_bytes: int | None = None,
+        max_features: int | None = None,
+        max_vertices_per_geometry: int | None = None,
+        max_total_vertices: int | None = None,
+        max_properties: int | None = None,
         **kwargs: typing.Any,
     ):
         """Initialize GeoJSONSchema.
@@ -77,6 +129,45 @@ class GeoJSONSchema(BaseSchema):
                 sequence of field names.
             unknown: How to handle unknown fields. Can be 'raise', 'exclude',
                 or 'include'.
+            threads: Number of worker threads used to validate objects in
+                ``many=True`` mode, or the features of a single
+                FeatureCollection. None or 1 validates sequentially.
+            validation: Validation mode. In "sample" mode every object in
+                ``many=True`` mode (or every feature of a single
+                FeatureCollection) gets a structural check, but full
+                validation only runs on a seeded random sample. Objects
+                outside the sample are returned as given.
+            sample_rate: Fraction of objects fully validated in "sample" mode.
+            sample_seed: Seed used to choose the sampled objects. None picks
+                a different sample on every load.
+            rewind: Whether to orient the rings of every Polygon and
+                MultiPolygon, including those nested in Features,
+                FeatureCollections and GeometryCollections, following the
+                right-hand rule (RFC 7946 Section 3.1.6) on load and dump.
+                Rings are reversed in place.
+            intern_properties: Whether loaded Features, including those of
+                FeatureCollections, share their property keys and short
+                string values through a bounded :class:`PropertyTable` (see
+                :class:`FeatureCollectionSchema`). Pass a table to share it
+                with other schemas; True creates one for this schema.
+            dedupe_geometries: Whether the features of a FeatureCollection
+                with equal geometries share one validated geometry object
+                (see :class:`FeatureCollectionSchema`).
+            max_bytes: Maximum size in bytes of the JSON document passed to
+                :meth:`loads` or :meth:`load_file`. Larger input is rejected
+                before it is parsed.
+            max_features: Maximum number of Features, counting those of
+                FeatureCollections.
+            max_vertices_per_geometry: Maximum number of positions of a
+                single geometry; each member of a GeometryCollection counts
+                separately.
+            max_total_vertices: Maximum number of positions in the document.
+            max_properties: Maximum number of members of the "properties" of
+                a Feature.
+
+        Raises:
+            ValueError: If ``validation``, ``sample_rate`` or a limit is
+                invalid.
         """
         super().__init__(
             only=only,
@@ -89,7 +180,27 @@ class GeoJSONSchema(BaseSchema):
             **kwargs,
         )
 
-        self.object_type_map = {
+        check_validation_mode(validation, sample_rate)
+        check_limits(
+            max_bytes=max_bytes,
+            max_features=max_features,
+            max_vertices_per_geometry=max_vertices_per_geometry,
+            max_total_vertices=max_total_vertices,
+            max_properties=max_properties,
+        )
+        self.threads = threads
+        self.validation = validation
+        self.sample_rate = sample_rate
+        self.sample_seed = sample_seed
+        self.rewind = rewind
+        self.property_table = property_table(intern_properties)
+        self.dedupe_geometries = dedupe_geometries
+        self.max_bytes = max_bytes
+        self.max_features = max_features
+        self.max_vertices_per_geometry = max_vertices_per_geometry
+        self.max_total_vertices = max_total_vertices
+        self.max_properties = max_properties
+        self.object_type_map: dict[str, type[BaseSchema]] = {
             GeoJSONType.point.value: self.point_schema,
             GeoJSONType.multi_point.value: self.multi_point_schema,
             GeoJSONType.line_string.value: self.line_string_schema,
@@ -119,6 +230,173 @@ class GeoJSONSchema(BaseSchema):
             {"_schema": f"Unknown object class for {object_type}."},
         )
 
+    def _make_schema(self, schema: type[BaseSchema], **options: typing.Any) -> BaseSchema:
+        """Instantiate a type-specific schema with this schema's settings.
+
+        Args:
+            schema: The schema class to instantiate.
+            **options: Extra options for FeatureCollection schemas (e.g.
+                ``threads``). They are ignored for other schemas.
+
+        Returns:
+            The schema instance.
+        """
+        if not issubclass(schema, FeatureCollectionSchema):
+            options = {}
+        return schema(**self.nested_options(), **options)
+
+    def dispatch(self, *, collection: bool = False) -> Dispatch:
+        """Return the ``load`` and ``dump`` methods of the type-specific schemas.
+
+        The schemas are instantiated with this schema's options once, and
+        the table is shared by every instance of this class with the same
+        options (see :func:`~marshmallow_geojson._base.dispatch_table`).
+
+        Args:
+            collection: Whether the FeatureCollection schema also gets the
+                FeatureCollection options (``threads``, ``validation``, ...).
+
+        Returns:
+            A dictionary mapping object types to ``(load, dump)`` pairs.
+        """
+        options = self.nested_options()
+        collection_options = self._feature_collection_options() if collection else {}
+        key = options_key(options)
+        collection_key = options_key(collection_options)
+
+        def schema_options(schema: type[BaseSchema]) -> dict[str, typing.Any]:
+            if issubclass(schema, FeatureCollectionSchema):
+                return {**options, **collection_options}
+            return options
+
+        return dispatch_table(
+            self.object_type_map,
+            schema_options,
+            None if key is None or collection_key is None else (type(self), key, collection_key),
+        )
+
+    def _dispatch_item(self, table: Dispatch, object_type: str):
+        """Return the ``(load, dump)`` pair of an object type.
+
+        Raises:
+            ValidationError: If the object type is not recognized.
+        """
+        entry = table.get(object_type)
+        if entry is None:
+            self.get_schema(object_type)
+        return entry
+
+    def _feature_collection_options(self) -> dict[str, typing.Any]:
+        """Return the options forwarded to FeatureCollection schemas."""
+        return {
+            "threads": self.threads,
+            "validation": self.validation,
+            "sample_rate": self.sample_rate,
+            "sample_seed": self.sample_seed,
+            "intern_properties": False if self.property_table is None else self.property_table,
+            "dedupe_geometries": self.dedupe_geometries,
+        }
+
+    def _load_many(
+        self,
+        items: list[typing.Any],
+        *,
+        partial: bool | types.StrSequenceOrSet | None,
+        unknown: Literal["exclude", "include", "raise"] | None,
+        sampled: set[int] | None = None,
+    ) -> tuple[list[typing.Any], dict[int, typing.Any]]:
+        """Validate a list of GeoJSON objects.
+
+        The objects are grouped by type, and each group is validated with a
+        single ``many=True`` load of its schema. Results are put back in the
+        original order. Groups containing invalid objects are validated again
+        one object at a time, so errors and partial results match per-object
+        loading. With ``threads``, the groups are split into chunks spread
+        over the worker threads.
+
+        Args:
+            items: GeoJSON objects to validate.
+            partial: Whether to allow partial data.
+            unknown: How to handle unknown fields.
+            sampled: Indices of the objects that get full validation. The
+                other objects only get a structural check and are returned
+                as given. None validates every object.
+
+        Returns:
+            A tuple ``(result, errors)`` with errors keyed by object index.
+        """
+        table = self.dispatch()
+        loaded: dict[int, typing.Any] = {}
+        errors: dict[int, typing.Any] = {}
+        groups: dict[str, list[int]] = {}
+        for idx, item in enumerate(items):
+            if sampled is None or idx in sampled:
+                groups.setdefault(item["type"], []).append(idx)
+                continue
+            try:
+                check_object_structure(item)
+            except ma.ValidationError as error:
+                errors[idx] = error.messages
+            else:
+                loaded[idx] = item
+
+        def load_group(
+            group: tuple[str, list[int]],
+        ) -> tuple[dict[int, typing.Any], dict[int, typing.Any]]:
+            object_type, indices = group
+            group_loaded: dict[int, typing.Any] = {}
+            group_errors: dict[int, typing.Any] = {}
+            try:
+                load = self._dispatch_item(table, object_type)[0]
+            except ma.ValidationError as error:
+                return group_loaded, dict.fromkeys(indices, error.messages)
+            schema = load.__self__
+            if type(schema) is PointSchema and schema.only is None and not schema.exclude:
+                for idx in indices:
+                    point = plain_point(items[idx])
+                    if point is not None:
+                        group_loaded[idx] = point
+                indices = [idx for idx in indices if idx not in group_loaded]
+                if not indices:
+                    return group_loaded, group_errors
+            try:
+                values = load(
+                    data=[items[idx] for idx in indices],
+                    many=True,
+                    partial=partial,
+                    unknown=unknown,
+                )
+            except ma.ValidationError:
+                # Hooks are skipped for the whole batch once an object fails:
+                # load the objects again one at a time.
+                for idx in indices:
+                    try:
+                        group_loaded[idx] = load(data=items[idx], partial=partial, unknown=unknown)
+                    except ma.ValidationError as item_error:
+                        if item_error.valid_data is not None:
+                            group_loaded[idx] = item_error.valid_data
+                        group_errors[idx] = item_error.messages
+            else:
+                group_loaded.update(zip(indices, values, strict=True))
+            if self.property_table is not None:
+                for idx in group_loaded.keys() - group_errors.keys():
+                    group_loaded[idx] = self.property_table.intern(group_loaded[idx])
+            return group_loaded, group_errors
+
+        chunks: list[tuple[str, list[int]]] = []
+        for object_type, indices in groups.items():
+            size = -(-len(indices) // max(self.threads or 1, 1))
+            chunks.extend(
+                (object_type, indices[start : start + size])
+                for start in range(0, len(indices), size)
+            )
+        outcomes, _ = load_items(load_group, chunks, threads=self.threads)
+        for group_loaded, group_errors in outcomes:
+            loaded.update(group_loaded)
+            errors.update(group_errors)
+
+        return [loaded[idx] for idx in range(len(items)) if idx in loaded], errors
+
     def _list_and_many_or_raise(self, data: typing.Any, many: bool):
         """Validate that data type matches the many parameter.
 
@@ -164,40 +442,374 @@ class GeoJSONSchema(BaseSchema):
         self._list_and_many_or_raise(data=data, many=many)
 
         if many:
-            result = []
-            for item in typing.cast(typing.Iterable[typing.Mapping[str, typing.Any]], data):
-                schema = self.get_schema(item["type"])
-                result.append(
-                    schema(
-                        only=self.only,
-                        exclude=self.exclude,
-                        load_only=self.load_only,
-                        dump_only=self.dump_only,
-                        partial=self.partial,
-                        unknown=self.unknown,
-                    ).load(
-                        data=item,
-                        partial=partial,
-                        unknown=unknown,
-                    )
+            items = list(typing.cast(typing.Iterable[typing.Mapping[str, typing.Any]], data))
+            sampled = None
+            if self.validation == SAMPLE:
+                sampled = sample_indices(len(items), self.sample_rate, self.sample_seed)
+            result, errors = self._load_many(
+                items, partial=partial, unknown=unknown, sampled=sampled
+            )
+            if errors:
+                raise ma.ValidationError(errors, valid_data=result)
+            return self._rewind(result, many=many, data=items)
+
+        object_type = typing.cast(typing.Mapping[str, typing.Any], data)["type"]
+        load = self._dispatch_item(self.dispatch(collection=True), object_type)[0]
+        result = load(data=data, partial=partial, unknown=unknown)
+        if self.property_table is not None and object_type == GeoJSONType.feature.value:
+            self.property_table.intern(result)
+        return self._rewind(result, many=many, data=data)
+
+    def load_sampled(
+        self,
+        data: typing.Any,
+        *,
+        many: bool | None = None,
+        partial: bool | types.StrSequenceOrSet | None = None,
+        unknown: Literal["exclude", "include", "raise"] | None = None,
+    ) -> tuple[typing.Any, dict[str, typing.Any]]:
+        """Validate a sample of the objects and report the observed error rate.
+
+        Works like :meth:`load` in "sample" mode (whatever the configured
+        ``validation`` mode), but errors in sampled objects are reported
+        instead of raised. A single FeatureCollection is sampled by feature
+        (see :meth:`FeatureCollectionSchema.load_sampled`); any other single
+        object is treated as a list of one.
+
+        Args:
+            data: GeoJSON object(s) to deserialize.
+            many: Whether to deserialize multiple objects. If None, uses the
+                schema's default.
+            partial: Whether to allow partial data. Can be True/False or a
+                sequence of field names.
+            unknown: How to handle unknown fields. Can be 'raise', 'exclude', or
+                'include'.
+
+        Returns:
+            A tuple ``(result, report)`` (see
+            :func:`marshmallow_geojson.sample.sample_report`).
+
+        Raises:
+            ValidationError: If any object fails the structural check. Errors
+                are keyed by object index in ``many=True`` mode.
+        """
+        many = self.many if many is None else bool(many)
+        self._list_and_many_or_raise(data=data, many=many)
+
+        if not many:
+            schema = self.get_schema(data["type"])
+            if issubclass(schema, FeatureCollectionSchema):
+                fc_schema = typing.cast(
+                    FeatureCollectionSchema,
+                    self._make_schema(schema, **self._feature_collection_options()),
                 )
-        else:
-            schema = self.get_schema(typing.cast(typing.Mapping[str, typing.Any], data)["type"])
-            result = schema(
-                only=self.only,
-                exclude=self.exclude,
-                load_only=self.load_only,
-                dump_only=self.dump_only,
-                partial=self.partial,
-                unknown=self.unknown,
-            ).load(
-                data=data,
+                return fc_schema.load_sampled(data, partial=partial, unknown=unknown)
+            result, report = self.load_sampled([data], many=True, partial=partial, unknown=unknown)
+            return result[0], report
+
+        items = list(data)
+        sampled = sample_indices(len(items), self.sample_rate, self.sample_seed)
+        result, errors = self._load_many(items, partial=partial, unknown=unknown, sampled=sampled)
+
+        structural = {idx: messages for idx, messages in errors.items() if idx not in sampled}
+        if structural:
+            raise ma.ValidationError(structural, valid_data=result)
+        return result, sample_report(len(items), sampled, errors)
+
+    def load_file(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        many: bool | None = None,
+        partial: bool | types.StrSequenceOrSet | None = None,
+        unknown: Literal["exclude", "include", "raise"] | None = None,
+    ):
+        """Deserialize and validate a GeoJSON file.
+
+        The file is memory-mapped and parsed incrementally, so the raw JSON
+        text is never held in memory as a whole. The features of a
+        FeatureCollection (and the objects of a top-level array in
+        ``many=True`` mode) are decoded and validated in batches as they are
+        read, and only the validated objects are kept. Features are streamed
+        when the "type" member precedes "features" in the file; otherwise
+        the document is decoded first and validated like :meth:`load`. In
+        "sample" mode each batch is sampled separately. The mapping is closed
+        before this method returns.
+
+        Args:
+            path: Path of the GeoJSON file.
+            many: Whether the file holds an array of objects. If None, uses
+                the schema's default.
+            partial: Whether to allow partial data. Can be True/False or a
+                sequence of field names.
+            unknown: How to handle unknown fields. Can be 'raise', 'exclude', or
+                'include'.
+
+        Returns:
+            Deserialized and validated GeoJSON data.
+
+        Raises:
+            ValidationError: If validation fails. Feature errors are keyed by
+                feature index.
+            json.JSONDecodeError: If the file is not valid JSON.
+        """
+        many = self.many if many is None else bool(many)
+        with map_file(path) as buffer:
+            self._check_size(len(buffer))
+            result = self._load_stream(
+                TextStream(buffer),
+                many=many,
                 partial=partial,
                 unknown=unknown,
+                limits=self._input_limits(),
             )
+        return self._rewind(result, many=many)
+
+    def loads(
+        self,
+        json_data: str | bytes | bytearray,
+        /,
+        *,
+        many: bool | None = None,
+        partial: bool | types.StrSequenceOrSet | None = None,
+        unknown: Literal["exclude", "include", "raise"] | None = None,
+        **kwargs: typing.Any,
+    ):
+        """Deserialize and validate a GeoJSON document.
+
+        Without size limits this is :meth:`marshmallow.Schema.loads`. When a
+        limit is set (``max_bytes``, ``max_features``,
+        ``max_vertices_per_geometry``, ``max_total_vertices`` or
+        ``max_properties``), input larger than ``max_bytes`` is rejected
+        before parsing. The document is then parsed incrementally like in
+        :meth:`load_file`, and features are counted as they are decoded, so
+        oversized input is rejected without being parsed or validated in
+        full.
+
+        Args:
+            json_data: JSON document.
+            many: Whether the document holds an array of objects. If None,
+                uses the schema's default.
+            partial: Whether to allow partial data. Can be True/False or a
+                sequence of field names.
+            unknown: How to handle unknown fields. Can be 'raise', 'exclude', or
+                'include'.
+            **kwargs: Options passed to the JSON decoder. With a size limit
+                set, they make the document be decoded in one piece before
+                being counted.
+
+        Returns:
+            Deserialized and validated GeoJSON data.
+
+        Raises:
+            ValidationError: If validation fails or a size limit is exceeded.
+        """
+        limits = self._input_limits()
+        if limits is None and self.max_bytes is None:
+            return super().loads(json_data, many=many, partial=partial, unknown=unknown, **kwargs)
+        many = self.many if many is None else bool(many)
+        if isinstance(json_data, str):
+            # A character takes at least one byte: check before encoding.
+            self._check_size(len(json_data))
+            json_data = json_data.encode()
+        self._check_size(len(json_data))
+        if kwargs:
+            data = self.opts.render_module.loads(json_data, **kwargs)
+            if limits is not None:
+                for item in data if many and isinstance(data, list) else (data,):
+                    limits.check(item)
+            return self.load(data, many=many, partial=partial, unknown=unknown)
+        result = self._load_stream(
+            TextStream(json_data), many=many, partial=partial, unknown=unknown, limits=limits
+        )
+        return self._rewind(result, many=many)
 
+    def _input_limits(self) -> InputLimits | None:
+        """Return the counts for one load, or None if no count is limited."""
+        if (
+            self.max_features is None
+            and self.max_vertices_per_geometry is None
+            and self.max_total_vertices is None
+            and self.max_properties is None
+        ):
+            return None
+        return InputLimits(
+            max_features=self.max_features,
+            max_vertices_per_geometry=self.max_vertices_per_geometry,
+            max_total_vertices=self.max_total_vertices,
+            max_properties=self.max_properties,
+        )
+
+    def _check_size(self, size: int) -> None:
+        """Reject input of ``size`` bytes if it exceeds ``max_bytes``."""
+        if self.max_bytes is not None and size > self.max_bytes:
+            raise exceeded(f"Input is larger than max_bytes ({self.max_bytes}).")
+
+    def _rewind(self, result: typing.Any, *, many: bool, data: typing.Any = None) -> typing.Any:
+        """Orient polygon rings of loaded or dumped objects if ``rewind`` is set.
+
+        In "sample" mode, objects of the input ``data`` that were returned
+        as given (not validated) are left unchanged, so that the caller's
+        input is never modified.
+        """
+        if self.rewind:
+            skip: set[int] = set()
+            if data is not None and self.validation == SAMPLE:
+                for item in data if many else (data,):
+                    skip.add(id(item))
+                    if isinstance(item, typing.Mapping) and isinstance(item.get("features"), list):
+                        skip.update(map(id, item["features"]))
+            for item in result if many else (result,):
+                rewind(item, skip)
         return result
 
+    @staticmethod
+    def _sample_batch(count: int, rate: float, seed: typing.Any, number: int) -> set[int]:
+        """Choose the sampled objects of a batch, deriving a seed per batch."""
+        return sample_indices(count, rate, None if seed is None else f"{seed}:{number}")
+
+    def _load_stream(
+        self,
+        stream: TextStream,
+        *,
+        many: bool,
+        partial: bool | types.StrSequenceOrSet | None,
+        unknown: Literal["exclude", "include", "raise"] | None,
+        limits: InputLimits | None = None,
+    ):
+        """Deserialize and validate a GeoJSON document from a text stream.
+
+        Args:
+            stream: Stream positioned at the start of the document.
+            many: Whether the document is an array of objects.
+            partial: Whether to allow partial data.
+            unknown: How to handle unknown fields.
+            limits: Counts checked as objects are decoded, or None.
+
+        Returns:
+            Deserialized and validated GeoJSON data.
+
+        Raises:
+            ValidationError: If validation fails.
+        """
+        if many:
+            if stream.peek() != "[":
+                raise ma.ValidationError({"_schema": self._default_error_messages["type"]})
+            items: list[typing.Any] = []
+            item_errors: dict[int, typing.Any] = {}
+            start = 0
+            objects = iter_array(stream)
+            if limits is not None:
+                objects = checked(objects, limits.check)
+            for number, batch in enumerate(iter_batches(objects)):
+                sampled = None
+                if self.validation == SAMPLE:
+                    sampled = self._sample_batch(
+                        len(batch), self.sample_rate, self.sample_seed, number
+                    )
+                loaded, batch_errors = self._load_many(
+                    batch, partial=partial, unknown=unknown, sampled=sampled
+                )
+                item_errors.update(
+                    (start + idx, messages) for idx, messages in batch_errors.items()
+                )
+                items.extend(loaded)
+                start += len(batch)
+            stream.finish()
+            if item_errors:
+                raise ma.ValidationError(item_errors, valid_data=items)
+            return items
+
+        if stream.peek() != "{":
+            data = stream.value()
+            stream.finish()
+            self._list_and_many_or_raise(data=data, many=False)
+            if limits is not None:
+                limits.check(data)
+            return self.load(data, many=False, partial=partial, unknown=unknown)
+
+        members: dict[str, typing.Any] = {}
+        fc_schema = None
+        features: list[typing.Any] = []
+        feature_errors: dict[int, typing.Any] = {}
+        for key in iter_members(stream):
+            schema = self.object_type_map.get(members.get("type"))  # type: ignore[arg-type]
+            if (
+                key == "features"
+                and fc_schema is None
+                and schema is not None
+                and issubclass(schema, FeatureCollectionSchema)
+                and stream.peek() == "["
+            ):
+                fc_schema = typing.cast(
+                    FeatureCollectionSchema,
+                    self._make_schema(schema, **self._feature_collection_options()),
+                )
+                if isinstance(fc_schema.fields.get("features"), FeatureList):
+                    features, feature_errors = self._stream_features(
+                        fc_schema, stream, partial, limits
+                    )
+                    continue
+                fc_schema = None
+            members[key] = stream.value()
+        stream.finish()
+
+        if fc_schema is None:
+            if limits is not None:
+                limits.check(members)
+            return self.load(members, many=False, partial=partial, unknown=unknown)
+
+        errors: dict[str, typing.Any] = {}
+        try:
+            result = fc_schema.load({**members, "features": []}, partial=partial, unknown=unknown)
+        except ma.ValidationError as error:
+            errors = typing.cast(dict, error.messages)
+            result = typing.cast(dict, error.valid_data) or {}
+        result["features"] = features
+        if feature_errors:
+            errors["features"] = feature_errors
+        if errors:
+            raise ma.ValidationError(errors, valid_data=result)
+        return result
+
+    def _stream_features(
+        self,
+        schema: FeatureCollectionSchema,
+        stream: TextStream,
+        partial: bool | types.StrSequenceOrSet | None,
+        limits: InputLimits | None = None,
+    ) -> tuple[list[typing.Any], dict[int, typing.Any]]:
+        """Validate the "features" array of a FeatureCollection in batches.
+
+        Args:
+            schema: The FeatureCollection schema.
+            stream: Stream positioned at the "features" array.
+            partial: Whether to allow partial data.
+            limits: Counts checked as features are decoded, or None.
+
+        Returns:
+            A tuple ``(result, errors)`` with errors keyed by feature index.
+        """
+        field = typing.cast(FeatureList, schema.fields["features"])
+        result: list[typing.Any] = []
+        errors: dict[int, typing.Any] = {}
+        geometries: dict[bytes, typing.Any] = {}
+        offset = 0
+        features = iter_array(stream)
+        if limits is not None:
+            features = checked(features, limits.check_feature)
+        for number, batch in enumerate(iter_batches(features)):
+            sampled = None
+            if schema.validation == SAMPLE:
+                sampled = self._sample_batch(
+                    len(batch), schema.sample_rate, schema.sample_seed, number
+                )
+            loaded, batch_errors = field.load_features(batch, sampled, geometries, partial=partial)
+            result.extend(loaded)
+            errors.update((offset + idx, messages) for idx, messages in batch_errors.items())
+            offset += len(batch)
+        return result, errors
+
     def dump(
         self,
         obj: typing.Any,
@@ -221,33 +833,146 @@ class GeoJSONSchema(BaseSchema):
         many = self.many if many is None else bool(many)
         self._list_and_many_or_raise(data=obj, many=many)
 
+        table = self.dispatch()
         if many:
-            data = []
-            for item in obj:
-                schema = self.get_schema(item["type"])
-                data.append(
-                    schema(
-                        only=self.only,
-                        exclude=self.exclude,
-                        load_only=self.load_only,
-                        dump_only=self.dump_only,
-                        partial=self.partial,
-                        unknown=self.unknown,
-                    ).dump(
-                        obj=item,
-                    )
-                )
+            data = [self._dispatch_item(table, item["type"])[1](obj=item) for item in obj]
         else:
-            schema = self.get_schema(obj["type"])
-            data = schema(
-                only=self.only,
-                exclude=self.exclude,
-                load_only=self.load_only,
-                dump_only=self.dump_only,
-                partial=self.partial,
-                unknown=self.unknown,
-            ).dump(
-                obj=obj,
-            )
+            data = self._dispatch_item(table, obj["type"])[1](obj=obj)
+
+        return self._rewind(data, many=many)
+
+    def dumps_binary(
+        self,
+        obj: typing.Any,
+        *,
+        many: bool | None = None,
+        precision: int | None = None,
+    ) -> bytes:
+        """Serialize GeoJSON object(s) to the compact binary format.
+
+        The objects are serialized with :meth:`dump` and then encoded with
+        quantized, delta-encoded coordinates and a key dictionary (see
+        :mod:`marshmallow_geojson.binary`).
+
+        Args:
+            obj: GeoJSON object(s) to serialize.
+            many: Whether to serialize multiple objects. If None, uses the
+                schema's default.
+            precision: Number of decimal digits kept for coordinates. If None,
+                the smallest precision representing every coordinate exactly
+                is used, up to 7 digits; coordinates needing more are
+                written as doubles.
+
+        Returns:
+            The encoded payload.
+
+        Raises:
+            ValueError: If a geometry mixes 2-D and 3-D positions, which the
+                binary format cannot represent.
+        """
+        return encode_binary(self.dump(obj, many=many), precision=precision)
+
+    def loads_binary(
+        self,
+        data: bytes | bytearray | memoryview,
+        *,
+        many: bool | None = None,
+        partial: bool | types.StrSequenceOrSet | None = None,
+        unknown: Literal["exclude", "include", "raise"] | None = None,
+    ):
+        """Deserialize and validate a payload produced by :meth:`dumps_binary`.
+
+        The decoded objects are validated with :meth:`load`, exactly like JSON
+        input.
+
+        Args:
+            data: The encoded payload.
+            many: Whether to deserialize multiple objects. If None, uses the
+                schema's default.
+            partial: Whether to allow partial data. Can be True/False or a
+                sequence of field names.
+            unknown: How to handle unknown fields. Can be 'raise', 'exclude', or
+                'include'.
 
-        return data
+        Returns:
+            Deserialized and validated GeoJSON data.
+
+        Raises:
+            ValidationError: If the payload is malformed or validation fails.
+        """
+        return self.load(decode_binary(data), many=many, partial=partial, unknown=unknown)
+
+    def apply_patch(self, document: typing.Any, patch: typing.Any) -> typing.Any:
+        """Apply a JSON Patch (RFC 6902) to a validated GeoJSON document.
+
+        Only the GeoJSON objects touched by the patch are validated again,
+        using the same schemas as :meth:`load`. For example, moving a vertex
+        at "/features/12/geometry/coordinates/0/3" re-validates only the
+        geometry of feature 12. The input document is not modified;
+        untouched parts of it are shared with the result.
+
+        Args:
+            document: A GeoJSON document previously returned by :meth:`load`.
+            patch: A list of JSON Patch operations.
+
+        Returns:
+            The patched and validated GeoJSON document.
+
+        Raises:
+            ValidationError: If the patch is invalid, cannot be applied, or
+                the patched document fails validation. Validation errors are
+                nested under the path of the object that failed.
+        """
+        if not isinstance(patch, list):
+            raise ma.ValidationError({"_schema": "JSON Patch must be an array of operations."})
+
+        patched = PatchedDocument(document)
+        for index, operation in enumerate(patch):
+            patched.apply(operation, index)
+
+        errors: dict[typing.Any, typing.Any] = {}
+        for path, kind in patched.validation_units():
+            try:
+                value = self._load_patched(patched.get(path), kind)
+            except ma.ValidationError as error:
+                messages = error.messages
+                if not path and not isinstance(messages, dict):
+                    messages = {"_schema": messages}
+                merge_errors(errors, nest_errors(path, messages))
+            else:
+                patched.set(path, value)
+
+        if errors:
+            raise ma.ValidationError(errors, valid_data=patched.document)
+        return patched.document
+
+    def _load_patched(self, value: typing.Any, kind: str) -> typing.Any:
+        """Validate a GeoJSON object touched by a JSON Patch.
+
+        Args:
+            value: The patched object.
+            kind: Where the object lives in the document (see
+                :meth:`PatchedDocument.validation_units`).
+
+        Returns:
+            The validated object.
+
+        Raises:
+            ValidationError: If validation fails.
+        """
+        if kind == FEATURE_MEMBER:
+            return self._make_schema(self.feature_schema).load(value)
+        if kind in (FEATURE_GEOMETRY, COLLECTION_MEMBER):
+            if value is None:
+                if kind == FEATURE_GEOMETRY:
+                    return None
+                raise ma.ValidationError(["Field may not be null."])
+            if not isinstance(value, dict):
+                raise ma.ValidationError({"_schema": [self._default_error_messages["type"]]})
+            geometries = GeometriesSchema()
+            return self._make_schema(
+                geometries.get_schema(typing.cast(str, value.get("type")))
+            ).load(value)
+        if not isinstance(value, dict):
+            raise ma.ValidationError({"_schema": [self._default_error_messages["type"]]})
+        return self.load(value, many=False)
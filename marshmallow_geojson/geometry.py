@@ -4,9 +4,10 @@ import typing
 from typing import Literal
 
 import marshmallow as ma
-from marshmallow import types
+from marshmallow import fields, types
 
-from ._base import BaseSchema
+from ._base import BaseSchema, Dispatch, dispatch_table, load_items, options_key
+from .geometry_collection import GeometryCollectionSchema
 from .line_string import LineStringSchema
 from .multi_line_string import MultiLineStringSchema
 from .multi_point import MultiPointSchema
@@ -14,6 +15,7 @@ from .multi_polygon import MultiPolygonSchema
 from .object_type import GeometryType
 from .point import PointSchema
 from .polygon import PolygonSchema
+from .wkb import decode_wkb, encode_wkb
 
 
 class GeometriesSchema(BaseSchema):
@@ -31,6 +33,7 @@ class GeometriesSchema(BaseSchema):
         multi_line_string_schema: Schema class for MultiLineString geometry.
         polygon_schema: Schema class for Polygon geometry.
         multi_polygon_schema: Schema class for MultiPolygon geometry.
+        geometry_collection_schema: Schema class for GeometryCollection.
     """
 
     point_schema = PointSchema
@@ -39,6 +42,7 @@ class GeometriesSchema(BaseSchema):
     multi_line_string_schema = MultiLineStringSchema
     polygon_schema = PolygonSchema
     multi_polygon_schema = MultiPolygonSchema
+    geometry_collection_schema = GeometryCollectionSchema
 
     _default_error_messages = {
         "type": "Invalid input type.",
@@ -80,24 +84,15 @@ class GeometriesSchema(BaseSchema):
             **kwargs,
         )
 
-        self._object_type_map: dict[str, type[BaseSchema]] | None = None
-
-    @property
-    def object_type_map(self) -> dict[str, type[BaseSchema]]:
-        """Get the object type map, initializing it lazily to avoid circular imports."""
-        if self._object_type_map is None:
-            from .geometry_collection import GeometryCollectionSchema
-
-            self._object_type_map = {
-                GeometryType.point.value: self.point_schema,
-                GeometryType.multi_point.value: self.multi_point_schema,
-                GeometryType.line_string.value: self.line_string_schema,
-                GeometryType.multi_line_string.value: self.multi_line_string_schema,
-                GeometryType.polygon.value: self.polygon_schema,
-                GeometryType.multi_polygon.value: self.multi_polygon_schema,
-                GeometryType.geometry_collection.value: GeometryCollectionSchema,
-            }
-        return self._object_type_map
+        self.object_type_map: dict[str, type[BaseSchema]] = {
+            GeometryType.point.value: self.point_schema,
+            GeometryType.multi_point.value: self.multi_point_schema,
+            GeometryType.line_string.value: self.line_string_schema,
+            GeometryType.multi_line_string.value: self.multi_line_string_schema,
+            GeometryType.polygon.value: self.polygon_schema,
+            GeometryType.multi_polygon.value: self.multi_polygon_schema,
+            GeometryType.geometry_collection.value: self.geometry_collection_schema,
+        }
 
     def get_schema(self, object_type: str):
         """Get the appropriate schema class for a given geometry type.
@@ -117,6 +112,35 @@ class GeometriesSchema(BaseSchema):
             {"_schema": f"Unknown object class for {object_type}."},
         )
 
+    def dispatch(self) -> Dispatch:
+        """Return the ``load`` and ``dump`` methods of the geometry schemas.
+
+        The geometry schemas are instantiated with this schema's options once,
+        and the table is shared by every instance of this class with the
+        same options (see :func:`~marshmallow_geojson._base.dispatch_table`).
+
+        Returns:
+            A dictionary mapping geometry types to ``(load, dump)`` pairs.
+        """
+        options = self.nested_options()
+        key = options_key(options)
+        return dispatch_table(
+            self.object_type_map,
+            lambda schema: options,
+            None if key is None else (type(self), key),
+        )
+
+    def _dispatch_item(self, table: Dispatch, object_type: str):
+        """Return the ``(load, dump)`` pair of a geometry type.
+
+        Raises:
+            ValidationError: If the geometry type is not recognized.
+        """
+        entry = table.get(object_type)
+        if entry is None:
+            self.get_schema(object_type)
+        return entry
+
     def _list_and_many_or_raise(self, data: typing.Any, many: bool):
         """Validate that data type matches the many parameter.
 
@@ -161,38 +185,16 @@ class GeometriesSchema(BaseSchema):
         many = self.many if many is None else bool(many)
         self._list_and_many_or_raise(data=data, many=many)
 
+        table = self.dispatch()
         if many:
             result = []
             for item in typing.cast(typing.Iterable[typing.Mapping[str, typing.Any]], data):
-                schema = self.get_schema(item["type"])
-                result.append(
-                    schema(
-                        only=self.only,
-                        exclude=self.exclude,
-                        load_only=self.load_only,
-                        dump_only=self.dump_only,
-                        partial=self.partial,
-                        unknown=self.unknown,
-                    ).load(
-                        data=item,
-                        partial=partial,
-                        unknown=unknown,
-                    )
-                )
+                load = self._dispatch_item(table, item["type"])[0]
+                result.append(load(data=item, partial=partial, unknown=unknown))
         else:
-            schema = self.get_schema(typing.cast(typing.Mapping[str, typing.Any], data)["type"])
-            result = schema(
-                only=self.only,
-                exclude=self.exclude,
-                load_only=self.load_only,
-                dump_only=self.dump_only,
-                partial=self.partial,
-                unknown=self.unknown,
-            ).load(
-                data=data,
-                partial=partial,
-                unknown=unknown,
-            )
+            item = typing.cast(typing.Mapping[str, typing.Any], data)
+            load = self._dispatch_item(table, item["type"])[0]
+            result = load(data=item, partial=partial, unknown=unknown)
 
         return result
 
@@ -219,33 +221,128 @@ class GeometriesSchema(BaseSchema):
         many = self.many if many is None else bool(many)
         self._list_and_many_or_raise(data=obj, many=many)
 
+        table = self.dispatch()
         if many:
-            data = []
-            for item in obj:
-                schema = self.get_schema(item["type"])
-                data.append(
-                    schema(
-                        only=self.only,
-                        exclude=self.exclude,
-                        load_only=self.load_only,
-                        dump_only=self.dump_only,
-                        partial=self.partial,
-                        unknown=self.unknown,
-                    ).dump(
-                        obj=item,
-                    )
-                )
+            data = [self._dispatch_item(table, item["type"])[1](obj=item) for item in obj]
         else:
-            schema = self.get_schema(obj["type"])
-            data = schema(
-                only=self.only,
-                exclude=self.exclude,
-                load_only=self.load_only,
-                dump_only=self.dump_only,
-                partial=self.partial,
-                unknown=self.unknown,
-            ).dump(
-                obj=obj,
-            )
+            data = self._dispatch_item(table, obj["type"])[1](obj=obj)
 
         return data
+
+    def load_wkb(
+        self,
+        data: typing.Any,
+        *,
+        many: bool | None = None,
+        partial: bool | types.StrSequenceOrSet | None = None,
+        unknown: Literal["exclude", "include", "raise"] | None = None,
+    ):
+        """Decode and validate WKB or EWKB geometries.
+
+        The decoded geometries go through :meth:`load`, so they get the same
+        checks as GeoJSON input (coordinate ranges, linear rings, polygon
+        rings, ...).
+
+        Args:
+            data: WKB bytes or hexadecimal string, or a list of them if
+                ``many`` is True.
+            many: Whether to decode multiple geometries. If None, uses the
+                schema's default.
+            partial: Whether to allow partial data. Can be True/False or a
+                sequence of field names.
+            unknown: How to handle unknown fields. Can be 'raise', 'exclude', or
+                'include'.
+
+        Returns:
+            Deserialized and validated geometry data.
+
+        Raises:
+            ValidationError: If the WKB is malformed or validation fails. In
+                ``many`` mode, errors are keyed by item index.
+        """
+        many = self.many if many is None else bool(many)
+        if not many:
+            return self.load(decode_wkb(data)[0], many=False, partial=partial, unknown=unknown)
+
+        self._list_and_many_or_raise(data=data, many=many)
+        result, errors = load_items(
+            lambda item: self.load(
+                decode_wkb(item)[0], many=False, partial=partial, unknown=unknown
+            ),
+            data,
+        )
+        if errors:
+            raise ma.ValidationError(errors, valid_data=result)
+        return result
+
+    def dump_wkb(
+        self,
+        obj: typing.Any,
+        *,
+        many: bool | None = None,
+        byte_order: Literal["little", "big"] = "little",
+        srid: int | None = None,
+    ):
+        """Serialize geometry object(s) to WKB.
+
+        Args:
+            obj: Geometry object(s) to serialize.
+            many: Whether to serialize multiple objects. If None, uses the
+                schema's default.
+            byte_order: "little" (NDR) or "big" (XDR) endian.
+            srid: SRID to embed. When given, PostGIS EWKB is written;
+                otherwise ISO WKB.
+
+        Returns:
+            WKB bytes, or a list of them if ``many`` is True.
+        """
+        many = self.many if many is None else bool(many)
+        data = self.dump(obj, many=many)
+        if many:
+            return [encode_wkb(item, byte_order=byte_order, srid=srid) for item in data]
+        return encode_wkb(data, byte_order=byte_order, srid=srid)
+
+
+class WKBGeometryField(fields.Field):
+    """Field holding a geometry stored as WKB or EWKB.
+
+    On load, WKB bytes (or a hexadecimal string, as returned by PostGIS) are
+    decoded and validated with :class:`GeometriesSchema`, producing a GeoJSON
+    geometry. On dump, GeoJSON geometries are encoded as WKB.
+
+    Args:
+        schema: Geometries schema class used for validation.
+        byte_order: Byte order of dumped WKB, "little" or "big".
+        srid: SRID embedded in dumped WKB. When given, EWKB is written.
+        as_hex: Whether to dump a hexadecimal string instead of bytes.
+        **kwargs: Additional keyword arguments passed to
+            :class:`marshmallow.fields.Field`.
+    """
+
+    default_error_messages = {"invalid": "Not a valid WKB geometry."}
+
+    def __init__(
+        self,
+        *,
+        schema: type[GeometriesSchema] | None = None,
+        byte_order: Literal["little", "big"] = "little",
+        srid: int | None = None,
+        as_hex: bool = False,
+        **kwargs: typing.Any,
+    ):
+        super().__init__(**kwargs)
+        self.schema = schema or GeometriesSchema
+        self.byte_order = byte_order
+        self.srid = srid
+        self.as_hex = as_hex
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if not isinstance(value, bytes | bytearray | memoryview | str):
+            raise self.make_error("invalid")
+        return self.schema().load_wkb(value)
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        if value is None:
+            return None
+        data = self.schema().dump_wkb(value, byte_order=self.byte_order, srid=self.srid)
+        return data.hex() if self.as_hex else data
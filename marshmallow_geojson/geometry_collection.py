@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from marshmallow import pre_load
+import typing
+from typing import Literal
+
+from marshmallow import ValidationError, pre_load, types
 from marshmallow.fields import Float, List, Nested, Str
+from marshmallow.utils import is_collection
 from marshmallow.validate import OneOf
 
-from ._base import BaseSchema
+from ._base import BaseSchema, load_items
 from .object_type import GEOMETRY_COLLECTION
 from .validate import Bbox, NoFeatureMembers
 
@@ -19,13 +23,17 @@ class GeometryCollectionSchema(BaseSchema):
     containing an array of geometry objects.
 
     A GeometryCollection may contain other GeometryCollection objects, allowing
-    for nested collections.
+    for nested collections. Nested collections are validated with an explicit
+    stack instead of recursion, so deep nesting cannot exhaust the Python
+    stack; ``max_depth`` additionally bounds the work spent on it.
 
     Attributes:
         type: The geometry type, must be "GeometryCollection".
         geometries: An array of geometry objects. Each geometry can be any valid
             GeoJSON geometry type, including another GeometryCollection.
         bbox: Optional bounding box array.
+        max_depth: Maximum nesting depth of GeometryCollections, or None.
+        flatten: Whether nested collections are replaced by their geometries.
     """
 
     type = Str(
@@ -74,6 +82,163 @@ class GeometryCollectionSchema(BaseSchema):
         },
     )
 
+    def __init__(
+        self, *, max_depth: int | None = None, flatten: bool = False, **kwargs: typing.Any
+    ):
+        """Initialize GeometryCollectionSchema.
+
+        Args:
+            max_depth: Maximum nesting depth of GeometryCollections, the
+                collection itself counting as 1. Deeper collections are
+                reported as errors without being validated. None allows any
+                depth; set a limit for untrusted input.
+            flatten: Whether to return the leaf geometries of nested
+                collections, in document order, as the "geometries" of the
+                loaded collection. The nested collections are still
+                validated, and errors keep their nested keys.
+            **kwargs: Additional keyword arguments passed to the base schema.
+        """
+        super().__init__(**kwargs)
+        self.max_depth = max_depth
+        self.flatten = flatten
+
+    def load(
+        self,
+        data: typing.Any,
+        *,
+        many: bool | None = None,
+        partial: bool | types.StrSequenceOrSet | None = None,
+        unknown: Literal["exclude", "include", "raise"] | None = None,
+    ):
+        """Deserialize and validate a GeometryCollection.
+
+        The members of each collection other than "geometries" are loaded
+        with this schema and its geometries with the schema of the
+        "geometries" field, walking nested collections with an explicit
+        stack. Results and errors are the same as with nested loading.
+
+        Args:
+            data: GeometryCollection(s) to deserialize.
+            many: Whether to deserialize multiple GeometryCollections. If
+                None, uses the schema's default.
+            partial: Whether to allow partial data.
+            unknown: How to handle unknown fields.
+
+        Returns:
+            Deserialized and validated data.
+
+        Raises:
+            ValidationError: If validation fails.
+        """
+        many = self.many if many is None else bool(many)
+        if many:
+            if not isinstance(data, list):
+                return super().load(data, many=True, partial=partial, unknown=unknown)
+            loaded, item_errors = load_items(
+                lambda item: self.load(item, many=False, partial=partial, unknown=unknown), data
+            )
+            if item_errors:
+                raise ValidationError(item_errors, valid_data=loaded)
+            return loaded
+        if not is_expandable(data) or "geometries" not in self.load_fields:
+            return super().load(data, many=False, partial=partial, unknown=unknown)
+
+        geometries_schema = typing.cast(
+            Nested, typing.cast(List, self.load_fields["geometries"]).inner
+        ).schema
+        root, messages = self._load_members(data, partial=partial, unknown=unknown)
+        if root is None:
+            raise ValidationError(messages)
+        errors: list[tuple[tuple[int, ...], typing.Any]] = []
+        if messages is not None:
+            errors.append(((), messages))
+        nodes: list[tuple[tuple[int, ...], dict, list]] = [((), root, [])]
+        stack: list[tuple[tuple[int, ...], typing.Iterator, int, typing.Any, list]] = [
+            (
+                (),
+                iter(enumerate(data["geometries"])),
+                1,
+                self.partial if partial is None else partial,
+                nodes[0][2],
+            )
+        ]
+        while stack:
+            path, members, depth, node_partial, children = stack[-1]
+            member_partial = geometries_partial(node_partial)
+            for idx, member in members:
+                member_path = (*path, idx)
+                if not (is_expandable(member) and member["type"] == GEOMETRY_COLLECTION):
+                    try:
+                        children.append(geometries_schema.load(member, partial=member_partial))
+                    except ValidationError as error:
+                        if error.valid_data is not None:
+                            children.append(error.valid_data)
+                        errors.append((member_path, error.messages))
+                    continue
+                if self.max_depth is not None and depth >= self.max_depth:
+                    message = f"GeometryCollection nesting exceeds max_depth of {self.max_depth}."
+                    errors.append((member_path, {"_schema": [message]}))
+                    continue
+                result, messages = self._load_members(
+                    member, partial=False if member_partial is None else member_partial
+                )
+                if messages is not None:
+                    errors.append((member_path, messages))
+                if result is None:
+                    continue
+                if self.flatten:
+                    member_children = children
+                else:
+                    member_children = []
+                    children.append(result)
+                    nodes.append((member_path, result, member_children))
+                stack.append(
+                    (
+                        member_path,
+                        iter(enumerate(member["geometries"])),
+                        depth + 1,
+                        member_partial,
+                        member_children,
+                    )
+                )
+                break
+            else:
+                stack.pop()
+
+        # Like a List field, "geometries" is left out of partial results when
+        # none of the geometries are valid.
+        failed = {path[:end] for path, _ in errors for end in range(len(path))}
+        for path, result, children in nodes:
+            if children or path not in failed:
+                result["geometries"] = children
+            else:
+                result.pop("geometries", None)
+        if errors:
+            raise ValidationError(error_tree(errors), valid_data=root)
+        return root
+
+    def _load_members(
+        self,
+        data: dict[str, typing.Any],
+        *,
+        partial: bool | types.StrSequenceOrSet | None,
+        unknown: Literal["exclude", "include", "raise"] | None = None,
+    ) -> tuple[dict[str, typing.Any] | None, typing.Any]:
+        """Load the members of a GeometryCollection other than its geometries.
+
+        Returns:
+            A tuple ``(result, messages)``. ``result`` holds the valid members
+            and is None if the collection could not be loaded at all (e.g.
+            forbidden members); ``messages`` are the errors or None.
+        """
+        try:
+            result = super().load(
+                {**data, "geometries": []}, many=False, partial=partial, unknown=unknown
+            )
+        except ValidationError as error:
+            return typing.cast("dict[str, typing.Any] | None", error.valid_data), error.messages
+        return typing.cast("dict[str, typing.Any]", result), None
+
     @pre_load
     def validate_no_feature_members(self, data, **kwargs):
         """Validate that GeometryCollection does not contain Feature-defining members.
@@ -90,3 +255,47 @@ class GeometryCollectionSchema(BaseSchema):
         """
         validator = NoFeatureMembers(geometry_type_name="GeometryCollection")
         return validator(data)
+
+
+def is_expandable(data: typing.Any) -> bool:
+    """Whether an object has a list of geometries to walk."""
+    return isinstance(data, dict) and type(data.get("geometries")) is list
+
+
+def geometries_partial(
+    partial: bool | types.StrSequenceOrSet | None,
+) -> bool | list[str] | None:
+    """Return the ``partial`` option passed on to the geometries of a collection.
+
+    Mirrors how marshmallow passes ``partial`` to a nested field: True is
+    kept, and dotted field names are stripped of the "geometries." prefix.
+    """
+    if partial is True:
+        return True
+    if is_collection(partial):
+        prefix = "geometries."
+        return [name[len(prefix) :] for name in partial if name.startswith(prefix)]
+    return None
+
+
+def error_tree(errors: list[tuple[tuple[int, ...], typing.Any]]) -> dict[str, typing.Any]:
+    """Nest error messages by their path of geometry indices.
+
+    Args:
+        errors: ``(path, messages)`` pairs, ``path`` holding the index of the
+            geometry at each nesting level.
+
+    Returns:
+        The messages in the shape produced by nested loading, e.g.
+        ``{"geometries": {1: {"geometries": {0: messages}}}}``.
+    """
+    tree: dict[str, typing.Any] = {}
+    for path, messages in errors:
+        node = tree
+        for idx in path:
+            node = node.setdefault("geometries", {}).setdefault(idx, {})
+        if isinstance(messages, dict):
+            node.update(messages)
+        else:
+            node["_schema"] = messages
+    return tree
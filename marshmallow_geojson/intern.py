@@ -0,0 +1,106 @@
+"""Sharing of repeated property keys and values between features.
+
+Every decoded feature carries its own copies of the property keys, and
+categorical values ("residential", "primary", ...) repeat across thousands
+of features. :class:`PropertyTable` makes loaded features share one string
+object per distinct key and short value: keys are interned with
+:func:`sys.intern`, values are looked up in a table of bounded size.
+"""
+
+from __future__ import annotations
+
+import sys
+import typing
+
+from .object_type import FEATURE, FEATURE_COLLECTION
+
+
+class PropertyTable:
+    """Table deduplicating the property keys and string values of features.
+
+    The table is filled as features are loaded and may be shared by several
+    schemas or loads. Once ``max_size`` distinct values are stored, new
+    values are kept as they are, so that high-cardinality properties (names,
+    identifiers) cannot grow it without bound.
+
+    Attributes:
+        max_size: Maximum number of distinct values stored.
+        max_length: Longest string value deduplicated; longer ones are
+            unlikely to repeat.
+    """
+
+    def __init__(self, max_size: int = 65_536, max_length: int = 64):
+        """Initialize PropertyTable.
+
+        Args:
+            max_size: Maximum number of distinct values stored.
+            max_length: Longest string value deduplicated.
+        """
+        self.max_size = max_size
+        self.max_length = max_length
+        self.values: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def properties(self, properties: typing.Mapping[str, typing.Any]) -> dict[str, typing.Any]:
+        """Return a copy of a properties object with shared keys and values.
+
+        Args:
+            properties: The properties of a feature.
+
+        Returns:
+            A new dictionary with interned keys and deduplicated top-level
+            string values. Other values are kept as they are.
+        """
+        values = self.values
+        max_length = self.max_length
+        result = {}
+        for key, value in properties.items():
+            if type(value) is str and len(value) <= max_length:
+                shared = values.get(value)
+                if shared is not None:
+                    value = shared
+                elif len(values) < self.max_size:
+                    values[value] = value
+            result[sys.intern(key) if type(key) is str else key] = value
+        return result
+
+    def intern(self, obj: typing.Any) -> typing.Any:
+        """Share the property keys and values of a Feature or FeatureCollection.
+
+        The "properties" member of each feature is replaced in place; other
+        objects are left unchanged.
+
+        Args:
+            obj: A loaded GeoJSON object.
+
+        Returns:
+            The same object.
+        """
+        if not isinstance(obj, dict):
+            return obj
+        object_type = obj.get("type")
+        if object_type == FEATURE:
+            properties = obj.get("properties")
+            if isinstance(properties, dict):
+                obj["properties"] = self.properties(properties)
+        elif object_type == FEATURE_COLLECTION:
+            for feature in obj.get("features") or ():
+                self.intern(feature)
+        return obj
+
+
+def property_table(intern_properties: bool | PropertyTable) -> PropertyTable | None:
+    """Return the table for an ``intern_properties`` option.
+
+    Args:
+        intern_properties: True for a new table, a table to share it, or
+            False.
+
+    Returns:
+        The table, or None if interning is disabled.
+    """
+    if isinstance(intern_properties, PropertyTable):
+        return intern_properties
+    return PropertyTable() if intern_properties else None
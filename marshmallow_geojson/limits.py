@@ -0,0 +1,219 @@
+"""Input size limits for loading untrusted GeoJSON.
+
+:class:`InputLimits` keeps running counts of the features and positions of a
+document and rejects it as soon as one exceeds its limit. The counts are
+taken on decoded objects before schema validation, so that with incremental
+parsing (see :mod:`marshmallow_geojson.stream`) an oversized document is
+rejected after decoding a bounded prefix of it.
+"""
+
+from __future__ import annotations
+
+import typing
+
+from marshmallow import ValidationError
+
+from .object_type import (
+    FEATURE,
+    FEATURE_COLLECTION,
+    GEOMETRY_COLLECTION,
+    LINE_STRING,
+    MULTI_LINE_STRING,
+    MULTI_POINT,
+    MULTI_POLYGON,
+    POINT,
+    POLYGON,
+)
+
+# Nesting depth of the positions in the coordinates of each geometry type.
+POSITION_DEPTHS = {
+    POINT: 0,
+    MULTI_POINT: 1,
+    LINE_STRING: 1,
+    MULTI_LINE_STRING: 2,
+    POLYGON: 2,
+    MULTI_POLYGON: 3,
+}
+
+
+def check_limits(**limits: int | None) -> None:
+    """Check the size limit options of a schema.
+
+    Args:
+        **limits: Limits by name; None disables a limit.
+
+    Raises:
+        ValueError: If a limit is not a positive integer.
+    """
+    for name, limit in limits.items():
+        if limit is not None and (type(limit) is not int or limit < 1):
+            raise ValueError(f"{name} must be a positive integer or None, not {limit!r}.")
+
+
+def checked(
+    items: typing.Iterable[typing.Any], check: typing.Callable[[typing.Any], None]
+) -> typing.Iterator[typing.Any]:
+    """Yield items as they are decoded, passing each one to ``check`` first."""
+    for item in items:
+        check(item)
+        yield item
+
+
+def exceeded(message: str) -> ValidationError:
+    """Build the error raised for input over a size limit."""
+    return ValidationError({"_schema": [message]})
+
+
+def count_positions(coordinates: typing.Any, depth: int) -> int:
+    """Count the positions of a coordinates array.
+
+    Malformed arrays are counted as far as they are lists; schema
+    validation reports them.
+
+    Args:
+        coordinates: The "coordinates" member of a geometry.
+        depth: Nesting depth of the positions (see ``POSITION_DEPTHS``).
+
+    Returns:
+        The number of positions.
+    """
+    if depth == 0:
+        return 1
+    parts = [coordinates]
+    for _ in range(depth - 1):
+        parts = [part for items in parts if type(items) is list for part in items]
+    return sum(len(items) for items in parts if type(items) is list)
+
+
+class InputLimits:
+    """Running counts of a document checked against size limits.
+
+    One instance is used per load. Objects are passed to :meth:`check` (or
+    features to :meth:`check_feature`) as they are decoded.
+
+    Attributes:
+        max_features: Maximum number of Features, counting the elements of
+            the "features" of FeatureCollections.
+        max_vertices_per_geometry: Maximum number of positions of a single
+            geometry (each member of a GeometryCollection counting
+            separately).
+        max_total_vertices: Maximum number of positions in the document.
+        max_properties: Maximum number of members of the "properties" of a
+            Feature.
+        features: Number of Features counted so far.
+        vertices: Number of positions counted so far.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_features: int | None = None,
+        max_vertices_per_geometry: int | None = None,
+        max_total_vertices: int | None = None,
+        max_properties: int | None = None,
+    ):
+        """Initialize InputLimits.
+
+        Args:
+            max_features: Maximum number of Features, or None.
+            max_vertices_per_geometry: Maximum number of positions of a
+                geometry, or None.
+            max_total_vertices: Maximum number of positions, or None.
+            max_properties: Maximum number of properties of a Feature, or
+                None.
+        """
+        self.max_features = max_features
+        self.max_vertices_per_geometry = max_vertices_per_geometry
+        self.max_total_vertices = max_total_vertices
+        self.max_properties = max_properties
+        self.features = 0
+        self.vertices = 0
+
+    def check(self, obj: typing.Any) -> None:
+        """Count a decoded GeoJSON object.
+
+        Args:
+            obj: Any GeoJSON object. Objects of unknown type are not counted.
+
+        Raises:
+            ValidationError: If a limit is exceeded.
+        """
+        if not isinstance(obj, dict):
+            return
+        object_type = obj.get("type")
+        if object_type == FEATURE_COLLECTION:
+            features = obj.get("features")
+            if type(features) is list:
+                self.count_features(len(features))
+                for feature in features:
+                    self._check_feature_members(feature)
+        elif object_type == FEATURE:
+            self.check_feature(obj)
+        else:
+            self.check_geometry(obj)
+
+    def check_feature(self, feature: typing.Any) -> None:
+        """Count one Feature, or one element of the "features" of a collection.
+
+        Raises:
+            ValidationError: If a limit is exceeded.
+        """
+        self.count_features(1)
+        self._check_feature_members(feature)
+
+    def _check_feature_members(self, feature: typing.Any) -> None:
+        if not isinstance(feature, dict):
+            return
+        properties = feature.get("properties")
+        if (
+            self.max_properties is not None
+            and isinstance(properties, dict)
+            and len(properties) > self.max_properties
+        ):
+            raise exceeded(f"Feature has more than max_properties ({self.max_properties}).")
+        self.check_geometry(feature.get("geometry"))
+
+    def count_features(self, count: int) -> None:
+        """Add ``count`` Features.
+
+        Raises:
+            ValidationError: If ``max_features`` is exceeded.
+        """
+        self.features += count
+        if self.max_features is not None and self.features > self.max_features:
+            raise exceeded(f"Input has more than max_features ({self.max_features}).")
+
+    def check_geometry(self, geometry: typing.Any) -> None:
+        """Count the positions of a geometry, walking GeometryCollections.
+
+        Raises:
+            ValidationError: If a vertex limit is exceeded.
+        """
+        stack = [geometry]
+        while stack:
+            geometry = stack.pop()
+            if not isinstance(geometry, dict):
+                continue
+            object_type = geometry.get("type")
+            if object_type == GEOMETRY_COLLECTION:
+                members = geometry.get("geometries")
+                if type(members) is list:
+                    stack.extend(reversed(members))
+                continue
+            depth = POSITION_DEPTHS.get(object_type)  # type: ignore[arg-type]
+            if depth is None or "coordinates" not in geometry:
+                continue
+            count = count_positions(geometry["coordinates"], depth)
+            if (
+                self.max_vertices_per_geometry is not None
+                and count > self.max_vertices_per_geometry
+            ):
+                raise exceeded(
+                    f"Geometry has more than max_vertices_per_geometry "
+                    f"({self.max_vertices_per_geometry}) positions."
+                )
+            self.vertices += count
+            if self.max_total_vertices is not None and self.vertices > self.max_total_vertices:
+                raise exceeded(
+                    f"Input has more than max_total_vertices ({self.max_total_vertices}) positions."
+                )
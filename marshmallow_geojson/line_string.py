@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from marshmallow import pre_load
+import typing
+
+from marshmallow import post_dump, post_load, pre_load
 from marshmallow.fields import Float, List, Str
 from marshmallow.validate import OneOf
 
-from ._base import BaseSchema
+from ._base import BaseSchema, Coordinates
+from ._clip import cut_antimeridian
 from .object_type import LINE_STRING
 from .validate import Bbox, LineStringCoordinates, NoFeatureMembers
 
@@ -23,6 +26,8 @@ class LineStringSchema(BaseSchema):
         coordinates: An array of two or more coordinate positions that form a line.
             Each position is [longitude, latitude] or [longitude, latitude, altitude].
         bbox: Optional bounding box array.
+        split_antimeridian: Whether lines crossing the antimeridian are cut
+            on load and dump.
     """
 
     type = Str(
@@ -38,8 +43,8 @@ class LineStringSchema(BaseSchema):
         },
     )
 
-    coordinates = List(
-        List(
+    coordinates = Coordinates(
+        Coordinates(
             Float(),
             required=True,
         ),
@@ -72,6 +77,19 @@ class LineStringSchema(BaseSchema):
         },
     )
 
+    def __init__(self, *, split_antimeridian: bool = False, **kwargs: typing.Any):
+        """Initialize LineStringSchema.
+
+        Args:
+            split_antimeridian: Whether to cut lines crossing the antimeridian
+                on load and dump (RFC 7946 Section 3.1.9). A segment between
+                positions more than 180 degrees of longitude apart is cut at
+                longitude 180 and -180, and the parts are returned as a MultiLineString.
+            **kwargs: Additional keyword arguments passed to the base schema.
+        """
+        super().__init__(**kwargs)
+        self.split_antimeridian = split_antimeridian
+
     @pre_load
     def validate_coordinates(self, data, **kwargs):
         """Validate coordinate values and check for forbidden members.
@@ -88,3 +106,29 @@ class LineStringSchema(BaseSchema):
         """
         validator = NoFeatureMembers(geometry_type_name="LineString")
         return self.validate_geometry_data(data, type_validator=validator)
+
+    @post_load
+    def normalize_loaded(self, data, **kwargs):
+        """Cut the line at the antimeridian if ``split_antimeridian`` is set.
+
+        Args:
+            data: Deserialized data dictionary.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The data dictionary, or the cut geometry.
+        """
+        return cut_antimeridian(data) if self.split_antimeridian else data
+
+    @post_dump
+    def normalize_dumped(self, data, **kwargs):
+        """Cut the dumped line at the antimeridian if ``split_antimeridian`` is set.
+
+        Args:
+            data: Serialized data dictionary.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The data dictionary, or the cut geometry.
+        """
+        return cut_antimeridian(data) if self.split_antimeridian else data
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from marshmallow import pre_load
+import typing
+
+from marshmallow import post_dump, post_load, pre_load
 from marshmallow.fields import Float, List, Str
 from marshmallow.validate import OneOf
 
-from ._base import BaseSchema
+from ._base import BaseSchema, Coordinates
+from ._clip import cut_antimeridian
 from .object_type import MULTI_LINE_STRING
 from .validate import Bbox, LineStringCoordinates, NoFeatureMembers
 
@@ -23,6 +26,8 @@ class MultiLineStringSchema(BaseSchema):
         coordinates: An array of LineString coordinate arrays, where each inner
             array contains two or more positions.
         bbox: Optional bounding box array.
+        split_antimeridian: Whether lines crossing the antimeridian are cut
+            on load and dump.
     """
 
     type = Str(
@@ -38,9 +43,9 @@ class MultiLineStringSchema(BaseSchema):
         },
     )
 
-    coordinates = List(
-        List(
-            List(
+    coordinates = Coordinates(
+        Coordinates(
+            Coordinates(
                 Float(),
                 required=True,
             ),
@@ -75,6 +80,19 @@ class MultiLineStringSchema(BaseSchema):
         },
     )
 
+    def __init__(self, *, split_antimeridian: bool = False, **kwargs: typing.Any):
+        """Initialize MultiLineStringSchema.
+
+        Args:
+            split_antimeridian: Whether to cut lines crossing the antimeridian
+                on load and dump (RFC 7946 Section 3.1.9). A segment between
+                positions more than 180 degrees of longitude apart is cut at
+                longitude 180 and -180, and the parts are kept as separate lines.
+            **kwargs: Additional keyword arguments passed to the base schema.
+        """
+        super().__init__(**kwargs)
+        self.split_antimeridian = split_antimeridian
+
     @pre_load
     def validate_coordinates(self, data, **kwargs):
         """Validate coordinate values and check for forbidden members.
@@ -91,3 +109,29 @@ class MultiLineStringSchema(BaseSchema):
         """
         validator = NoFeatureMembers(geometry_type_name="MultiLineString")
         return self.validate_geometry_data(data, type_validator=validator)
+
+    @post_load
+    def normalize_loaded(self, data, **kwargs):
+        """Cut the line at the antimeridian if ``split_antimeridian`` is set.
+
+        Args:
+            data: Deserialized data dictionary.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The data dictionary, or the cut geometry.
+        """
+        return cut_antimeridian(data) if self.split_antimeridian else data
+
+    @post_dump
+    def normalize_dumped(self, data, **kwargs):
+        """Cut the dumped line at the antimeridian if ``split_antimeridian`` is set.
+
+        Args:
+            data: Serialized data dictionary.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The data dictionary, or the cut geometry.
+        """
+        return cut_antimeridian(data) if self.split_antimeridian else data
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from marshmallow import pre_load
+import typing
+from typing import Literal
+
+from marshmallow import ValidationError, pre_load, types
 from marshmallow.fields import Float, List, Str
 from marshmallow.validate import Length, OneOf
 
-from ._base import BaseSchema
+from ._base import BaseSchema, Coordinates, load_items, position_matrix
 from .object_type import MULTI_POINT
 from .validate import Bbox, NoFeatureMembers
 
@@ -23,6 +26,8 @@ class MultiPointSchema(BaseSchema):
         coordinates: An array of coordinate positions, each representing a point.
             Each position is [longitude, latitude] or [longitude, latitude, altitude].
         bbox: Optional bounding box array.
+        coordinate_array: Whether coordinates are loaded into a coordinate
+            matrix instead of nested lists.
     """
 
     type = Str(
@@ -38,8 +43,8 @@ class MultiPointSchema(BaseSchema):
         },
     )
 
-    coordinates = List(
-        List(
+    coordinates = Coordinates(
+        Coordinates(
             Float(),
             required=True,
             validate=Length(min=2, max=3, error="Coordinates must have 2 or 3 elements"),
@@ -72,6 +77,70 @@ class MultiPointSchema(BaseSchema):
         },
     )
 
+    def __init__(self, *, coordinate_array: bool = False, **kwargs: typing.Any):
+        """Initialize MultiPointSchema.
+
+        Args:
+            coordinate_array: Whether to load the coordinates into a float64
+                memoryview of shape ``(n, 2)`` or ``(n, 3)`` (see
+                :meth:`PointSchema.load_many_array`) instead of nested
+                lists. The positions are validated all at once. Dumping
+                accepts either form.
+            **kwargs: Additional keyword arguments passed to the base schema.
+        """
+        super().__init__(**kwargs)
+        self.coordinate_array = coordinate_array
+
+    def load(
+        self,
+        data: typing.Any,
+        *,
+        many: bool | None = None,
+        partial: bool | types.StrSequenceOrSet | None = None,
+        unknown: Literal["exclude", "include", "raise"] | None = None,
+    ):
+        """Deserialize and validate a MultiPoint.
+
+        Args:
+            data: MultiPoint(s) to deserialize.
+            many: Whether to deserialize multiple MultiPoints. If None, uses
+                the schema's default.
+            partial: Whether to allow partial data.
+            unknown: How to handle unknown fields.
+
+        Returns:
+            Deserialized and validated data.
+
+        Raises:
+            ValidationError: If validation fails.
+        """
+        many = self.many if many is None else bool(many)
+        if not self.coordinate_array or (many and not isinstance(data, list)):
+            return super().load(data, many=many, partial=partial, unknown=unknown)
+        if many:
+            result, errors = load_items(
+                lambda item: self.load(item, many=False, partial=partial, unknown=unknown), data
+            )
+            if errors:
+                raise ValidationError(errors, valid_data=result)
+            return result
+
+        if (
+            self.only is None
+            and not self.exclude
+            and type(data) is dict
+            and len(data) == 2
+            and data.get("type") == MULTI_POINT
+        ):
+            matrix = position_matrix(data.get("coordinates"))
+            if matrix is not None:
+                return {"type": MULTI_POINT, "coordinates": matrix}
+        # Let regular loading report errors and handle other members.
+        result = super().load(data, partial=partial, unknown=unknown)
+        if "coordinates" in result and "coordinates" in self.load_fields:
+            result["coordinates"] = position_matrix(result["coordinates"])
+        return result
+
     @pre_load
     def validate_coordinates(self, data, **kwargs):
         """Validate coordinate values and check for forbidden members.
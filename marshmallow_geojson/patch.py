@@ -0,0 +1,399 @@
+"""JSON Patch (RFC 6902) support for GeoJSON documents.
+
+This module applies JSON Patch operations to already validated GeoJSON
+documents and works out which GeoJSON objects were touched, so that only
+those objects need to be validated again.
+
+The input document is never modified: containers along each patched path are
+copied, while untouched subtrees are shared with the input document.
+
+References:
+    https://www.rfc-editor.org/rfc/rfc6902.html
+    https://www.rfc-editor.org/rfc/rfc6901.html
+"""
+
+from __future__ import annotations
+
+import copy
+import typing
+
+from marshmallow import ValidationError
+
+from .object_type import FEATURE, FEATURE_COLLECTION, GEOMETRY_COLLECTION
+
+Token = str | int
+Path = tuple[Token, ...]
+
+# Kinds of GeoJSON objects a patched path can resolve to.
+ROOT = "root"
+FEATURE_MEMBER = "feature"
+FEATURE_GEOMETRY = "geometry"
+COLLECTION_MEMBER = "member"
+
+# Members holding arrays of GeoJSON objects, keyed by the parent object type.
+MEMBER_LISTS = {
+    FEATURE_COLLECTION: ("features", FEATURE_MEMBER),
+    GEOMETRY_COLLECTION: ("geometries", COLLECTION_MEMBER),
+}
+
+OPERATIONS = ("add", "remove", "replace", "move", "copy", "test")
+
+
+def patch_error(index: int, message: str) -> ValidationError:
+    """Build the error raised for an invalid patch operation.
+
+    Args:
+        index: Index of the operation in the patch.
+        message: Description of the problem.
+
+    Returns:
+        ValidationError with the message under the "_schema" key.
+    """
+    return ValidationError({"_schema": f"JSON Patch operation {index}: {message}"})
+
+
+def parse_pointer(pointer: typing.Any, index: int) -> list[str]:
+    """Split a JSON Pointer into its unescaped reference tokens.
+
+    Args:
+        pointer: JSON Pointer string (e.g. "/features/0/geometry").
+        index: Index of the operation in the patch (for error messages).
+
+    Returns:
+        List of reference tokens.
+
+    Raises:
+        ValidationError: If the pointer is not a valid JSON Pointer.
+    """
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise patch_error(index, f"invalid JSON Pointer {pointer!r}.")
+    if not pointer:
+        return []
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def list_index(token: str, length: int, *, allow_end: bool) -> int | None:
+    """Resolve a reference token to an array index.
+
+    Args:
+        token: Reference token.
+        length: Length of the array.
+        allow_end: Whether the index may equal ``length`` (or be "-"), as
+            allowed for "add" operations.
+
+    Returns:
+        The array index, or None if the token is not a valid index.
+    """
+    if token == "-":
+        return length if allow_end else None
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        return None
+    idx = int(token)
+    limit = length if allow_end else length - 1
+    return idx if idx <= limit else None
+
+
+class PatchedDocument:
+    """A GeoJSON document being modified by a JSON Patch.
+
+    Keeps track of the paths touched by each operation, adjusting them when
+    later operations insert into or remove from arrays.
+
+    Args:
+        document: The validated document to patch. It is not modified.
+    """
+
+    def __init__(self, document: typing.Any):
+        self._holder = [document]
+        self._copied: set[int] = set()
+        self.touched: list[Path] = []
+
+    @property
+    def document(self) -> typing.Any:
+        """The patched document."""
+        return self._holder[0]
+
+    def _resolve(self, tokens: list[str], index: int, *, allow_end: bool = False) -> Path:
+        """Resolve reference tokens into a path of dict keys and list indices.
+
+        The last token is resolved with ``allow_end`` and does not need to
+        exist in the document.
+        """
+        path: list[Token] = []
+        value = self.document
+        for position, token in enumerate(tokens):
+            last = position == len(tokens) - 1
+            if isinstance(value, dict):
+                if not last and token not in value:
+                    raise patch_error(index, f"path {self._pointer(tokens)!r} does not exist.")
+                path.append(token)
+                value = value.get(token)
+            elif isinstance(value, list):
+                idx = list_index(token, len(value), allow_end=allow_end and last)
+                if idx is None:
+                    raise patch_error(index, f"path {self._pointer(tokens)!r} does not exist.")
+                path.append(idx)
+                value = value[idx] if idx < len(value) else None
+            else:
+                raise patch_error(index, f"path {self._pointer(tokens)!r} does not exist.")
+        return tuple(path)
+
+    @staticmethod
+    def _pointer(tokens: list[str]) -> str:
+        return "".join("/" + token.replace("~", "~0").replace("/", "~1") for token in tokens)
+
+    def _writable(self, path: Path) -> typing.Any:
+        """Return the container at ``path``, copying it and its ancestors once."""
+        parent: typing.Any = self._holder
+        key: Token = 0
+        for token in (*path, None):
+            child = parent[key]
+            if id(child) not in self._copied:
+                child = copy.copy(child)
+                parent[key] = child
+                self._copied.add(id(child))
+            if token is None:
+                return child
+            parent, key = child, token
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def get(self, path: Path) -> typing.Any:
+        """Return the value at a resolved path."""
+        value = self.document
+        for token in path:
+            value = value[token]
+        return value
+
+    def exists(self, path: Path) -> bool:
+        """Check whether a resolved path exists in the document."""
+        value = self.document
+        for token in path:
+            if isinstance(value, dict) and token in value:
+                value = value[token]
+            elif isinstance(value, list) and isinstance(token, int) and token < len(value):
+                value = value[token]
+            else:
+                return False
+        return True
+
+    def _is_member_array(self, path: Path) -> bool:
+        """Check whether ``path`` is the "features" or "geometries" array of its parent."""
+        if not path:
+            return False
+        parent = self.get(path[:-1])
+        if not isinstance(parent, dict):
+            return False
+        member = MEMBER_LISTS.get(typing.cast(str, parent.get("type")))
+        return member is not None and path[-1] == member[0]
+
+    def _shift(self, array: Path, idx: int, delta: int) -> None:
+        """Adjust touched paths after an insertion into or removal from an array."""
+        depth = len(array)
+        shifted = []
+        for path in self.touched:
+            if len(path) > depth and path[:depth] == array:
+                position = typing.cast(int, path[depth])
+                if position < idx:
+                    shifted.append(path)
+                    continue
+                if delta < 0 and position == idx:
+                    continue
+                path = (*array, position + delta, *path[depth + 1 :])
+            shifted.append(path)
+        self.touched = shifted
+
+    def add(self, path: Path, value: typing.Any) -> None:
+        """Add ``value`` at ``path`` (RFC 6902 Section 4.1)."""
+        if not path:
+            self._holder[0] = value
+            self.touched = [()]
+            return
+        container = self._writable(path[:-1])
+        key = path[-1]
+        if isinstance(container, list):
+            self._shift(path[:-1], typing.cast(int, key), 1)
+            container.insert(typing.cast(int, key), value)
+        else:
+            container[key] = value
+        self.touched.append(path)
+
+    def remove(self, path: Path) -> typing.Any:
+        """Remove and return the value at ``path`` (RFC 6902 Section 4.2)."""
+        container = self._writable(path[:-1])
+        key = path[-1]
+        value = container[key]
+        if isinstance(container, list):
+            self._shift(path[:-1], typing.cast(int, key), -1)
+            del container[typing.cast(int, key)]
+        else:
+            del container[key]
+        if not self._is_member_array(path[:-1]):
+            self.touched.append(path[:-1])
+        return value
+
+    def replace(self, path: Path, value: typing.Any) -> None:
+        """Replace the value at ``path`` (RFC 6902 Section 4.3)."""
+        if not path:
+            self._holder[0] = value
+            self.touched = [()]
+            return
+        container = self._writable(path[:-1])
+        container[path[-1]] = value
+        self.touched.append(path)
+
+    def apply(self, operation: typing.Any, index: int) -> None:
+        """Apply a single JSON Patch operation.
+
+        Args:
+            operation: The operation object.
+            index: Index of the operation in the patch (for error messages).
+
+        Raises:
+            ValidationError: If the operation is malformed, refers to a
+                missing location, or a "test" operation fails.
+        """
+        if not isinstance(operation, dict) or operation.get("op") not in OPERATIONS:
+            raise patch_error(index, f"invalid operation {operation!r}.")
+        op = operation["op"]
+        if "path" not in operation:
+            raise patch_error(index, 'missing "path" member.')
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise patch_error(index, 'missing "value" member.')
+        if op in ("move", "copy") and "from" not in operation:
+            raise patch_error(index, 'missing "from" member.')
+
+        tokens = parse_pointer(operation["path"], index)
+        if op == "add":
+            self.add(self._resolve(tokens, index, allow_end=True), operation["value"])
+            return
+
+        if op in ("move", "copy"):
+            from_tokens = parse_pointer(operation["from"], index)
+            source = self._resolve(from_tokens, index)
+            if not self.exists(source):
+                raise patch_error(index, f"path {operation['from']!r} does not exist.")
+            if op == "move":
+                if tokens[: len(from_tokens)] == from_tokens and len(tokens) > len(from_tokens):
+                    raise patch_error(index, "cannot move a value into one of its children.")
+                if tokens == from_tokens:
+                    return
+                value = self.remove(source)
+            else:
+                value = copy.deepcopy(self.get(source))
+            self.add(self._resolve(tokens, index, allow_end=True), value)
+            return
+
+        path = self._resolve(tokens, index)
+        if not self.exists(path):
+            raise patch_error(index, f"path {operation['path']!r} does not exist.")
+        if op == "remove":
+            if not path:
+                raise patch_error(index, "cannot remove the document root.")
+            self.remove(path)
+        elif op == "replace":
+            self.replace(path, operation["value"])
+        elif self.get(path) != operation["value"]:
+            raise patch_error(index, f"test failed for path {operation['path']!r}.")
+
+    def validation_units(self) -> list[tuple[Path, str]]:
+        """Work out which GeoJSON objects need to be validated again.
+
+        Each touched path is mapped to the innermost GeoJSON object containing
+        it: the document root, a feature of a FeatureCollection, the geometry
+        of a Feature, or a member of a GeometryCollection. Replacing a whole
+        "features" or "geometries" array validates its parent, while removing
+        one of its members leaves nothing to validate. Units nested inside
+        another unit are dropped.
+
+        Returns:
+            Sorted list of ``(path, kind)`` tuples.
+        """
+        units: dict[Path, str] = {}
+        for path in self.touched:
+            unit = self._unit(path)
+            if unit is not None:
+                units[unit[0]] = unit[1]
+
+        result: list[tuple[Path, str]] = []
+        for path in sorted(units, key=len):
+            if not any(path[: len(parent)] == parent for parent, _ in result):
+                result.append((path, units[path]))
+        return result
+
+    def _unit(self, path: Path) -> tuple[Path, str] | None:
+        """Return the innermost GeoJSON object containing ``path``."""
+        unit: tuple[Path, str] = ((), ROOT)
+        value = self.document
+        position = 0
+        while position < len(path):
+            token = path[position]
+            if isinstance(value, dict):
+                member = MEMBER_LISTS.get(typing.cast(str, value.get("type")))
+                if member is not None and token == member[0]:
+                    members = value.get(token)
+                    if position + 1 == len(path):
+                        # The members array itself was touched.
+                        return unit
+                    idx = path[position + 1]
+                    if not isinstance(members, list) or not isinstance(idx, int):
+                        return unit
+                    if idx >= len(members):
+                        return None
+                    position += 2
+                    unit = (path[:position], member[1])
+                    value = members[idx]
+                    continue
+                if value.get("type") == FEATURE and token == "geometry" and token in value:
+                    position += 1
+                    unit = (path[:position], FEATURE_GEOMETRY)
+                    value = value[token]
+                    continue
+                if token not in value:
+                    return unit
+                value = value[token]
+            elif isinstance(value, list) and isinstance(token, int) and token < len(value):
+                value = value[token]
+            else:
+                return unit
+            position += 1
+        return unit
+
+    def set(self, path: Path, value: typing.Any) -> None:
+        """Store a validated value at ``path`` without recording it as touched."""
+        if not path:
+            self._holder[0] = value
+            return
+        self._writable(path[:-1])[path[-1]] = value
+
+
+def nest_errors(path: Path, messages: typing.Any) -> typing.Any:
+    """Nest error messages under the keys of ``path``.
+
+    Args:
+        path: Path of the object the messages belong to.
+        messages: Error messages of the object.
+
+    Returns:
+        Error messages nested like marshmallow's own error dictionaries.
+    """
+    for token in reversed(path):
+        messages = {token: messages}
+    return messages
+
+
+def merge_errors(errors: dict, messages: typing.Any) -> dict:
+    """Merge nested error dictionaries in place.
+
+    Args:
+        errors: Error dictionary to merge into.
+        messages: Error dictionary to merge.
+
+    Returns:
+        The merged error dictionary.
+    """
+    for key, value in messages.items():
+        if isinstance(value, dict) and isinstance(errors.get(key), dict):
+            merge_errors(errors[key], value)
+        else:
+            errors[key] = value
+    return errors
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from marshmallow import pre_load
+import math
+import typing
+from typing import Literal
+
+from marshmallow import ValidationError, pre_load
 from marshmallow.fields import Float, List, Str
 from marshmallow.validate import Length, OneOf
 
-from ._base import BaseSchema
+from ._base import BaseSchema, Coordinates, position_matrix
 from .object_type import POINT
 from .validate import Bbox, NoFeatureMembers
 
@@ -37,7 +41,7 @@ class PointSchema(BaseSchema):
         },
     )
 
-    coordinates = List(
+    coordinates = Coordinates(
         Float(),
         required=True,
         validate=Length(min=2, max=3, error="Coordinates must have 2 or 3 elements"),
@@ -84,3 +88,89 @@ class PointSchema(BaseSchema):
         """
         validator = NoFeatureMembers(geometry_type_name="Point")
         return self.validate_geometry_data(data, type_validator=validator)
+
+    def load_many_array(
+        self,
+        data: typing.Sequence[typing.Any],
+        *,
+        unknown: Literal["exclude", "include", "raise"] | None = None,
+    ) -> memoryview[float]:
+        """Validate a list of Points into a single coordinate matrix.
+
+        Plain Points (only "type" and "coordinates") are validated together
+        by :func:`position_matrix`, without loading every Point through the
+        schema. If that fails, or any Point has other members, every Point
+        is loaded with :meth:`load` instead, so that errors are the same.
+        Other members (e.g. "bbox") are not part of the result.
+
+        Args:
+            data: Points to validate.
+            unknown: How to handle unknown fields.
+
+        Returns:
+            A float64 memoryview of shape ``(n, 2)``, or ``(n, 3)`` if any
+            Point has an altitude (the others then hold NaN). It can be
+            passed to ``numpy.asarray`` without copying. An empty list gives
+            an empty one-dimensional view.
+
+        Raises:
+            ValidationError: If any Point is invalid, with errors keyed by
+                index.
+        """
+        matrix = position_matrix(
+            [
+                item.get("coordinates")
+                if type(item) is dict and len(item) == 2 and item.get("type") == POINT
+                else None
+                for item in data
+            ]
+        )
+        if matrix is not None:
+            return matrix
+
+        positions = []
+        errors = {}
+        for idx, item in enumerate(data):
+            try:
+                positions.append(self.load(item, unknown=unknown)["coordinates"])
+            except ValidationError as error:
+                errors[idx] = error.messages
+        if errors:
+            raise ValidationError(errors)
+        # Loaded coordinates are valid positions.
+        return typing.cast("memoryview[float]", position_matrix(positions))
+
+
+def plain_point(data: typing.Any) -> dict[str, typing.Any] | None:
+    """Load a plain Point without going through :class:`PointSchema`.
+
+    Only objects with exactly the "type" and "coordinates" members and two or
+    three finite numeric coordinates within range are accepted; for those,
+    the result equals ``PointSchema().load(data)``.
+
+    Args:
+        data: Input data.
+
+    Returns:
+        The loaded Point, or None if the object needs the full schema
+        (for its errors or other members).
+    """
+    if type(data) is not dict or len(data) != 2 or data.get("type") != POINT:
+        return None
+    coordinates = data.get("coordinates")
+    if type(coordinates) is not list or not 2 <= len(coordinates) <= 3:
+        return None
+    position = []
+    for value in coordinates:
+        if type(value) is not float and type(value) is not int:
+            return None
+        try:
+            value = float(value)
+        except OverflowError:
+            return None
+        if not math.isfinite(value):
+            return None
+        position.append(value)
+    if not (-180 <= position[0] <= 180 and -90 <= position[1] <= 90):
+        return None
+    return {"type": POINT, "coordinates": position}
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from marshmallow import pre_load
+import typing
+from typing import Literal
+
+from marshmallow import ValidationError, post_dump, post_load, pre_load, validates_schema
 from marshmallow.fields import Float, List, Str
 from marshmallow.validate import OneOf
 
-from ._base import BaseSchema
-from .object_type import POLYGON
+from ._base import BaseSchema, Coordinates
+from ._clip import cut_antimeridian
+from .object_type import MULTI_POLYGON, POLYGON
 from .validate import Bbox, LinearRing, NoFeatureMembers, PolygonRings
+from .validity import BASIC, check_validity_mode, multi_polygon_error, polygon_error
+from .winding import rewind
 
 
 class PolygonSchema(BaseSchema):
@@ -26,6 +32,11 @@ class PolygonSchema(BaseSchema):
         coordinates: An array of linear rings. The first ring is the exterior
             boundary, subsequent rings are interior boundaries (holes).
         bbox: Optional bounding box array.
+        rewind: Whether rings are oriented following the right-hand rule
+            on load and dump.
+        validity: Validity mode, "basic" or "strict".
+        split_antimeridian: Whether geometries crossing the antimeridian are
+            cut on load and dump.
     """
 
     type = Str(
@@ -41,9 +52,9 @@ class PolygonSchema(BaseSchema):
         },
     )
 
-    coordinates = List(
-        List(
-            List(
+    coordinates = Coordinates(
+        Coordinates(
+            Coordinates(
                 Float(),
                 required=True,
             ),
@@ -82,6 +93,42 @@ class PolygonSchema(BaseSchema):
         },
     )
 
+    def __init__(
+        self,
+        *,
+        rewind: bool = False,
+        validity: Literal["basic", "strict"] = BASIC,
+        split_antimeridian: bool = False,
+        **kwargs: typing.Any,
+    ):
+        """Initialize PolygonSchema.
+
+        Args:
+            rewind: Whether to orient the rings following the right-hand rule
+                (RFC 7946 Section 3.1.6) on load and dump: exterior rings
+                counterclockwise, holes clockwise. Rings are reversed in
+                place.
+            validity: Validity mode. In "basic" mode rings are only checked
+                for length and closure. In "strict" mode they are also
+                checked for self-intersections, holes outside the exterior
+                ring or inside another hole
+                (see :mod:`marshmallow_geojson.validity`). With
+                ``split_antimeridian`` the cut geometry is checked.
+            split_antimeridian: Whether to cut polygons crossing the
+                antimeridian on load and dump (RFC 7946 Section 3.1.9). Their
+                rings are clipped at longitude 180 and -180, and the pieces
+                returned as a MultiPolygon with a recomputed bounding box.
+            **kwargs: Additional keyword arguments passed to the base schema.
+
+        Raises:
+            ValueError: If ``validity`` is invalid.
+        """
+        super().__init__(**kwargs)
+        check_validity_mode(validity)
+        self.rewind = rewind
+        self.validity = validity
+        self.split_antimeridian = split_antimeridian
+
     @pre_load
     def validate_coordinates(self, data, **kwargs):
         """Validate coordinate values and check for forbidden members.
@@ -98,3 +145,71 @@ class PolygonSchema(BaseSchema):
         """
         validator = NoFeatureMembers(geometry_type_name="Polygon")
         return self.validate_geometry_data(data, type_validator=validator)
+
+    @validates_schema
+    def validate_validity(self, data, **kwargs):
+        """Check the geometry validity in "strict" mode.
+
+        Args:
+            data: Deserialized data dictionary.
+            **kwargs: Additional keyword arguments.
+
+        Raises:
+            ValidationError: If the Polygon is not valid. The message names
+                the offending rings and vertices by their index.
+        """
+        if self.validity == BASIC or "coordinates" not in data:
+            return
+        geometry = data
+        if self.split_antimeridian:
+            # The cut geometry replaces the loaded data, so that it is not cut
+            # again on post-load.
+            geometry = cut_antimeridian(data)
+            data.update(geometry)
+        if geometry["type"] == MULTI_POLYGON:
+            error = multi_polygon_error(geometry["coordinates"])
+        else:
+            error = polygon_error(geometry["coordinates"])
+        if error is not None:
+            raise ValidationError(error, field_name="coordinates")
+
+    def normalize(self, data: dict[str, typing.Any], *, cut: bool = True) -> dict[str, typing.Any]:
+        """Cut at the antimeridian and orient the rings, as configured.
+
+        Args:
+            data: Loaded or dumped data dictionary.
+            cut: Whether the data still has to be cut. Loaded data was
+                already cut by the "strict" validity check.
+
+        Returns:
+            The data dictionary, or the cut geometry.
+        """
+        if self.split_antimeridian and cut:
+            data = cut_antimeridian(data)
+        return rewind(data) if self.rewind else data
+
+    @post_load
+    def normalize_loaded(self, data, **kwargs):
+        """Apply the ``split_antimeridian`` and ``rewind`` options on load.
+
+        Args:
+            data: Deserialized data dictionary.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The data dictionary.
+        """
+        return self.normalize(data, cut=self.validity == BASIC)
+
+    @post_dump
+    def normalize_dumped(self, data, **kwargs):
+        """Apply the ``split_antimeridian`` and ``rewind`` options on dump.
+
+        Args:
+            data: Serialized data dictionary.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The data dictionary.
+        """
+        return self.normalize(data)
@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
-from ._base import BaseSchema
+import functools
+import math
+import typing
+from collections.abc import Callable, Mapping
+
+from marshmallow import EXCLUDE, INCLUDE, Schema, ValidationError, missing
+from marshmallow.fields import Boolean, Dict, Field, Float, Integer, Raw, String
+
+from ._base import BaseSchema, shared_schema
 
 
 class PropertiesSchema(BaseSchema):
@@ -35,3 +43,199 @@ class PropertiesSchema(BaseSchema):
 
     class Meta:
         unknown = "include"
+
+
+# Input classes accepted unchanged by the scalar fields, by exact field class.
+JSON_TYPES = frozenset({str, int, float, bool, list, dict})
+FAST_TYPES: dict[type[Field], frozenset[type]] = {
+    String: frozenset({str}),
+    Integer: frozenset({int}),
+    Float: frozenset({float}),
+    Boolean: frozenset({bool}),
+    Raw: JSON_TYPES,
+}
+
+PropertiesLoader = Callable[[Mapping[str, typing.Any]], dict[str, typing.Any]]
+
+
+def fast_types(field: Field) -> tuple[frozenset[type], Callable[[typing.Any], bool] | None]:
+    """Return the input classes a field returns unchanged, and an extra check.
+
+    Values of these classes skip :meth:`Field.deserialize`. Fields with
+    validators or processors, string output or subclassed field classes
+    get no fast path.
+    """
+    types = FAST_TYPES.get(type(field))
+    if (
+        types is None
+        or field.validators
+        or getattr(field, "pre_load", None)
+        or getattr(field, "post_load", None)
+        or getattr(field, "as_string", False)
+    ):
+        return frozenset(), None
+    if field.allow_none:
+        types = types | {type(None)}
+    if isinstance(field, Float) and not field.allow_nan:
+        return types, lambda value: value is None or math.isfinite(value)
+    return types, None
+
+
+@functools.cache
+def compile_properties(schema_class: type[PropertiesSchema]) -> PropertiesLoader:
+    """Compile a properties schema into a single validation function.
+
+    The declared fields are turned into a flat plan once per schema class.
+    Values whose class is the output type of a plain ``String``,
+    ``Integer``, ``Float``, ``Boolean`` or ``Raw`` field are accepted with
+    one dictionary lookup and one class check; anything else, including
+    missing and invalid values, goes through :meth:`Field.deserialize`, so
+    results and error messages match :meth:`Schema.load`. Unknown keys follow
+    the schema's ``unknown`` option.
+
+    Schemas with hooks (``@validates``, ``@pre_load``, ...) or dotted
+    ``attribute`` names are loaded with :meth:`Schema.load` instead.
+
+    Args:
+        schema_class: The :class:`PropertiesSchema` subclass.
+
+    Returns:
+        A function loading a properties mapping and raising
+        :class:`ValidationError` with messages keyed by property name.
+    """
+    schema = schema_class()
+    plan = []
+    for name, field in schema.load_fields.items():
+        attribute = field.attribute or name
+        if "." in attribute:
+            return schema.load
+        key = field.data_key if field.data_key is not None else name
+        plan.append((key, attribute, field, *fast_types(field)))
+    if any(schema._hooks.values()):
+        return schema.load
+
+    known = frozenset(key for key, *_ in plan)
+    unknown = schema.unknown
+    unknown_error = schema.error_messages["unknown"]
+
+    def load(data: Mapping[str, typing.Any]) -> dict[str, typing.Any]:
+        result: dict[str, typing.Any] = {}
+        errors: dict[str, typing.Any] = {}
+        get = data.get
+        for key, attribute, field, types, check in plan:
+            value = get(key, missing)
+            if value.__class__ in types and (check is None or check(value)):
+                result[attribute] = value
+                continue
+            try:
+                value = field.deserialize(value, key, data)
+            except ValidationError as error:
+                errors[key] = error.messages
+            else:
+                if value is not missing:
+                    result[attribute] = value
+
+        if unknown != EXCLUDE:
+            for key in data.keys() - known:
+                if unknown == INCLUDE:
+                    result[key] = data[key]
+                else:
+                    errors[key] = [unknown_error]
+
+        if errors:
+            raise ValidationError(errors, valid_data=result)
+        return result
+
+    return load
+
+
+@functools.cache
+def properties_dumper(schema_class: type[PropertiesSchema]) -> PropertiesLoader:
+    """Return a function dumping properties with a properties schema.
+
+    Declared fields are dumped with :meth:`Schema.dump`, which serializes
+    their values and renames attributes back to their data keys. With the
+    schema's ``unknown`` set to ``"include"``, the undeclared properties
+    kept by loading are dumped as they are.
+
+    Args:
+        schema_class: The :class:`PropertiesSchema` subclass.
+
+    Returns:
+        A function dumping a properties mapping.
+    """
+    schema = schema_class()
+    if schema.unknown != INCLUDE:
+        return schema.dump
+    declared = frozenset(
+        (field.attribute or name).split(".", 1)[0] for name, field in schema.fields.items()
+    )
+
+    def dump(data: Mapping[str, typing.Any]) -> dict[str, typing.Any]:
+        result = {key: value for key, value in data.items() if key not in declared}
+        result.update(schema.dump(data))
+        return result
+
+    return dump
+
+
+def properties_subclass(
+    schema_class: type,
+    properties_schema: type,
+    namespace: Callable[[], dict[str, typing.Any]] = dict,
+) -> type:
+    """Return the subclass of a schema built by its ``with_properties`` factory.
+
+    Subclasses are created once per schema class and properties schema, under
+    a lock, and are named after both, e.g. ``CityFeatureSchema`` for
+    ``CityPropertiesSchema``.
+
+    Args:
+        schema_class: The schema class, e.g. :class:`FeatureSchema`.
+        properties_schema: The :class:`PropertiesSchema` subclass.
+        namespace: Callable returning further class attributes of the
+            subclass, called once.
+
+    Returns:
+        The cached subclass, with ``properties_schema`` set.
+
+    Raises:
+        TypeError: If ``properties_schema`` is not a schema class.
+    """
+    if not (isinstance(properties_schema, type) and issubclass(properties_schema, Schema)):
+        raise TypeError(f"Expected a PropertiesSchema subclass, not {properties_schema!r}.")
+
+    def build() -> type:
+        prefix = properties_schema.__name__.removesuffix("Schema").removesuffix("Properties")
+        attributes = {
+            "__module__": schema_class.__module__,
+            "properties_schema": properties_schema,
+            **namespace(),
+        }
+        return type(schema_class)(prefix + schema_class.__name__, (schema_class,), attributes)
+
+    return shared_schema((schema_class, properties_schema), build)
+
+
+class PropertiesField(Dict):
+    """Field for the "properties" member of a Feature.
+
+    Behaves like :class:`marshmallow.fields.Dict`, unless the parent schema
+    has a ``properties_schema``: properties are then loaded with the
+    function compiled from it by :func:`compile_properties`, and dumped with
+    :func:`properties_dumper`.
+    """
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        schema_class = getattr(self.parent, "properties_schema", None)
+        if schema_class is None or value is None:
+            return super()._serialize(value, attr, obj, **kwargs)
+        return properties_dumper(schema_class)(value)
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        schema_class = getattr(self.parent, "properties_schema", None)
+        if schema_class is None:
+            return super()._deserialize(value, attr, data, **kwargs)
+        if not isinstance(value, Mapping):
+            raise self.make_error("invalid")
+        return compile_properties(schema_class)(value)
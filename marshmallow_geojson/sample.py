@@ -0,0 +1,177 @@
+"""Sampling-based validation helpers.
+
+In sampling mode only a seeded random sample of objects goes through full
+validation (coordinate values, linear rings, bounding boxes, ...). All other
+objects only get a structural check: their "type" must be known and they must
+not contain forbidden members (RFC 7946 Section 7.1). Objects that were not
+sampled are returned as given.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import typing
+
+from marshmallow import ValidationError
+
+from .object_type import (
+    FEATURE,
+    FEATURE_COLLECTION,
+    GEOMETRY_COLLECTION,
+    GeometryType,
+)
+from .validate import NoFeatureMembers, NoForbiddenMembers, NoGeometryMembers
+
+FULL: typing.Final = "full"
+SAMPLE: typing.Final = "sample"
+VALIDATION_MODES = (FULL, SAMPLE)
+
+GEOMETRY_TYPES = frozenset(geometry_type.value for geometry_type in GeometryType)
+
+MISSING_MESSAGE = "Missing data for required field."
+INVALID_INPUT_MESSAGE = "Invalid input type."
+
+
+def check_validation_mode(validation: str, sample_rate: float) -> None:
+    """Check the validation mode options of a schema.
+
+    Args:
+        validation: Validation mode, "full" or "sample".
+        sample_rate: Fraction of objects validated in "sample" mode.
+
+    Raises:
+        ValueError: If an option is invalid.
+    """
+    if validation not in VALIDATION_MODES:
+        raise ValueError(f"validation must be one of {VALIDATION_MODES}, not {validation!r}.")
+    if not 0 <= sample_rate <= 1:
+        raise ValueError(f"sample_rate must be between 0 and 1, not {sample_rate!r}.")
+
+
+def sample_indices(count: int, rate: float, seed: typing.Any = None) -> set[int]:
+    """Choose the indices of the objects that get full validation.
+
+    Args:
+        count: Total number of objects.
+        rate: Fraction of objects to sample. Any positive rate samples at
+            least one object.
+        seed: Seed for the random number generator.
+
+    Returns:
+        Set of sampled indices.
+    """
+    size = min(count, math.ceil(count * rate))
+    return set(random.Random(seed).sample(range(count), size))  # nosec B311
+
+
+def sample_report(total: int, sampled: set[int], errors: dict[int, typing.Any]) -> dict:
+    """Summarize a sampled validation run.
+
+    Args:
+        total: Total number of objects.
+        sampled: Indices of the objects that got full validation.
+        errors: Error messages of the sampled objects, keyed by index.
+
+    Returns:
+        Dictionary with the sampled indices, their errors, the observed error
+        rate and the number of invalid objects extrapolated to the whole input.
+    """
+    error_rate = len(errors) / len(sampled) if sampled else 0.0
+    return {
+        "total": total,
+        "sampled": sorted(sampled),
+        "errors": errors,
+        "error_rate": error_rate,
+        "estimated_errors": round(error_rate * total),
+    }
+
+
+def check_geometry_structure(geometry: typing.Any) -> None:
+    """Check the structure of a geometry object without validating coordinates.
+
+    Args:
+        geometry: Geometry object.
+
+    Raises:
+        ValidationError: If the geometry type is unknown or the geometry
+            contains forbidden members.
+    """
+    if not isinstance(geometry, dict):
+        raise ValidationError({"_schema": [INVALID_INPUT_MESSAGE]})
+    geometry_type = geometry.get("type")
+    if geometry_type not in GEOMETRY_TYPES:
+        raise ValidationError({"_schema": f"Unknown object class for {geometry_type}."})
+    NoFeatureMembers(geometry_type_name=geometry_type)(geometry)
+
+    if geometry_type == GEOMETRY_COLLECTION:
+        geometries = geometry.get("geometries")
+        if not isinstance(geometries, list):
+            raise ValidationError({"geometries": [MISSING_MESSAGE]})
+        errors = {}
+        for idx, member in enumerate(geometries):
+            try:
+                check_geometry_structure(member)
+            except ValidationError as error:
+                errors[idx] = error.messages
+        if errors:
+            raise ValidationError({"geometries": errors})
+    elif "coordinates" not in geometry:
+        raise ValidationError({"coordinates": [MISSING_MESSAGE]})
+
+
+def check_feature_structure(feature: typing.Any) -> None:
+    """Check the structure of a Feature without validating its geometry values.
+
+    Args:
+        feature: Feature object.
+
+    Raises:
+        ValidationError: If the Feature type is wrong, required members are
+            missing, forbidden members are present, or the geometry fails the
+            structural check.
+    """
+    if not isinstance(feature, dict):
+        raise ValidationError({"_schema": [INVALID_INPUT_MESSAGE]})
+    NoGeometryMembers()(feature)
+    if feature.get("type") != FEATURE:
+        raise ValidationError({"type": ["Invalid feature type"]})
+    for member in ("geometry", "properties"):
+        if member not in feature:
+            raise ValidationError({member: [MISSING_MESSAGE]})
+    if feature["geometry"] is not None:
+        try:
+            check_geometry_structure(feature["geometry"])
+        except ValidationError as error:
+            raise ValidationError({"geometry": error.messages}) from error
+
+
+def check_object_structure(obj: typing.Any) -> None:
+    """Check the structure of any GeoJSON object.
+
+    Args:
+        obj: GeoJSON object.
+
+    Raises:
+        ValidationError: If the object fails the structural check.
+    """
+    if not isinstance(obj, dict):
+        raise ValidationError({"_schema": [INVALID_INPUT_MESSAGE]})
+    object_type = obj.get("type")
+    if object_type == FEATURE:
+        check_feature_structure(obj)
+    elif object_type == FEATURE_COLLECTION:
+        NoForbiddenMembers()(obj)
+        features = obj.get("features")
+        if not isinstance(features, list):
+            raise ValidationError({"features": [MISSING_MESSAGE]})
+        errors = {}
+        for idx, feature in enumerate(features):
+            try:
+                check_feature_structure(feature)
+            except ValidationError as error:
+                errors[idx] = error.messages
+        if errors:
+            raise ValidationError({"features": errors})
+    else:
+        check_geometry_structure(obj)
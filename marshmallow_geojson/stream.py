@@ -0,0 +1,265 @@
+"""Incremental JSON parsing for large GeoJSON documents.
+
+The helpers in this module decode a JSON document chunk by chunk from any
+bytes-like buffer (typically a memory-mapped file) so that the members of the
+top-level object and the elements of large arrays, such as the "features" of
+a FeatureCollection, can be handled one at a time instead of materializing the
+whole document first.
+"""
+
+from __future__ import annotations
+
+import codecs
+import contextlib
+import json
+import mmap
+import os
+import re
+import typing
+
+CHUNK_SIZE = 1 << 20
+BATCH_SIZE = 1024
+
+WHITESPACE = " \t\n\r"
+NUMBER_TAIL = re.compile(r"[0-9eE.+-]*")
+KEYWORDS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+# Length of the longest escape after a backslash, a surrogate pair (uXXXX\uXXXX).
+ESCAPE_LENGTH = 11
+
+
+def truncated(error: json.JSONDecodeError) -> bool:
+    """Check whether a decoding error may be caused by the text ending early.
+
+    Args:
+        error: Error raised decoding a value from ``error.doc``.
+
+    Returns:
+        True if more text could make the value valid.
+    """
+    rest = len(error.doc) - error.pos
+    if rest <= 0 or error.msg.startswith("Unterminated string"):
+        return True
+    if NUMBER_TAIL.match(error.doc, error.pos).end() == len(error.doc):  # type: ignore[union-attr]
+        # The rest of a number nested in an array or object (e.g. "[1e").
+        return True
+    if error.msg.startswith("Invalid \\uXXXX escape"):
+        return rest <= ESCAPE_LENGTH
+    if error.msg == "Expecting value":
+        tail = error.doc[error.pos :]
+        return any(len(tail) < len(word) and word.startswith(tail) for word in KEYWORDS)
+    return False
+
+
+class TextStream:
+    """UTF-8 text decoded incrementally from a bytes-like buffer.
+
+    Only the part of the document that has not been parsed yet is kept as
+    text; decoded values never reference the underlying buffer.
+
+    Args:
+        buffer: Bytes-like object supporting ``len()`` and slicing (e.g.
+            ``bytes`` or ``mmap.mmap``).
+        chunk_size: Number of bytes decoded at a time.
+    """
+
+    def __init__(self, buffer: typing.Any, *, chunk_size: int = CHUNK_SIZE):
+        self._buffer = buffer
+        self._position = 0
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self.text = ""
+        self.offset = 0
+        # Characters, newlines and start of the last line in dropped text.
+        self._dropped = 0
+        self._lines = 0
+        self._line_start = 0
+
+    @property
+    def bytes_read(self) -> int:
+        """Number of bytes read from the buffer so far."""
+        return self._position
+
+    def _fill(self, size: int = 0) -> bool:
+        """Decode at least ``size`` more bytes, dropping the parsed text.
+
+        Returns:
+            False if the buffer is exhausted.
+        """
+        if self._position >= len(self._buffer):
+            return False
+        chunk = self._buffer[self._position : self._position + max(size, self._chunk_size)]
+        self._position += len(chunk)
+        final = self._position >= len(self._buffer)
+        lines = self.text.count("\n", 0, self.offset)
+        if lines:
+            self._lines += lines
+            self._line_start = self._dropped + self.text.rindex("\n", 0, self.offset) + 1
+        self._dropped += self.offset
+        self.text = self.text[self.offset :] + self._decoder.decode(chunk, final=final)
+        self.offset = 0
+        return True
+
+    def error(self, message: str, pos: int | None = None) -> json.JSONDecodeError:
+        """Build a decoding error.
+
+        Args:
+            message: Description of the problem.
+            pos: Position in the decoded text; defaults to the current one.
+
+        Returns:
+            The error, with its position, line and column counted from the
+            start of the document.
+        """
+        pos = self.offset if pos is None else pos
+        error = json.JSONDecodeError(message, self.text, pos)
+        lines = self.text.count("\n", 0, pos)
+        error.pos = self._dropped + pos
+        error.lineno = self._lines + lines + 1
+        if lines:
+            error.colno = pos - self.text.rindex("\n", 0, pos)
+        else:
+            error.colno = error.pos - self._line_start + 1
+        error.args = (f"{message}: line {error.lineno} column {error.colno} (char {error.pos})",)
+        return error
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            text = self.text
+            offset = self.offset
+            while offset < len(text) and text[offset] in WHITESPACE:
+                offset += 1
+            self.offset = offset
+            if offset < len(text):
+                return text[offset]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume ``char`` after optional whitespace."""
+        if self.peek() != char:
+            raise self.error(f"Expecting {char!r}")
+        self.offset += 1
+
+    def value(self) -> typing.Any:
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._raw_decode(self.text, self.offset)
+            except json.JSONDecodeError as error:
+                # A truncated value may continue past the decoded text: read
+                # as much again as is pending, so that retries stay linear
+                # overall. Other errors are raised without reading further.
+                if not truncated(error):
+                    raise self.error(error.msg, error.pos) from None
+                if not self._fill(len(self.text) - self.offset):
+                    raise self.error(error.msg, error.pos) from None
+                continue
+            if (
+                isinstance(value, int | float)
+                and NUMBER_TAIL.match(self.text, end).end() == len(self.text)  # type: ignore[union-attr]
+                and self._fill()
+            ):
+                # A number running up to the end of the decoded text may be
+                # truncated (e.g. "-0." decodes as -0).
+                continue
+            self.offset = end
+            return value
+
+    def finish(self) -> None:
+        """Check that nothing but whitespace follows the parsed document."""
+        if self.peek():
+            raise self.error("Extra data")
+
+
+def iter_array(stream: TextStream) -> typing.Iterator[typing.Any]:
+    """Decode the elements of a JSON array one at a time.
+
+    Args:
+        stream: Stream positioned at the array.
+
+    Yields:
+        The decoded elements.
+    """
+    stream.expect("[")
+    if stream.peek() == "]":
+        stream.offset += 1
+        return
+    while True:
+        yield stream.value()
+        char = stream.peek()
+        stream.offset += 1
+        if char == "]":
+            return
+        if char != ",":
+            stream.offset -= 1
+            raise stream.error("Expecting ',' delimiter")
+
+
+def iter_members(stream: TextStream) -> typing.Iterator[str]:
+    """Iterate over the member names of a JSON object.
+
+    After each name is yielded the stream is positioned at the member value,
+    which the caller must consume (e.g. with :meth:`TextStream.value` or
+    :func:`iter_array`) before resuming the iteration.
+
+    Args:
+        stream: Stream positioned at the object.
+
+    Yields:
+        The member names.
+    """
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.offset += 1
+        return
+    while True:
+        if stream.peek() != '"':
+            raise stream.error("Expecting property name enclosed in double quotes")
+        key = stream.value()
+        stream.expect(":")
+        yield key
+        char = stream.peek()
+        stream.offset += 1
+        if char == "}":
+            return
+        if char != ",":
+            stream.offset -= 1
+            raise stream.error("Expecting ',' delimiter")
+
+
+def iter_batches(
+    items: typing.Iterable[typing.Any], size: int = BATCH_SIZE
+) -> typing.Iterator[list[typing.Any]]:
+    """Group items into lists of at most ``size`` items."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@contextlib.contextmanager
+def map_file(path: str | os.PathLike[str]) -> typing.Iterator[typing.Any]:
+    """Memory-map a file for reading.
+
+    The mapping is closed when the context exits.
+
+    Args:
+        path: Path of the file.
+
+    Yields:
+        The memory-mapped file (or empty bytes for an empty file, which
+        cannot be mapped).
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
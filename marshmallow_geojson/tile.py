@@ -0,0 +1,138 @@
+"""Web Mercator tile bucketing of validated FeatureCollections.
+
+:func:`tile_index` assigns the features of a validated FeatureCollection to
+the z/x/y tiles (the XYZ scheme of OpenStreetMap and most tile servers)
+their bounding boxes touch, and returns one FeatureCollection per tile.
+With ``clip=True`` geometries are clipped to the tile extents, which are
+lines of constant longitude and latitude, so the output stays valid
+GeoJSON without another validation pass.
+
+References:
+    https://wiki.openstreetmap.org/wiki/Slippy_map_tilenames
+"""
+
+from __future__ import annotations
+
+import math
+import typing
+
+from ._clip import Bounds, clip_geometry, geometry_bounds
+from .object_type import FEATURE_COLLECTION
+
+# Latitude limit of the Web Mercator projection.
+MAX_LATITUDE = 85.0511287798066
+
+Tile = tuple[int, int, int]
+
+
+def tile_x(longitude: float, zoom: int) -> int:
+    """Return the column of the tile containing a longitude."""
+    count = 1 << zoom
+    return min(max(math.floor((longitude + 180) / 360 * count), 0), count - 1)
+
+
+def tile_y(latitude: float, zoom: int) -> int:
+    """Return the row of the tile containing a latitude."""
+    count = 1 << zoom
+    latitude = min(max(latitude, -MAX_LATITUDE), MAX_LATITUDE)
+    radians = math.radians(latitude)
+    y = (1 - math.asinh(math.tan(radians)) / math.pi) / 2 * count
+    return min(max(math.floor(y), 0), count - 1)
+
+
+def tile_bounds(x: int, y: int, zoom: int) -> Bounds:
+    """Return the longitude/latitude extent of a tile.
+
+    The extents of the top and bottom rows reach the poles, so that features
+    beyond the Web Mercator latitude limit are kept.
+    """
+    count = 1 << zoom
+
+    def latitude(row: int) -> float:
+        if row == 0:
+            return 90.0
+        if row == count:
+            return -90.0
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / count))))
+
+    return x / count * 360 - 180, latitude(y + 1), (x + 1) / count * 360 - 180, latitude(y)
+
+
+def feature_bounds(feature: typing.Mapping[str, typing.Any]) -> list[float] | None:
+    """Return the bounding box of a feature.
+
+    The "bbox" member of the feature, or of its geometry, is used when
+    present; otherwise the box is computed from the coordinates.
+    """
+    geometry = feature.get("geometry")
+    for bbox in (feature.get("bbox"), geometry and geometry.get("bbox")):
+        if bbox is not None and len(bbox) in (4, 6):
+            half = len(bbox) // 2
+            return [bbox[0], bbox[1], bbox[half], bbox[half + 1]]
+    bounds = geometry_bounds(geometry)
+    return None if bounds is None else list(bounds)
+
+
+def tile_columns(west: float, east: float, zoom: int) -> list[int]:
+    """Return the tile columns of a longitude range, which may cross the antimeridian."""
+    first, last = tile_x(west, zoom), tile_x(east, zoom)
+    if west <= east:
+        return list(range(first, last + 1))
+    return list(range(first, 1 << zoom)) + list(range(0, last + 1))
+
+
+def tile_index(
+    validated: typing.Mapping[str, typing.Any],
+    zoom: int,
+    *,
+    clip: bool = False,
+) -> dict[Tile, dict[str, typing.Any]]:
+    """Partition a validated FeatureCollection into Web Mercator tiles.
+
+    Each feature is added to every tile its bounding box touches (see
+    :func:`feature_bounds`); bounding boxes crossing the antimeridian
+    (west > east) are supported. Features without a geometry are not
+    assigned to any tile.
+
+    Args:
+        validated: A FeatureCollection returned by
+            :meth:`FeatureCollectionSchema.load`.
+        zoom: The zoom level.
+        clip: Whether to clip geometries to the tile extents. Features whose
+            clipped geometry is empty are left out of the tile; clipped
+            LineStrings may become MultiLineStrings, and bounding boxes
+            are recomputed. Unclipped features are shared, not copied.
+
+    Returns:
+        A dictionary mapping ``(zoom, x, y)`` to the FeatureCollection of
+        the tile. Tiles without features are omitted.
+
+    Raises:
+        ValueError: If ``zoom`` is negative.
+    """
+    if zoom < 0:
+        raise ValueError(f"zoom must not be negative, not {zoom!r}.")
+
+    tiles: dict[Tile, list[typing.Any]] = {}
+    for feature in validated["features"]:
+        bbox = feature_bounds(feature)
+        if bbox is None:
+            continue
+        west, south, east, north = bbox
+        rows = range(tile_y(north, zoom), tile_y(south, zoom) + 1)
+        for x in tile_columns(west, east, zoom):
+            for y in rows:
+                tile_feature = feature
+                if clip:
+                    geometry = clip_geometry(feature["geometry"], tile_bounds(x, y, zoom))
+                    if geometry is None:
+                        continue
+                    tile_feature = {**feature, "geometry": geometry}
+                    if feature.get("bbox") is not None:
+                        tile_feature["bbox"] = list(geometry_bounds(geometry) or ())
+                tiles.setdefault((zoom, x, y), []).append(tile_feature)
+
+    return {
+        tile: {"type": FEATURE_COLLECTION, "features": features}
+        for tile, features in sorted(tiles.items())
+    }
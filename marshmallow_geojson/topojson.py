@@ -0,0 +1,450 @@
+"""TopoJSON export and import of FeatureCollections.
+
+:func:`to_topojson` converts a validated FeatureCollection to a TopoJSON
+topology: the lines and polygon rings of all geometries are cut at the
+junctions where they meet, and every shared piece of border is stored once
+as an arc that geometries reference by index (a negative index ``~i`` means
+arc ``i`` reversed). Positions are optionally quantized to an integer grid
+and arcs delta-encoded, which makes choropleth layers of adjacent polygons
+much smaller than the equivalent GeoJSON.
+
+:func:`from_topojson` rebuilds the FeatureCollection and validates it.
+
+References:
+    https://github.com/topojson/topojson-specification
+"""
+
+from __future__ import annotations
+
+import math
+import typing
+
+from marshmallow import ValidationError
+
+from ._clip import iter_positions
+from .feature_collection import FeatureCollectionSchema
+from .object_type import (
+    FEATURE,
+    FEATURE_COLLECTION,
+    GEOMETRY_COLLECTION,
+    LINE_STRING,
+    MULTI_LINE_STRING,
+    MULTI_POINT,
+    MULTI_POLYGON,
+    POINT,
+    POLYGON,
+)
+
+TOPOLOGY = "Topology"
+OBJECT_NAME = "collection"
+QUANTIZATION = 100_000
+
+Position = tuple[float, ...]
+
+
+def topojson_error(message: str) -> ValidationError:
+    """Build the error raised for malformed TopoJSON."""
+    return ValidationError({"_schema": [f"Invalid TopoJSON: {message}"]})
+
+
+def compute_bbox(features: typing.Iterable[typing.Mapping[str, typing.Any]]) -> list[float] | None:
+    """Return the 2-D bounding box of the features, or None if they have no positions."""
+    x0 = y0 = math.inf
+    x1 = y1 = -math.inf
+    for feature in features:
+        for position in iter_positions(feature["geometry"]):
+            x, y = position[0], position[1]
+            x0, x1 = min(x0, x), max(x1, x)
+            y0, y1 = min(y0, y), max(y1, y)
+    if x0 > x1:
+        return None
+    return [x0, y0, x1, y1]
+
+
+class TopologyBuilder:
+    """Builds the arcs and objects of a topology.
+
+    Args:
+        bbox: Bounding box of all positions.
+        quantization: Number of grid cells per axis, or None to keep the
+            positions as they are.
+    """
+
+    def __init__(self, bbox: list[float] | None, quantization: int | None):
+        self.transform: dict[str, list[float]] | None = None
+        if quantization is not None and bbox is not None:
+            x0, y0, x1, y1 = bbox
+            self.transform = {
+                "scale": [
+                    (x1 - x0) / (quantization - 1) or 1.0,
+                    (y1 - y0) / (quantization - 1) or 1.0,
+                ],
+                "translate": [x0, y0],
+            }
+        # Lines and rings of all geometries, with whether each one is a ring.
+        self.lines: list[list[Position]] = []
+        self.rings: list[bool] = []
+        self.arcs: list[list[Position]] = []
+        self.arc_indexes: dict[tuple[Position, ...], int] = {}
+
+    def quantize(self, position: typing.Sequence[float]) -> Position:
+        """Return a position on the quantization grid."""
+        if self.transform is None:
+            return tuple(position)
+        (kx, ky), (tx, ty) = self.transform["scale"], self.transform["translate"]
+        return (round((position[0] - tx) / kx), round((position[1] - ty) / ky), *position[2:])
+
+    def line(self, positions: typing.Sequence[typing.Any], *, ring: bool) -> int:
+        """Register a line or ring and return its index.
+
+        Consecutive positions that fall on the same grid cell are merged,
+        unless that would leave too few positions for a valid geometry.
+        """
+        quantized = [self.quantize(position) for position in positions]
+        merged = [
+            position
+            for idx, position in enumerate(quantized)
+            if idx == 0 or position != quantized[idx - 1]
+        ]
+        if len(merged) >= (4 if ring else 2):
+            quantized = merged
+        self.lines.append(quantized)
+        self.rings.append(ring)
+        return len(self.lines) - 1
+
+    def geometry(self, geometry: typing.Mapping[str, typing.Any] | None) -> dict[str, typing.Any]:
+        """Convert a geometry to a TopoJSON object.
+
+        Lines and rings are replaced by their index in :attr:`lines` until
+        :meth:`resolve` substitutes the arcs.
+        """
+        if geometry is None:
+            return {"type": None}
+        geometry_type = geometry["type"]
+        if geometry_type == GEOMETRY_COLLECTION:
+            return {
+                "type": GEOMETRY_COLLECTION,
+                "geometries": [self.geometry(member) for member in geometry["geometries"]],
+            }
+
+        coordinates = geometry["coordinates"]
+        if geometry_type == POINT:
+            return {"type": POINT, "coordinates": list(self.quantize(coordinates))}
+        if geometry_type == MULTI_POINT:
+            points = [list(self.quantize(position)) for position in coordinates]
+            return {"type": MULTI_POINT, "coordinates": points}
+        if geometry_type == LINE_STRING:
+            arcs: typing.Any = self.line(coordinates, ring=False)
+        elif geometry_type == MULTI_LINE_STRING:
+            arcs = [self.line(line, ring=False) for line in coordinates]
+        elif geometry_type == POLYGON:
+            arcs = [self.line(ring, ring=True) for ring in coordinates]
+        elif geometry_type == MULTI_POLYGON:
+            arcs = [[self.line(ring, ring=True) for ring in polygon] for polygon in coordinates]
+        else:
+            raise ValueError(f"Cannot convert {geometry_type!r} to TopoJSON.")
+        return {"type": geometry_type, "arcs": arcs}
+
+    def junctions(self) -> set[Position]:
+        """Return the positions where lines meet or diverge.
+
+        A position is a junction when it ends a line, or when it is visited
+        twice with different neighbours.
+        """
+        junctions: set[Position] = set()
+        neighbours: dict[Position, tuple[Position, Position]] = {}
+        for line, ring in zip(self.lines, self.rings, strict=True):
+            if ring:
+                points = line[:-1]
+                count = len(points)
+                pairs = (
+                    (points[idx - 1], points[idx], points[(idx + 1) % count])
+                    for idx in range(count)
+                )
+            else:
+                junctions.add(line[0])
+                junctions.add(line[-1])
+                pairs = (
+                    (line[idx - 1], line[idx], line[idx + 1]) for idx in range(1, len(line) - 1)
+                )
+            for previous, point, following in pairs:
+                seen = neighbours.setdefault(point, (previous, following))
+                if seen != (previous, following) and seen != (following, previous):
+                    junctions.add(point)
+        return junctions
+
+    def cut(self, line: list[Position], ring: bool, junctions: set[Position]) -> list[int]:
+        """Cut a line or ring at the junctions and return its arc indexes."""
+        if ring:
+            points = line[:-1]
+            start = next((idx for idx, point in enumerate(points) if point in junctions), None)
+            if start is None:
+                return [self.ring_arc(line)]
+            line = points[start:] + points[:start] + [points[start]]
+
+        indexes = []
+        begin = 0
+        for idx in range(1, len(line)):
+            if idx == len(line) - 1 or line[idx] in junctions:
+                indexes.append(self.arc(line[begin : idx + 1]))
+                begin = idx
+        return indexes
+
+    def arc(self, positions: list[Position]) -> int:
+        """Return the index of an arc, adding it if it is new."""
+        key = tuple(positions)
+        if key in self.arc_indexes:
+            return self.arc_indexes[key]
+        reversed_key = key[::-1]
+        if reversed_key in self.arc_indexes:
+            return ~self.arc_indexes[reversed_key]
+        self.arcs.append(positions)
+        self.arc_indexes[key] = len(self.arcs) - 1
+        return len(self.arcs) - 1
+
+    def ring_arc(self, ring: list[Position]) -> int:
+        """Return the index of a ring without junctions, adding it if it is new.
+
+        Such rings can start anywhere, so they are matched on their rotation
+        starting at the smallest position.
+        """
+        points = ring[:-1]
+        key = rotate(points)
+        if key in self.arc_indexes:
+            return self.arc_indexes[key]
+        reversed_key = rotate(points[::-1])
+        if reversed_key in self.arc_indexes:
+            return ~self.arc_indexes[reversed_key]
+        self.arcs.append(ring)
+        self.arc_indexes[key] = len(self.arcs) - 1
+        return len(self.arcs) - 1
+
+    def resolve(self, value: typing.Any, line_arcs: list[list[int]]) -> typing.Any:
+        """Replace line indexes by the arc indexes of the lines."""
+        if isinstance(value, int):
+            return line_arcs[value]
+        return [self.resolve(item, line_arcs) for item in value]
+
+    def encode_arc(self, positions: list[Position]) -> list[list[float]]:
+        """Return an arc as TopoJSON, delta-encoded when quantized."""
+        if self.transform is None:
+            return [list(position) for position in positions]
+        encoded = []
+        x: float = 0
+        y: float = 0
+        for position in positions:
+            encoded.append([position[0] - x, position[1] - y, *position[2:]])
+            x, y = position[0], position[1]
+        return encoded
+
+
+def rotate(points: list[Position]) -> tuple[Position, ...]:
+    """Return the rotation of a ring starting at its smallest position."""
+    start = points.index(min(points))
+    return tuple(points[start:] + points[:start])
+
+
+def to_topojson(
+    validated: typing.Mapping[str, typing.Any],
+    *,
+    quantization: int | None = QUANTIZATION,
+    object_name: str = OBJECT_NAME,
+) -> dict[str, typing.Any]:
+    """Convert a validated FeatureCollection to a TopoJSON topology.
+
+    Features become the members of a single GeometryCollection object,
+    keeping their id and properties. Feature and collection bounding boxes
+    and foreign members are not carried over.
+
+    Args:
+        validated: A FeatureCollection returned by
+            :meth:`FeatureCollectionSchema.load`.
+        quantization: Number of grid cells per axis of the bounding box
+            that positions are snapped to, or None to keep the positions
+            exact (and the arcs not delta-encoded).
+        object_name: Name of the GeometryCollection in "objects".
+
+    Returns:
+        The topology.
+
+    Raises:
+        ValueError: If ``quantization`` is smaller than 2.
+    """
+    if quantization is not None and quantization < 2:
+        raise ValueError("quantization must be at least 2.")
+
+    features = validated["features"]
+    bbox = compute_bbox(features)
+    builder = TopologyBuilder(bbox, quantization)
+
+    geometries = []
+    for feature in features:
+        geometry = builder.geometry(feature["geometry"])
+        if feature.get("id") is not None:
+            geometry["id"] = feature["id"]
+        if feature.get("properties") is not None:
+            geometry["properties"] = feature["properties"]
+        geometries.append(geometry)
+
+    junctions = builder.junctions()
+    line_arcs = [
+        builder.cut(line, ring, junctions)
+        for line, ring in zip(builder.lines, builder.rings, strict=True)
+    ]
+    for geometry in iter_arc_geometries(geometries):
+        geometry["arcs"] = builder.resolve(geometry["arcs"], line_arcs)
+
+    topology: dict[str, typing.Any] = {"type": TOPOLOGY}
+    if bbox is not None:
+        topology["bbox"] = bbox
+    if builder.transform is not None:
+        topology["transform"] = builder.transform
+    topology["objects"] = {object_name: {"type": GEOMETRY_COLLECTION, "geometries": geometries}}
+    topology["arcs"] = [builder.encode_arc(arc) for arc in builder.arcs]
+    return topology
+
+
+def iter_arc_geometries(
+    geometries: typing.Iterable[dict[str, typing.Any]],
+) -> typing.Iterator[dict[str, typing.Any]]:
+    """Yield the TopoJSON objects that reference arcs, in collections too."""
+    for geometry in geometries:
+        if geometry["type"] == GEOMETRY_COLLECTION:
+            yield from iter_arc_geometries(geometry["geometries"])
+        elif "arcs" in geometry:
+            yield geometry
+
+
+class TopologyReader:
+    """Rebuilds GeoJSON geometries from a topology.
+
+    Each arc is decoded once and shared by every geometry that uses it.
+
+    Args:
+        topology: The TopoJSON topology.
+    """
+
+    def __init__(self, topology: typing.Mapping[str, typing.Any]):
+        transform = topology.get("transform")
+        bbox = topology.get("bbox")
+        self.transform = transform
+        self.bounds = bbox[:2] + bbox[-2:] if transform is not None and bbox else None
+        self.arcs = [self.decode_arc(arc) for arc in topology["arcs"]]
+
+    def position(self, position: typing.Sequence[float]) -> list[float]:
+        """Return a position with the transform undone."""
+        if self.transform is None:
+            return list(position)
+        (kx, ky), (tx, ty) = self.transform["scale"], self.transform["translate"]
+        x, y = position[0] * kx + tx, position[1] * ky + ty
+        if self.bounds is not None:
+            # Keep rounding errors from pushing positions out of the bbox.
+            x0, y0, x1, y1 = self.bounds
+            x, y = min(max(x, x0), x1), min(max(y, y0), y1)
+        return [x, y, *position[2:]]
+
+    def decode_arc(self, arc: typing.Sequence[typing.Sequence[float]]) -> list[list[float]]:
+        """Decode an arc, undoing the delta encoding when quantized."""
+        if self.transform is None:
+            return [list(position) for position in arc]
+        positions = []
+        x: float = 0
+        y: float = 0
+        for position in arc:
+            x, y = x + position[0], y + position[1]
+            positions.append(self.position((x, y, *position[2:])))
+        return positions
+
+    def line(self, indexes: typing.Sequence[int]) -> list[list[float]]:
+        """Join arcs into a line or ring."""
+        positions: list[list[float]] = []
+        for index in indexes:
+            arc = self.arcs[index] if index >= 0 else self.arcs[~index][::-1]
+            positions.extend(arc[1:] if positions else arc)
+        return positions
+
+    def geometry(self, obj: typing.Mapping[str, typing.Any]) -> dict[str, typing.Any] | None:
+        """Rebuild the GeoJSON geometry of a TopoJSON object."""
+        geometry_type = obj["type"]
+        if geometry_type is None:
+            return None
+        if geometry_type == GEOMETRY_COLLECTION:
+            members = [self.geometry(member) for member in obj["geometries"]]
+            return {"type": GEOMETRY_COLLECTION, "geometries": members}
+        if geometry_type == POINT:
+            return {"type": POINT, "coordinates": self.position(obj["coordinates"])}
+        if geometry_type == MULTI_POINT:
+            points = [self.position(position) for position in obj["coordinates"]]
+            return {"type": MULTI_POINT, "coordinates": points}
+
+        arcs = obj["arcs"]
+        if geometry_type == LINE_STRING:
+            coordinates: typing.Any = self.line(arcs)
+        elif geometry_type in (MULTI_LINE_STRING, POLYGON):
+            coordinates = [self.line(line) for line in arcs]
+        elif geometry_type == MULTI_POLYGON:
+            coordinates = [[self.line(ring) for ring in polygon] for polygon in arcs]
+        else:
+            raise topojson_error(f"unknown object type {geometry_type!r}.")
+        return {"type": geometry_type, "coordinates": coordinates}
+
+    def feature(self, obj: typing.Mapping[str, typing.Any]) -> dict[str, typing.Any]:
+        """Rebuild a GeoJSON Feature from a TopoJSON object."""
+        feature: dict[str, typing.Any] = {"type": FEATURE}
+        if obj.get("id") is not None:
+            feature["id"] = obj["id"]
+        feature["geometry"] = self.geometry(obj)
+        feature["properties"] = obj.get("properties")
+        return feature
+
+
+def from_topojson(
+    topology: typing.Mapping[str, typing.Any],
+    object_name: str | None = None,
+    *,
+    schema: FeatureCollectionSchema | None = None,
+) -> dict[str, typing.Any]:
+    """Convert a TopoJSON topology to a validated FeatureCollection.
+
+    A GeometryCollection object becomes one feature per member; any other
+    object becomes a single feature.
+
+    Args:
+        topology: The TopoJSON topology.
+        object_name: Name of the object in "objects" to convert. May be
+            omitted when the topology has a single object.
+        schema: Schema validating the result. Defaults to
+            :class:`FeatureCollectionSchema`.
+
+    Returns:
+        The validated FeatureCollection.
+
+    Raises:
+        ValidationError: If the topology is malformed, or the rebuilt
+            FeatureCollection is invalid.
+    """
+    if not isinstance(topology, typing.Mapping) or topology.get("type") != TOPOLOGY:
+        raise topojson_error("expected an object of type 'Topology'.")
+    objects = topology.get("objects")
+    if not isinstance(objects, typing.Mapping):
+        raise topojson_error("missing 'objects'.")
+    if object_name is None:
+        if len(objects) != 1:
+            raise topojson_error("object_name is required when there are several objects.")
+        (object_name,) = objects
+    if object_name not in objects:
+        raise topojson_error(f"no object named {object_name!r}.")
+
+    obj = objects[object_name]
+    try:
+        reader = TopologyReader(topology)
+        if obj["type"] == GEOMETRY_COLLECTION:
+            features = [reader.feature(member) for member in obj["geometries"]]
+        else:
+            features = [reader.feature(obj)]
+    except (KeyError, IndexError, TypeError, ValueError) as error:
+        raise topojson_error("malformed topology.") from error
+
+    collection = {"type": FEATURE_COLLECTION, "features": features}
+    validated: dict[str, typing.Any] = (schema or FeatureCollectionSchema()).load(collection)
+    return validated
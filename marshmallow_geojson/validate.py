@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import typing
+
 from marshmallow import ValidationError
 from marshmallow.validate import Validator
 
+from .winding import ring_areas
+
 
 class Bbox(Validator):
     """Validate bounding box according to RFC 7946 Section 5.
@@ -321,6 +325,70 @@ class PolygonRings(Validator):
         return value
 
 
+class RightHandRule(Validator):
+    """Validate the winding order of Polygon or MultiPolygon rings.
+
+    According to RFC 7946 Section 3.1.6, exterior rings should be
+    counterclockwise and interior rings (holes) clockwise. Rings with no area
+    have no orientation and are accepted.
+
+    Use ``rewind=True`` on :class:`PolygonSchema`, :class:`MultiPolygonSchema`
+    or :class:`GeoJSONSchema` to fix the orientation instead of rejecting it.
+
+    References:
+        https://datatracker.ietf.org/doc/html/rfc7946#section-3.1.6
+    """
+
+    message_exterior = (
+        "Exterior ring must be counterclockwise. According to RFC 7946 "
+        "Section 3.1.6, polygon rings must follow the right-hand rule."
+    )
+    message_interior = (
+        "Interior ring {index} must be clockwise. According to RFC 7946 "
+        "Section 3.1.6, polygon rings must follow the right-hand rule."
+    )
+    message_polygon = "Polygon {index}: {message}"
+
+    def _check_polygon(self, rings: list) -> str | None:
+        """Return the error message for the first misoriented ring, if any."""
+        for idx, area in enumerate(ring_areas(rings)):
+            if idx == 0 and area < 0:
+                return self.message_exterior
+            if idx > 0 and area > 0:
+                return self.message_interior.format(index=idx)
+        return None
+
+    def __call__(self, value: list) -> list:
+        """Validate ring orientation.
+
+        Args:
+            value: Polygon coordinates (a list of rings) or MultiPolygon
+                coordinates (a list of Polygon coordinates).
+
+        Returns:
+            The validated coordinates.
+
+        Raises:
+            ValidationError: If a ring does not follow the right-hand rule.
+        """
+        # Positions are nested one level deeper in MultiPolygon coordinates.
+        item: typing.Any = value
+        depth = 0
+        while isinstance(item, list | tuple) and item:
+            item = item[0]
+            depth += 1
+        if isinstance(item, list | tuple):
+            # An empty polygon, ring or position, reported by other validators.
+            return value
+        if depth == 4:
+            for idx, polygon in enumerate(value):
+                if (message := self._check_polygon(polygon)) is not None:
+                    raise ValidationError(self.message_polygon.format(index=idx, message=message))
+        elif depth == 3 and (message := self._check_polygon(value)) is not None:
+            raise ValidationError(message)
+        return value
+
+
 class NoFeatureMembers(Validator):
     """Validate that Geometry objects do not contain Feature-defining members.
 
@@ -0,0 +1,429 @@
+"""Strict validity checks of Polygon and MultiPolygon geometries.
+
+The checks follow the OGC Simple Features rules that spatial databases
+enforce on insert:
+
+- rings do not cross or touch themselves (no bow-ties or spikes);
+- rings of a polygon may touch each other at single points only, and do not
+  cross or share edges;
+- holes lie inside the exterior ring, and not inside another hole;
+- the polygons of a MultiPolygon may touch at single points only, and do not
+  overlap.
+
+Crossings are found with a Shamos-Hoey sweep line, the detection variant of
+the Bentley-Ottmann algorithm: edges are sorted once and only neighbours in
+the sweep order are tested, so a ring with n edges is checked in
+O(n log n) comparisons instead of the O(n^2) of pairwise tests. The sweep
+stops at the first crossing. Ring containment is then tested with one
+representative vertex per ring, which is enough once rings are known not to
+cross.
+
+Coordinates are treated as planar longitude/latitude, as in
+:mod:`marshmallow_geojson.winding`.
+"""
+
+from __future__ import annotations
+
+import math
+import typing
+from bisect import bisect_left, bisect_right
+
+BASIC: typing.Final = "basic"
+STRICT: typing.Final = "strict"
+VALIDITY_MODES = (BASIC, STRICT)
+
+# Intersection kinds of two edges.
+TOUCH = "touch"
+OVERLAP = "overlap"
+CROSS = "cross"
+
+# Location of a point relative to a ring.
+OUTSIDE = 0
+INSIDE = 1
+BOUNDARY = -1
+
+
+def check_validity_mode(validity: str) -> None:
+    """Check the validity mode option of a schema.
+
+    Args:
+        validity: Validity mode, "basic" or "strict".
+
+    Raises:
+        ValueError: If the mode is invalid.
+    """
+    if validity not in VALIDITY_MODES:
+        raise ValueError(f"validity must be one of {VALIDITY_MODES}, not {validity!r}.")
+
+
+class Ring:
+    """Distinct vertices of a ring, with their indexes in the input.
+
+    Consecutive repeated positions and the closing position are dropped.
+
+    Args:
+        positions: The ring positions.
+        polygon: Index of the polygon in a MultiPolygon, or None.
+        index: Index of the ring in its polygon.
+    """
+
+    def __init__(self, positions: typing.Sequence[typing.Sequence[float]], polygon, index: int):
+        self.polygon = polygon
+        self.index = index
+        self.size = len(positions)
+        self.xs: list[float] = []
+        self.ys: list[float] = []
+        self.vertices: list[int] = []
+        for idx, position in enumerate(positions[:-1]):
+            x, y = position[0], position[1]
+            if self.xs and x == self.xs[-1] and y == self.ys[-1]:
+                continue
+            self.xs.append(x)
+            self.ys.append(y)
+            self.vertices.append(idx)
+        while len(self.xs) > 1 and self.xs[-1] == self.xs[0] and self.ys[-1] == self.ys[0]:
+            self.xs.pop()
+            self.ys.pop()
+            self.vertices.pop()
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def label(self) -> str:
+        """Return the name of the ring in error messages."""
+        if self.polygon is None:
+            return f"ring {self.index}"
+        return f"polygon {self.polygon} ring {self.index}"
+
+    def edge_label(self, edge: int) -> str:
+        """Return the name of an edge, by the input indexes of its vertices."""
+        end = self.vertices[edge + 1] if edge + 1 < len(self) else self.size - 1
+        return f"{self.label()} edge {self.vertices[edge]}-{end}"
+
+    def repeated_vertex(self) -> tuple[int, int] | None:
+        """Return the input indexes of a vertex visited twice, if any."""
+        seen: dict[tuple[float, float], int] = {}
+        for idx, key in enumerate(zip(self.xs, self.ys, strict=True)):
+            if key in seen:
+                return self.vertices[seen[key]], self.vertices[idx]
+            seen[key] = idx
+        return None
+
+
+def orient(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    """Return twice the signed area of the triangle abc."""
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def between(a: float, b: float, value: float) -> bool:
+    """Return whether value lies between a and b, inclusive."""
+    return a <= value <= b if a <= b else b <= value <= a
+
+
+class Sweep:
+    """Shamos-Hoey sweep over the edges of a set of rings.
+
+    Edges are stored in parallel lists, oriented from their leftmost
+    (lowest x, then lowest y) endpoint. The sweep status is a list of edge
+    ids sorted by their y at the sweep position; it is searched with
+    ``bisect`` and only neighbouring edges are tested for intersection.
+
+    Args:
+        rings: The rings to check.
+    """
+
+    def __init__(self, rings: list[Ring]):
+        self.rings = rings
+        self.ring: list[int] = []
+        self.edge: list[int] = []
+        self.px: list[float] = []
+        self.py: list[float] = []
+        self.qx: list[float] = []
+        self.qy: list[float] = []
+        self.slope: list[float] = []
+        for ring_id, ring in enumerate(rings):
+            xs, ys = ring.xs, ring.ys
+            count = len(ring)
+            for idx in range(count):
+                ax, ay = xs[idx], ys[idx]
+                bx, by = xs[(idx + 1) % count], ys[(idx + 1) % count]
+                if (bx, by) < (ax, ay):
+                    ax, ay, bx, by = bx, by, ax, ay
+                self.ring.append(ring_id)
+                self.edge.append(idx)
+                self.px.append(ax)
+                self.py.append(ay)
+                self.qx.append(bx)
+                self.qy.append(by)
+                self.slope.append((by - ay) / (bx - ax) if bx != ax else math.inf)
+        self.x = -math.inf
+
+    def y_at(self, edge: int) -> float:
+        """Return the y of an edge at the sweep position."""
+        x = self.x
+        if x <= self.px[edge]:
+            return self.py[edge]
+        if x >= self.qx[edge]:
+            return self.qy[edge]
+        return self.py[edge] + (x - self.px[edge]) * self.slope[edge]
+
+    def key(self, edge: int) -> tuple[float, float]:
+        """Return the sort key of an edge in the sweep status."""
+        return self.y_at(edge), self.slope[edge]
+
+    def run(self) -> str | None:
+        """Sweep the edges and return the first invalid intersection, if any."""
+        count = len(self.px)
+        # Edges leave the status before others enter at the same point, so
+        # consecutive edges of a ring are only compared when they overlap.
+        events = sorted(
+            [(self.px[edge], self.py[edge], 1, edge) for edge in range(count)]
+            + [(self.qx[edge], self.qy[edge], 0, edge) for edge in range(count)]
+        )
+        status: list[int] = []
+        for x, _, entering, edge in events:
+            self.x = x
+            if entering:
+                pos = bisect_left(status, self.key(edge), key=self.key)
+                status.insert(pos, edge)
+                below = status[pos - 1] if pos > 0 else None
+                above = status[pos + 1] if pos + 1 < len(status) else None
+                error = self.check(edge, below) or self.check(edge, above)
+            else:
+                pos = self.find(status, edge)
+                del status[pos]
+                below = status[pos - 1] if pos > 0 else None
+                above = status[pos] if pos < len(status) else None
+                error = self.check(below, above)
+            if error is not None:
+                return error
+        return None
+
+    def find(self, status: list[int], edge: int) -> int:
+        """Return the position of an edge in the sweep status."""
+        y = self.y_at(edge)
+        pos = bisect_left(status, y, key=self.y_at)
+        for idx in range(max(pos - 1, 0), len(status)):
+            if status[idx] == edge:
+                return idx
+            if self.y_at(status[idx]) > y:
+                break
+        return status.index(edge)
+
+    def intersection(self, a: int, b: int) -> tuple[str, float, float] | None:
+        """Classify the intersection of two edges.
+
+        Returns:
+            None if the edges are disjoint, otherwise a tuple ``(kind, x,
+            y)`` where kind is "cross" for a proper crossing, "overlap" for
+            collinear edges sharing more than a point, and "touch" for edges
+            sharing a single point, and ``(x, y)`` is a shared point.
+        """
+        px, py, qx, qy = self.px, self.py, self.qx, self.qy
+        ax, ay, bx, by = px[a], py[a], qx[a], qy[a]
+        cx, cy, dx, dy = px[b], py[b], qx[b], qy[b]
+        if bx < cx or dx < ax or max(ay, by) < min(cy, dy) or max(cy, dy) < min(ay, by):
+            return None
+        d1 = orient(cx, cy, dx, dy, ax, ay)
+        d2 = orient(cx, cy, dx, dy, bx, by)
+        d3 = orient(ax, ay, bx, by, cx, cy)
+        d4 = orient(ax, ay, bx, by, dx, dy)
+
+        if ((d1 > 0 and d2 < 0) or (d1 < 0 and d2 > 0)) and (
+            (d3 > 0 and d4 < 0) or (d3 < 0 and d4 > 0)
+        ):
+            t = d1 / (d1 - d2)
+            return CROSS, ax + t * (bx - ax), ay + t * (by - ay)
+
+        if d1 == d2 == d3 == d4 == 0:
+            start = max((ax, ay), (cx, cy))
+            end = min((bx, by), (dx, dy))
+            if start > end:
+                return None
+            return (OVERLAP if start < end else TOUCH), start[0], start[1]
+
+        for d, x, y, (ex, ey, fx, fy) in (
+            (d1, ax, ay, (cx, cy, dx, dy)),
+            (d2, bx, by, (cx, cy, dx, dy)),
+            (d3, cx, cy, (ax, ay, bx, by)),
+            (d4, dx, dy, (ax, ay, bx, by)),
+        ):
+            if d == 0 and between(ex, fx, x) and between(ey, fy, y):
+                return TOUCH, x, y
+        return None
+
+    def check(self, a: int | None, b: int | None) -> str | None:
+        """Return an error message if two edges intersect in a forbidden way."""
+        if a is None or b is None:
+            return None
+        found = self.intersection(a, b)
+        if found is None:
+            return None
+        kind, x, y = found
+        ring_a, ring_b = self.ring[a], self.ring[b]
+        if kind == TOUCH:
+            if ring_a != ring_b:
+                return None
+            distance = abs(self.edge[a] - self.edge[b])
+            if distance in (1, len(self.rings[ring_a]) - 1):
+                return None
+
+        first = self.rings[ring_a].edge_label(self.edge[a])
+        second = self.rings[ring_b].edge_label(self.edge[b])
+        if kind == OVERLAP:
+            return f"Self-intersection: {first} overlaps {second} at [{x}, {y}]."
+        if kind == TOUCH:
+            return f"Self-intersection: {first} touches {second} at [{x}, {y}]."
+        return f"Self-intersection: {first} crosses {second} at [{x}, {y}]."
+
+
+def locate(ring: Ring, points: list[tuple[float, float]]) -> list[int]:
+    """Locate points relative to a ring with the even-odd rule.
+
+    All points are tested in one pass over the edges: the points are sorted
+    by y, and each edge is only compared with the points within its y range.
+
+    Returns:
+        For each point, INSIDE, OUTSIDE or BOUNDARY.
+    """
+    order = sorted(range(len(points)), key=lambda idx: points[idx][1])
+    ys = [points[idx][1] for idx in order]
+    inside = [False] * len(points)
+    boundary = [False] * len(points)
+    xs_ring, ys_ring = ring.xs, ring.ys
+    count = len(ring)
+    for idx in range(count):
+        ax, ay = xs_ring[idx], ys_ring[idx]
+        bx, by = xs_ring[(idx + 1) % count], ys_ring[(idx + 1) % count]
+        start = bisect_left(ys, min(ay, by))
+        stop = bisect_right(ys, max(ay, by))
+        for point in order[start:stop]:
+            x, y = points[point]
+            side = orient(ax, ay, bx, by, x, y)
+            if side == 0 and between(ax, bx, x):
+                boundary[point] = True
+            elif (ay > y) != (by > y) and (side > 0) == (by > ay):
+                inside[point] = not inside[point]
+    return [
+        BOUNDARY if on_boundary else INSIDE if is_inside else OUTSIDE
+        for on_boundary, is_inside in zip(boundary, inside, strict=True)
+    ]
+
+
+def locate_rings(rings: list[Ring], container: Ring) -> list[int]:
+    """Locate rings relative to a container ring they do not cross.
+
+    Each ring is represented by its first vertex that is not on the boundary
+    of the container. A ring whose vertices are all on the boundary is
+    reported as BOUNDARY.
+    """
+    result = [BOUNDARY] * len(rings)
+    pending = list(range(len(rings)))
+    vertex = 0
+    while pending:
+        pending = [idx for idx in pending if vertex < len(rings[idx])]
+        points = [(rings[idx].xs[vertex], rings[idx].ys[vertex]) for idx in pending]
+        locations = locate(container, points)
+        unresolved = []
+        for idx, location in zip(pending, locations, strict=True):
+            if location == BOUNDARY:
+                unresolved.append(idx)
+            else:
+                result[idx] = location
+        pending = unresolved
+        vertex += 1
+    return result
+
+
+def prepare(polygons: list[tuple[typing.Any, list[typing.Any]]]) -> tuple[list[Ring], str | None]:
+    """Build the rings of polygons and check them one by one."""
+    rings: list[Ring] = []
+    for polygon, coordinates in polygons:
+        for index, positions in enumerate(coordinates):
+            ring = Ring(positions, polygon, index)
+            if len(ring) < 3:
+                return rings, f"Invalid ring: {ring.label()} has fewer than 3 distinct positions."
+            repeated = ring.repeated_vertex()
+            if repeated is not None:
+                return rings, (
+                    f"Self-intersection: {ring.label()} touches itself at vertices "
+                    f"{repeated[0]} and {repeated[1]}."
+                )
+            rings.append(ring)
+    return rings, None
+
+
+def hole_errors(shell: Ring, holes: list[Ring]) -> str | None:
+    """Check that holes lie inside their shell and outside each other."""
+    for hole, location in zip(holes, locate_rings(holes, shell), strict=True):
+        if location == OUTSIDE:
+            return f"Invalid hole: {hole.label()} lies outside the exterior ring."
+    for container in holes:
+        others = [hole for hole in holes if hole is not container]
+        for hole, location in zip(others, locate_rings(others, container), strict=True):
+            if location == INSIDE:
+                return f"Invalid hole: {hole.label()} lies inside {container.label()}."
+    return None
+
+
+def polygon_error(coordinates: list[typing.Any]) -> str | None:
+    """Return the first validity error of Polygon coordinates, if any.
+
+    Args:
+        coordinates: Polygon coordinates whose rings are closed and have at
+            least 4 positions.
+
+    Returns:
+        An error message naming the offending ring edges or vertices by their
+        index in the input, or None if the polygon is valid.
+    """
+    rings, error = prepare([(None, coordinates)])
+    if error is None:
+        error = Sweep(rings).run()
+    if error is None:
+        error = hole_errors(rings[0], rings[1:])
+    return error
+
+
+def multi_polygon_error(coordinates: list[typing.Any]) -> str | None:
+    """Return the first validity error of MultiPolygon coordinates, if any.
+
+    Args:
+        coordinates: MultiPolygon coordinates whose rings are closed and have
+            at least 4 positions.
+
+    Returns:
+        An error message naming the offending polygons, rings and vertices by
+        their index in the input, or None if the MultiPolygon is valid.
+    """
+    rings, error = prepare(list(enumerate(coordinates)))
+    if error is None:
+        error = Sweep(rings).run()
+    if error is not None:
+        return error
+
+    polygons: list[list[Ring]] = [[] for _ in coordinates]
+    for ring in rings:
+        polygons[ring.polygon].append(ring)
+    for rings_of_polygon in polygons:
+        if (error := hole_errors(rings_of_polygon[0], rings_of_polygon[1:])) is not None:
+            return error
+
+    # A polygon inside the shell of another one must lie in one of its holes.
+    shells = [rings_of_polygon[0] for rings_of_polygon in polygons]
+    for container, rings_of_polygon in enumerate(polygons):
+        others = [shell for shell in shells if shell.polygon != container]
+        locations = locate_rings(others, rings_of_polygon[0])
+        inside = [shell for shell, location in zip(others, locations, strict=True) if location]
+        for hole in rings_of_polygon[1:]:
+            if not inside:
+                break
+            locations = locate_rings(inside, hole)
+            inside = [
+                shell for shell, location in zip(inside, locations, strict=True) if not location
+            ]
+        if inside:
+            return (
+                f"Overlapping polygons: polygon {inside[0].polygon} overlaps polygon {container}."
+            )
+    return None
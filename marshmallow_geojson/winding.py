@@ -0,0 +1,112 @@
+"""Ring winding order (right-hand rule) of Polygons and MultiPolygons.
+
+RFC 7946 Section 3.1.6 says exterior rings SHOULD be counterclockwise and
+interior rings (holes) clockwise. Orientation is taken from the sign of the
+planar ring area computed with the shoelace formula on longitude/latitude,
+as most GeoJSON tools do.
+
+References:
+    https://datatracker.ietf.org/doc/html/rfc7946#section-3.1.6
+"""
+
+from __future__ import annotations
+
+import typing
+from operator import itemgetter, mul
+
+from .object_type import (
+    FEATURE,
+    FEATURE_COLLECTION,
+    GEOMETRY_COLLECTION,
+    MULTI_POLYGON,
+    POLYGON,
+)
+
+get_x = itemgetter(0)
+get_y = itemgetter(1)
+
+
+def ring_area(ring: typing.Sequence[typing.Sequence[float]]) -> float:
+    """Return the signed planar area of a closed ring.
+
+    The products of the shoelace formula are computed over whole coordinate
+    columns with ``map`` rather than one position at a time.
+
+    Args:
+        ring: The ring positions, first and last being equal.
+
+    Returns:
+        The area, positive for counterclockwise rings and negative for
+        clockwise ones.
+    """
+    xs = list(map(get_x, ring))
+    ys = list(map(get_y, ring))
+    area: float = (sum(map(mul, xs, ys[1:])) - sum(map(mul, xs[1:], ys))) / 2
+    return area
+
+
+def ring_areas(rings: typing.Iterable[typing.Sequence[typing.Sequence[float]]]) -> list[float]:
+    """Return the signed area of each ring (see :func:`ring_area`).
+
+    Malformed rings (e.g. empty ones or positions without a latitude) count
+    as having no area; the linear ring validators report them.
+    """
+    areas = []
+    for ring in rings:
+        try:
+            areas.append(ring_area(ring))
+        except (IndexError, TypeError):
+            areas.append(0.0)
+    return areas
+
+
+def rewind_polygon(rings: list[typing.Any]) -> list[typing.Any]:
+    """Orient the rings of a Polygon following the right-hand rule.
+
+    Rings are reversed in place: the exterior ring becomes counterclockwise
+    and holes clockwise. Rings with no area are left alone.
+
+    Args:
+        rings: The Polygon coordinates, as lists.
+
+    Returns:
+        The same rings.
+    """
+    for idx, area in enumerate(ring_areas(rings)):
+        if (area < 0) if idx == 0 else (area > 0):
+            rings[idx].reverse()
+    return rings
+
+
+def rewind(obj: typing.Any, skip: typing.Container[int] = ()) -> typing.Any:
+    """Orient the rings of every Polygon and MultiPolygon of a GeoJSON object.
+
+    Features, FeatureCollections and GeometryCollections are walked; other
+    objects are left unchanged. Coordinates are reversed in place.
+
+    Args:
+        obj: A GeoJSON object with list coordinates, e.g. as returned by
+            :meth:`GeoJSONSchema.load`, or None.
+        skip: ``id()`` of objects left unchanged, with everything they contain.
+
+    Returns:
+        The same object.
+    """
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if not isinstance(item, typing.Mapping) or id(item) in skip:
+            continue
+        object_type = item.get("type")
+        if object_type == POLYGON:
+            rewind_polygon(item.get("coordinates") or [])
+        elif object_type == MULTI_POLYGON:
+            for polygon in item.get("coordinates") or ():
+                rewind_polygon(polygon)
+        elif object_type == GEOMETRY_COLLECTION:
+            stack.extend(item.get("geometries") or ())
+        elif object_type == FEATURE:
+            stack.append(item.get("geometry"))
+        elif object_type == FEATURE_COLLECTION:
+            stack.extend(item.get("features") or ())
+    return obj
@@ -0,0 +1,337 @@
+"""Well-Known Binary (WKB) encoding and decoding of GeoJSON geometries.
+
+Both ISO WKB (as written by most GIS libraries) and PostGIS Extended WKB
+(EWKB, which can carry an SRID) are decoded. Z coordinates are kept as
+altitudes; M coordinates have no GeoJSON counterpart and are dropped.
+Coordinates are read and written with one ``struct`` call per coordinate
+sequence rather than per number.
+
+References:
+    https://libgeos.org/specifications/wkb/
+    https://www.rfc-editor.org/rfc/rfc7946.html#section-3.1
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+import typing
+from typing import Literal
+
+from marshmallow import ValidationError
+
+from .object_type import (
+    GEOMETRY_COLLECTION,
+    LINE_STRING,
+    MULTI_LINE_STRING,
+    MULTI_POINT,
+    MULTI_POLYGON,
+    POINT,
+    POLYGON,
+)
+
+WKB_TYPES = {
+    1: POINT,
+    2: LINE_STRING,
+    3: POLYGON,
+    4: MULTI_POINT,
+    5: MULTI_LINE_STRING,
+    6: MULTI_POLYGON,
+    7: GEOMETRY_COLLECTION,
+}
+WKB_CODES = {geometry_type: code for code, geometry_type in WKB_TYPES.items()}
+
+# Geometry type of the members of each multi-part geometry.
+MEMBER_TYPES = {
+    MULTI_POINT: POINT,
+    MULTI_LINE_STRING: LINE_STRING,
+    MULTI_POLYGON: POLYGON,
+}
+
+# EWKB flags stored in the high bits of the geometry type code.
+EWKB_Z = 0x80000000
+EWKB_M = 0x40000000
+EWKB_SRID = 0x20000000
+
+BYTE_ORDERS = {"little": (1, "<"), "big": (0, ">")}
+
+
+def wkb_error(message: str) -> ValidationError:
+    """Build the error raised for malformed WKB."""
+    return ValidationError({"_schema": [f"Invalid WKB: {message}"]})
+
+
+class WKBReader:
+    """Decodes a single WKB or EWKB geometry.
+
+    Args:
+        data: The WKB bytes.
+    """
+
+    def __init__(self, data: bytes | bytearray | memoryview):
+        self.buffer = data
+        self.offset = 0
+        self.srid: int | None = None
+
+    def unpack(self, fmt: str) -> tuple[typing.Any, ...]:
+        """Unpack values at the current offset and advance past them."""
+        try:
+            values = struct.unpack_from(fmt, self.buffer, self.offset)
+        except struct.error as error:
+            raise wkb_error("unexpected end of data.") from error
+        self.offset += struct.calcsize(fmt)
+        return values
+
+    def read(self) -> dict[str, typing.Any]:
+        """Read a geometry, including its header.
+
+        Multi-part geometries and GeometryCollections are read with an
+        explicit stack, so deeply nested input cannot exhaust the Python
+        stack.
+
+        Returns:
+            The GeoJSON geometry.
+
+        Raises:
+            ValidationError: If the data is malformed.
+        """
+        # Multi-part geometries being read: type, members read so far, count.
+        stack: list[tuple[str, list[dict[str, typing.Any]], int]] = []
+        while True:
+            expected = MEMBER_TYPES.get(stack[-1][0]) if stack else None
+            geometry_type, byte_order, reader = self.header(expected)
+            geometry: dict[str, typing.Any] | None = None
+            if geometry_type == POINT:
+                position = reader.read(1)[0]
+                if all(math.isnan(value) for value in position):
+                    raise wkb_error("empty points cannot be represented in GeoJSON.")
+                geometry = {"type": POINT, "coordinates": position}
+            elif geometry_type == LINE_STRING:
+                geometry = {"type": LINE_STRING, "coordinates": reader.read(self.count(byte_order))}
+            elif geometry_type == POLYGON:
+                rings = [reader.read(self.count(byte_order)) for _ in range(self.count(byte_order))]
+                geometry = {"type": POLYGON, "coordinates": rings}
+            else:
+                stack.append((geometry_type, [], self.count(byte_order)))
+
+            # Close the multi-part geometries whose members are all read.
+            while True:
+                if geometry is None:
+                    if not stack or len(stack[-1][1]) < stack[-1][2]:
+                        break
+                    geometry_type, members, _ = stack.pop()
+                    if geometry_type == GEOMETRY_COLLECTION:
+                        geometry = {"type": GEOMETRY_COLLECTION, "geometries": members}
+                    else:
+                        coordinates = [member["coordinates"] for member in members]
+                        geometry = {"type": geometry_type, "coordinates": coordinates}
+                if not stack:
+                    return geometry
+                stack[-1][1].append(geometry)
+                geometry = None
+
+    def header(self, expected: str | None) -> tuple[str, str, PositionReader]:
+        """Read a geometry header.
+
+        Args:
+            expected: Geometry type required by the enclosing multi-part
+                geometry, if any.
+
+        Returns:
+            A tuple ``(geometry_type, byte_order, reader)`` with the reader
+            of the geometry positions.
+
+        Raises:
+            ValidationError: If the header is malformed.
+        """
+        (order,) = self.unpack("B")
+        if order not in (0, 1):
+            raise wkb_error(f"invalid byte order {order}.")
+        byte_order = "<" if order else ">"
+        (code,) = self.unpack(byte_order + "I")
+
+        has_z = bool(code & EWKB_Z)
+        has_m = bool(code & EWKB_M)
+        if code & EWKB_SRID:
+            (self.srid,) = self.unpack(byte_order + "i")
+        code &= 0x0FFFFFFF
+        dimensions, code = divmod(code, 1000)
+        has_z = has_z or dimensions in (1, 3)
+        has_m = has_m or dimensions in (2, 3)
+
+        geometry_type = WKB_TYPES.get(code)
+        if geometry_type is None or dimensions > 3:
+            raise wkb_error(f"unknown geometry type {code}.")
+        if expected is not None and geometry_type != expected:
+            raise wkb_error(f"expected {expected}, got {geometry_type}.")
+        return geometry_type, byte_order, PositionReader(self, byte_order, has_z, has_m)
+
+    def count(self, byte_order: str) -> int:
+        """Read an element count, checking it against the remaining data."""
+        count: int = self.unpack(byte_order + "I")[0]
+        if count > len(self.buffer) - self.offset:
+            raise wkb_error("unexpected end of data.")
+        return count
+
+
+class PositionReader:
+    """Reads coordinate sequences of one geometry in bulk."""
+
+    def __init__(self, reader: WKBReader, byte_order: str, has_z: bool, has_m: bool):
+        self.reader = reader
+        self.byte_order = byte_order
+        self.stride = 2 + has_z + has_m
+        self.size = 2 + has_z
+
+    def read(self, count: int) -> list[list[float]]:
+        """Read ``count`` positions, dropping M values."""
+        values = self.reader.unpack(f"{self.byte_order}{count * self.stride}d")
+        stride, size = self.stride, self.size
+        return [list(values[idx : idx + size]) for idx in range(0, len(values), stride)]
+
+
+def decode_wkb(
+    data: bytes | bytearray | memoryview | str,
+) -> tuple[dict[str, typing.Any], int | None]:
+    """Decode a WKB or EWKB geometry.
+
+    The result is not validated; pass it to a geometry schema to apply the
+    GeoJSON checks (see :meth:`GeometriesSchema.load_wkb`).
+
+    Args:
+        data: WKB bytes, or WKB as a hexadecimal string (as returned by
+            PostGIS).
+
+    Returns:
+        A tuple ``(geometry, srid)``. ``srid`` is None unless the data is
+        EWKB with an SRID.
+
+    Raises:
+        ValidationError: If the data is not valid WKB.
+    """
+    if isinstance(data, str):
+        try:
+            data = bytes.fromhex(data)
+        except ValueError as error:
+            raise wkb_error("invalid hexadecimal string.") from error
+    elif not isinstance(data, bytes | bytearray | memoryview):
+        raise wkb_error("expected bytes or a hexadecimal string.")
+
+    reader = WKBReader(data)
+    geometry = reader.read()
+    if reader.offset != len(data):
+        raise wkb_error("unexpected data after the geometry.")
+    return geometry, reader.srid
+
+
+class WKBWriter:
+    """Encodes GeoJSON geometries as WKB or EWKB.
+
+    Args:
+        byte_order: "little" (NDR) or "big" (XDR) endian.
+        srid: SRID to embed. When given, EWKB is written; otherwise ISO WKB.
+    """
+
+    def __init__(self, byte_order: Literal["little", "big"] = "little", srid: int | None = None):
+        if byte_order not in BYTE_ORDERS:
+            raise ValueError(f"byte_order must be 'little' or 'big', not {byte_order!r}.")
+        self.order, self.byte_order = BYTE_ORDERS[byte_order]
+        self.srid = srid
+        self.parts: list[bytes] = []
+
+    def write(self, geometry: typing.Mapping[str, typing.Any], *, top: bool = True) -> None:
+        """Append the encoding of a geometry."""
+        geometry_type = geometry["type"]
+        if geometry_type not in WKB_CODES:
+            raise ValueError(f"Cannot encode {geometry_type!r} as WKB.")
+
+        if geometry_type == GEOMETRY_COLLECTION:
+            members = geometry["geometries"]
+            dimensions = 2
+        else:
+            coordinates = geometry["coordinates"]
+            dimensions = self.dimensions(coordinates)
+        self.header(geometry_type, dimensions, top=top)
+
+        if geometry_type == GEOMETRY_COLLECTION:
+            self.count(len(members))
+            for member in members:
+                self.write(member, top=False)
+        elif geometry_type == POINT:
+            self.positions([coordinates], dimensions)
+        elif geometry_type == LINE_STRING:
+            self.count(len(coordinates))
+            self.positions(coordinates, dimensions)
+        elif geometry_type == POLYGON:
+            self.count(len(coordinates))
+            for ring in coordinates:
+                self.count(len(ring))
+                self.positions(ring, dimensions)
+        else:
+            self.count(len(coordinates))
+            member_type = MEMBER_TYPES[geometry_type]
+            for member in coordinates:
+                self.write({"type": member_type, "coordinates": member}, top=False)
+
+    @staticmethod
+    def dimensions(coordinates: typing.Any) -> int:
+        """Return the number of dimensions of the first position."""
+        while coordinates and isinstance(coordinates[0], list | tuple):
+            coordinates = coordinates[0]
+        return 3 if len(coordinates) > 2 else 2
+
+    def header(self, geometry_type: str, dimensions: int, *, top: bool) -> None:
+        """Append the byte order and geometry type code."""
+        code = WKB_CODES[geometry_type]
+        srid = self.srid if top else None
+        if self.srid is None:
+            code += 1000 if dimensions == 3 else 0
+            self.parts.append(struct.pack(f"{self.byte_order}BI", self.order, code))
+            return
+        if dimensions == 3:
+            code |= EWKB_Z
+        if srid is None:
+            self.parts.append(struct.pack(f"{self.byte_order}BI", self.order, code))
+        else:
+            code |= EWKB_SRID
+            self.parts.append(struct.pack(f"{self.byte_order}BIi", self.order, code, srid))
+
+    def count(self, count: int) -> None:
+        """Append an element count."""
+        self.parts.append(struct.pack(f"{self.byte_order}I", count))
+
+    def positions(self, positions: typing.Sequence[typing.Any], dimensions: int) -> None:
+        """Append a coordinate sequence with a single ``struct.pack`` call."""
+        values = [value for position in positions for value in position]
+        if len(values) != len(positions) * dimensions:
+            raise ValueError("Cannot encode geometries mixing 2-D and 3-D positions as WKB.")
+        self.parts.append(struct.pack(f"{self.byte_order}{len(values)}d", *values))
+
+    def getvalue(self) -> bytes:
+        """Return the encoded bytes."""
+        return b"".join(self.parts)
+
+
+def encode_wkb(
+    geometry: typing.Mapping[str, typing.Any],
+    *,
+    byte_order: Literal["little", "big"] = "little",
+    srid: int | None = None,
+) -> bytes:
+    """Encode a GeoJSON geometry as WKB.
+
+    Args:
+        geometry: A GeoJSON geometry object.
+        byte_order: "little" (NDR) or "big" (XDR) endian.
+        srid: SRID to embed. When given, PostGIS EWKB is written; otherwise
+            ISO WKB.
+
+    Returns:
+        The WKB bytes.
+
+    Raises:
+        ValueError: If the geometry cannot be encoded.
+    """
+    writer = WKBWriter(byte_order, srid)
+    writer.write(geometry)
+    return writer.getvalue()
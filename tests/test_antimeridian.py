@@ -0,0 +1,270 @@
+"""Tests for cutting geometries at the antimeridian."""
+
+from unittest import mock
+
+import pytest
+
+from marshmallow_geojson import (
+    LineStringSchema,
+    MultiLineStringSchema,
+    MultiPolygonSchema,
+    PolygonSchema,
+)
+from marshmallow_geojson._clip import cut_antimeridian, split_line, split_polygon
+
+# A box from 170 E to 170 W, crossing the antimeridian.
+PACIFIC = [[170.0, -10.0], [-170.0, -10.0], [-170.0, 10.0], [170.0, 10.0], [170.0, -10.0]]
+PACIFIC_HOLE = [[175.0, -5.0], [175.0, 5.0], [-175.0, 5.0], [-175.0, -5.0], [175.0, -5.0]]
+
+
+def bounds(ring):
+    """Longitude and latitude range of a ring."""
+    xs = [position[0] for position in ring]
+    ys = [position[1] for position in ring]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def line_parts(geometry):
+    """Lines of a LineString or MultiLineString."""
+    if geometry["type"] == "LineString":
+        return [geometry["coordinates"]]
+    return geometry["coordinates"]
+
+
+class TestSplitLine:
+    """Test suite for split_line."""
+
+    def test_crossing(self):
+        """Test that the crossing latitude and altitude are interpolated."""
+        line = [[170.0, 0.0, 0.0], [-170.0, 10.0, 100.0], [-160.0, 10.0, 100.0]]
+
+        assert split_line(line) == [
+            [[170.0, 0.0, 0.0], [180.0, 5.0, 50.0]],
+            [[-180.0, 5.0, 50.0], [-170.0, 10.0, 100.0], [-160.0, 10.0, 100.0]],
+        ]
+
+    def test_westward_and_back(self):
+        """Test lines crossing westward and back again."""
+        line = [[-170.0, 0.0], [170.0, 0.0], [-170.0, 0.0]]
+
+        assert split_line(line) == [
+            [[-170.0, 0.0], [-180.0, 0.0]],
+            [[180.0, 0.0], [170.0, 0.0], [180.0, 0.0]],
+            [[-180.0, 0.0], [-170.0, 0.0]],
+        ]
+
+    @pytest.mark.parametrize(
+        "line,expected",
+        [
+            (
+                [[170.0, 0.0], [180.0, 0.0], [-180.0, 0.0], [-170.0, 0.0]],
+                [[[170.0, 0.0], [180.0, 0.0]], [[-180.0, 0.0], [-170.0, 0.0]]],
+            ),
+            (
+                [[-170.0, 1.0], [-180.0, 1.0], [180.0, 1.0], [170.0, 1.0]],
+                [[[-170.0, 1.0], [-180.0, 1.0]], [[180.0, 1.0], [170.0, 1.0]]],
+            ),
+            ([[-180.0, 0.0], [180.0, 0.0]], []),
+        ],
+    )
+    def test_already_cut(self, line, expected):
+        """Test that steps between 180 and -180 are kept as cuts, without interpolating."""
+        assert split_line(line) == expected
+
+    def test_not_crossing(self):
+        """Test that lines not crossing the antimeridian are kept whole."""
+        line = [[170.0, 0.0], [0.0, 0.0], [-170.0, 0.0]]
+
+        assert split_line(line) == [line]
+
+
+class TestSplitPolygon:
+    """Test suite for split_polygon."""
+
+    def test_crossing(self):
+        """Test that a crossing polygon is cut in an eastern and a western piece."""
+        pieces = split_polygon([PACIFIC, PACIFIC_HOLE])
+
+        assert [bounds(polygon[0]) for polygon in pieces] == [
+            (170.0, -10.0, 180.0, 10.0),
+            (-180.0, -10.0, -170.0, 10.0),
+        ]
+        assert [bounds(polygon[1]) for polygon in pieces] == [
+            (175.0, -5.0, 180.0, 5.0),
+            (-180.0, -5.0, -175.0, 5.0),
+        ]
+        for polygon in pieces:
+            for ring in polygon:
+                assert ring[0] == ring[-1]
+
+    def test_not_crossing(self):
+        """Test that polygons not crossing the antimeridian are returned as they are."""
+        polygon = [[[0, 0], [1, 0], [1, 1], [0, 0]]]
+
+        assert split_polygon(polygon) == [polygon]
+
+    def test_already_cut(self):
+        """Test that rings running along the antimeridian are cut without interpolating."""
+        ring = [
+            [170.0, -10.0],
+            [180.0, -10.0],
+            [-180.0, -10.0],
+            [-170.0, -10.0],
+            [-170.0, 10.0],
+            [-180.0, 10.0],
+            [180.0, 10.0],
+            [170.0, 10.0],
+            [170.0, -10.0],
+        ]
+
+        assert [bounds(polygon[0]) for polygon in split_polygon([ring])] == [
+            (170.0, -10.0, 180.0, 10.0),
+            (-180.0, -10.0, -170.0, 10.0),
+        ]
+
+    def test_no_area(self):
+        """Test that rings with no area on either side are returned as they are."""
+        polygon = [[[-180.0, 0.0], [180.0, 0.0], [180.0, 1.0], [-180.0, 0.0]]]
+
+        assert split_polygon(polygon) == [polygon]
+
+    def test_around_pole(self):
+        """Test that polygons around a pole are not cut."""
+        ring = [[0.0, 80.0], [120.0, 80.0], [-120.0, 80.0], [0.0, 80.0]]
+
+        assert split_polygon([ring]) == [[ring]]
+
+
+class TestSplitAntimeridianSchemas:
+    """Test suite for the split_antimeridian schema option."""
+
+    def test_line_string(self):
+        """Test that crossing LineStrings load and dump as MultiLineStrings."""
+        data = {"type": "LineString", "coordinates": [[170.0, 0.0], [-170.0, 0.0]]}
+        expected = {
+            "type": "MultiLineString",
+            "coordinates": [[[170.0, 0.0], [180.0, 0.0]], [[-180.0, 0.0], [-170.0, 0.0]]],
+        }
+        schema = LineStringSchema(split_antimeridian=True)
+
+        assert schema.load(data) == expected
+        assert schema.dump(data) == expected
+        assert LineStringSchema().load(data) == data
+
+    @pytest.mark.parametrize(
+        "coordinates",
+        [
+            [[170.0, 0.0], [180.0, 0.0], [-180.0, 0.0], [-170.0, 0.0]],
+            [[-180.0, 0.0], [180.0, 0.0]],
+        ],
+    )
+    def test_line_string_already_cut(self, coordinates):
+        """Test that lines already cut at the antimeridian load."""
+        data = {"type": "LineString", "coordinates": coordinates}
+
+        loaded = LineStringSchema(split_antimeridian=True).load(data)
+
+        assert [position for line in line_parts(loaded) for position in line] == coordinates
+
+    def test_polygon_already_cut(self):
+        """Test that the pieces of an already cut Polygon load unchanged."""
+        east = [[170.0, -10.0], [180.0, -10.0], [180.0, 10.0], [170.0, 10.0], [170.0, -10.0]]
+        west = [[-180.0, -10.0], [-170.0, -10.0], [-170.0, 10.0], [-180.0, 10.0], [-180.0, -10.0]]
+        data = {"type": "MultiPolygon", "coordinates": [[east], [west]]}
+
+        assert MultiPolygonSchema(split_antimeridian=True, validity="strict").load(data) == data
+
+    def test_multi_line_string(self):
+        """Test that MultiLineStrings keep every part as a separate line."""
+        data = {
+            "type": "MultiLineString",
+            "coordinates": [[[170.0, 0.0], [-170.0, 0.0]], [[0.0, 0.0], [1.0, 1.0]]],
+        }
+
+        loaded = MultiLineStringSchema(split_antimeridian=True).load(data)
+
+        assert loaded["coordinates"] == [
+            [[170.0, 0.0], [180.0, 0.0]],
+            [[-180.0, 0.0], [-170.0, 0.0]],
+            [[0.0, 0.0], [1.0, 1.0]],
+        ]
+
+    def test_polygon(self):
+        """Test that crossing Polygons load as valid MultiPolygons."""
+        data = {"type": "Polygon", "coordinates": [PACIFIC], "bbox": [170, -10, -170, 10]}
+
+        loaded = PolygonSchema(split_antimeridian=True, validity="strict", rewind=True).load(data)
+
+        assert loaded["type"] == "MultiPolygon"
+        assert loaded["bbox"] == [170.0, -10.0, -170.0, 10.0]
+        assert [bounds(polygon[0]) for polygon in loaded["coordinates"]] == [
+            (170.0, -10.0, 180.0, 10.0),
+            (-180.0, -10.0, -170.0, 10.0),
+        ]
+        assert MultiPolygonSchema(validity="strict").load(loaded) == loaded
+
+    @pytest.mark.parametrize("validity", ["basic", "strict"])
+    def test_polygon_cut_once(self, validity):
+        """Test that the geometry is cut once, whether or not its validity is checked."""
+        data = {"type": "Polygon", "coordinates": [PACIFIC]}
+        schema = PolygonSchema(split_antimeridian=True, validity=validity)
+
+        with mock.patch(
+            "marshmallow_geojson.polygon.cut_antimeridian", side_effect=cut_antimeridian
+        ) as cut:
+            loaded = schema.load(data)
+
+        assert cut.call_count == 1
+        assert loaded["type"] == "MultiPolygon"
+
+    def test_bbox_recomputed(self):
+        """Test that the bbox of a cut line crosses the antimeridian, and is kept otherwise."""
+        data = {
+            "type": "LineString",
+            "coordinates": [[179.0, 0.0], [-179.0, 1.0]],
+            "bbox": [179.0, 0.0, -179.0, 1.0],
+        }
+        schema = LineStringSchema(split_antimeridian=True)
+
+        assert schema.load(data)["bbox"] == [179.0, 0.0, -179.0, 1.0]
+        assert schema.dump(data)["bbox"] == [179.0, 0.0, -179.0, 1.0]
+
+        line = {"type": "LineString", "coordinates": [[0.0, 0.0], [1.0, 1.0]], "bbox": [0, 0, 1, 1]}
+        assert schema.load(line)["bbox"] == [0, 0, 1, 1]
+
+    def test_bbox_dimensions(self):
+        """Test that the altitudes of a 3-D bbox are kept."""
+        schema = MultiLineStringSchema(split_antimeridian=True)
+        data = {
+            "type": "MultiLineString",
+            "coordinates": [[[170.0, 0.0, 10.0], [-170.0, 0.0, 30.0]]],
+            "bbox": [170.0, 0.0, 10.0, -170.0, 0.0, 30.0],
+        }
+
+        assert schema.load(data)["bbox"] == [170.0, 0.0, 10.0, -170.0, 0.0, 30.0]
+
+        data = {
+            "type": "MultiLineString",
+            "coordinates": [[[170.0, 0.0], [-170.0, 0.0]], [[0.0, 0.0], [10.0, 0.0]]],
+            "bbox": [-170.0, 0.0, -5.0, 170.0, 0.0, 5.0],
+        }
+
+        assert schema.load(data)["bbox"] == [0.0, 0.0, -5.0, -170.0, 0.0, 5.0]
+
+    @pytest.mark.parametrize("split_antimeridian", [False, True])
+    def test_polygon_not_crossing(self, split_antimeridian, valid_polygon_data):
+        """Test that other Polygons are left unchanged."""
+        schema = PolygonSchema(split_antimeridian=split_antimeridian)
+
+        assert schema.load(valid_polygon_data)["type"] == "Polygon"
+
+    def test_multi_polygon(self):
+        """Test that MultiPolygons collect the pieces of every polygon."""
+        data = {
+            "type": "MultiPolygon",
+            "coordinates": [[PACIFIC], [[[0, 0], [1, 0], [1, 1], [0, 0]]]],
+        }
+
+        loaded = MultiPolygonSchema(split_antimeridian=True).dump(data)
+
+        assert len(loaded["coordinates"]) == 3
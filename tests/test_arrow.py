@@ -0,0 +1,173 @@
+"""Tests for Arrow (GeoArrow) export and import."""
+
+import datetime
+
+import pytest
+from marshmallow.fields import Date, Int, Str
+
+from marshmallow_geojson import (
+    FeatureCollectionSchema,
+    PropertiesSchema,
+    from_arrow,
+    to_arrow,
+    to_arrow_batches,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+
+class CityPropertiesSchema(PropertiesSchema):
+    """Typed properties used to type Arrow columns."""
+
+    name = Str(required=True)
+    population = Int()
+    founded = Date()
+
+
+def load(features):
+    """Validate a FeatureCollection built from ``features``."""
+    return FeatureCollectionSchema().load({"type": "FeatureCollection", "features": features})
+
+
+def feature(geometry, properties=None, **members):
+    """Build a Feature."""
+    return {"type": "Feature", "geometry": geometry, "properties": properties or {}, **members}
+
+
+SQUARE = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]
+
+
+class TestToArrow:
+    """Test suite for to_arrow and to_arrow_batches."""
+
+    def test_point_encoding(self):
+        """Test Points with ids, a null geometry and inferred property types."""
+        collection = load(
+            [
+                feature({"type": "Point", "coordinates": [1, 2]}, {"name": "a", "rank": 1}, id=1),
+                feature(None, {"name": "b", "score": 0.5}, id=2),
+            ]
+        )
+
+        table = to_arrow(collection)
+
+        assert table.column_names == ["id", "geometry", "name", "rank", "score"]
+        field = table.schema.field("geometry")
+        assert field.metadata[b"ARROW:extension:name"] == b"geoarrow.point"
+        assert table.column("geometry").to_pylist() == [{"x": 1.0, "y": 2.0}, None]
+        assert table.schema.field("rank").type == pa.int64()
+        assert table.column("score").to_pylist() == [None, 0.5]
+
+    def test_polygons_promoted_to_multipolygon(self):
+        """Test that Polygons and MultiPolygons share the multipolygon encoding."""
+        collection = load(
+            [
+                feature({"type": "Polygon", "coordinates": [SQUARE]}),
+                feature({"type": "MultiPolygon", "coordinates": [[SQUARE], [SQUARE, SQUARE]]}),
+            ]
+        )
+
+        table = to_arrow(collection)
+
+        field = table.schema.field("geometry")
+        assert field.metadata[b"ARROW:extension:name"] == b"geoarrow.multipolygon"
+        polygons = table.column("geometry").to_pylist()
+        assert len(polygons[0]) == 1
+        assert [len(rings) for rings in polygons[1]] == [1, 2]
+        assert polygons[1][1][0][2] == {"x": 1.0, "y": 1.0}
+
+    def test_3d_coordinates(self):
+        """Test that altitudes produce a z coordinate."""
+        collection = load([feature({"type": "LineString", "coordinates": [[0, 0, 5], [1, 1, 6]]})])
+
+        geometry = to_arrow(collection).column("geometry").to_pylist()[0]
+        assert geometry == [{"x": 0.0, "y": 0.0, "z": 5.0}, {"x": 1.0, "y": 1.0, "z": 6.0}]
+
+    def test_typed_properties(self):
+        """Test that PropertiesSchema fields type the property columns."""
+        collection = load(
+            [
+                feature(
+                    {"type": "Point", "coordinates": [1, 2]},
+                    {"name": "a", "founded": datetime.date(1900, 1, 1), "tags": ["x"]},
+                ),
+                feature({"type": "Point", "coordinates": [3, 4]}, {"name": "b"}),
+            ]
+        )
+
+        table = to_arrow(collection, properties_schema=CityPropertiesSchema)
+
+        assert table.schema.field("population").type == pa.int64()
+        assert table.schema.field("founded").type == pa.date32()
+        assert table.schema.field("tags").metadata[b"ARROW:extension:name"] == b"arrow.json"
+        assert table.column("tags").to_pylist() == ['["x"]', None]
+
+    def test_batches(self):
+        """Test that collections are converted in batches sharing one schema."""
+        collection = load(
+            [feature({"type": "Point", "coordinates": [idx, 0]}, {"idx": idx}) for idx in range(10)]
+        )
+
+        batches = list(to_arrow_batches(collection, batch_size=4))
+
+        assert [batch.num_rows for batch in batches] == [4, 4, 2]
+        assert len({batch.schema for batch in batches}) == 1
+        assert to_arrow(collection, batch_size=4).column("geometry").num_chunks == 3
+
+    def test_mixed_geometry_types(self):
+        """Test that types without a shared native encoding are rejected."""
+        collection = load(
+            [
+                feature({"type": "Point", "coordinates": [1, 2]}),
+                feature({"type": "Polygon", "coordinates": [SQUARE]}),
+            ]
+        )
+
+        with pytest.raises(ValueError, match="GeoArrow"):
+            to_arrow(collection)
+
+
+class TestFromArrow:
+    """Test suite for from_arrow."""
+
+    @pytest.mark.parametrize(
+        "geometry",
+        [
+            {"type": "Point", "coordinates": [1.0, 2.0]},
+            {"type": "MultiPoint", "coordinates": [[1.0, 2.0], [3.0, 4.0]]},
+            {"type": "LineString", "coordinates": [[0.0, 0.0, 1.0], [1.0, 1.0, 2.0]]},
+            {"type": "MultiLineString", "coordinates": [[[0.0, 0.0], [1.0, 1.0]]]},
+            {"type": "Polygon", "coordinates": [SQUARE, SQUARE]},
+            {"type": "MultiPolygon", "coordinates": [[SQUARE], [SQUARE]]},
+        ],
+    )
+    def test_round_trip(self, geometry):
+        """Test that each native encoding round-trips through Arrow."""
+        collection = load(
+            [
+                feature(geometry, {"name": "a", "meta": {"k": 1}}, id="f1"),
+                feature(None, {"name": "b"}),
+            ]
+        )
+
+        result = from_arrow(to_arrow(collection, batch_size=1))
+
+        assert FeatureCollectionSchema().load(result) == {
+            "type": "FeatureCollection",
+            "features": [
+                feature(geometry, {"name": "a", "meta": {"k": 1}}, id="f1"),
+                feature(None, {"name": "b", "meta": None}),
+            ],
+        }
+
+    def test_record_batches(self):
+        """Test that record batches and batch iterables are accepted."""
+        collection = load([feature({"type": "Point", "coordinates": [1.0, 2.0]})])
+        batches = list(to_arrow_batches(collection))
+
+        assert from_arrow(batches[0]) == from_arrow(iter(batches)) == collection
+
+    def test_missing_geometry_column(self):
+        """Test that tables without a geometry column are rejected."""
+        with pytest.raises(ValueError, match="geometry"):
+            from_arrow(pa.table({"name": ["a"]}))
@@ -0,0 +1,162 @@
+"""Tests for the compact binary encoding."""
+
+import json
+
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_geojson import GeoJSONSchema
+from marshmallow_geojson.binary import decode_binary, detect_precision, encode_binary
+
+SQUARE = [[0.0, 0.0], [1.5, 0.0], [1.5, 1.25], [0.0, 0.0]]
+
+
+@pytest.fixture
+def feature_collection():
+    """FeatureCollection covering every object type."""
+    geometries = [
+        {"type": "Point", "coordinates": [-73.98765, 40.75]},
+        {"type": "MultiPoint", "coordinates": [[1.0, 2.0], [3.0, 4.0]]},
+        {"type": "LineString", "coordinates": [[0.0, 0.0, 10.5], [1.0, 1.0, -3.0]]},
+        {"type": "MultiLineString", "coordinates": [[[0.0, 0.0], [1.0, 1.0]]]},
+        {"type": "Polygon", "coordinates": [SQUARE]},
+        {"type": "MultiPolygon", "coordinates": [[SQUARE], [SQUARE, SQUARE]]},
+        {
+            "type": "GeometryCollection",
+            "geometries": [{"type": "Point", "coordinates": [5.0, 5.0]}],
+        },
+        None,
+    ]
+    return {
+        "type": "FeatureCollection",
+        "bbox": [-80.0, 0.0, 10.0, 50.0],
+        "features": [
+            {
+                "type": "Feature",
+                "id": f"f{idx}" if idx % 2 else idx,
+                "geometry": geometry,
+                "properties": {
+                    "name": f"feature é {idx}",
+                    "rank": -idx,
+                    "score": idx / 4,
+                    "flags": [True, False, None],
+                    "meta": {"source": "survey"},
+                },
+            }
+            for idx, geometry in enumerate(geometries)
+        ],
+    }
+
+
+class TestBinaryEncoding:
+    """Test suite for the binary codec."""
+
+    def test_round_trip(self, feature_collection):
+        """Test that every object type, member and value type round-trips."""
+        assert decode_binary(encode_binary(feature_collection)) == feature_collection
+
+    def test_many(self, feature_collection):
+        """Test that lists of objects round-trip."""
+        objects = feature_collection["features"][:3]
+
+        assert decode_binary(encode_binary(objects)) == objects
+
+    def test_detect_precision(self):
+        """Test that the precision covers the most precise coordinate."""
+        assert detect_precision({"type": "Point", "coordinates": [1.0, 2.0]}) == 0
+        assert detect_precision({"type": "Point", "coordinates": [1.25, 2.5]}) == 2
+        assert detect_precision({"type": "Point", "coordinates": [0.1234567, 0]}) == 7
+        assert detect_precision({"type": "Point", "coordinates": [0.123456789, 0]}) is None
+
+    def test_lossless_fallback(self):
+        """Test that coordinates needing more than 7 digits are kept as doubles."""
+        line = {
+            "type": "LineString",
+            "coordinates": [[-73.98765432109876, 40.1], [1 / 3, 2.0, -0.1 + 0.2]],
+        }
+        line["coordinates"][0].append(0.5)
+
+        assert decode_binary(encode_binary(line)) == line
+        assert decode_binary(encode_binary([line, line])) == [line, line]
+        with pytest.raises(ValidationError):
+            decode_binary(encode_binary(line)[:-1])
+
+    def test_null_id(self):
+        """Test that an explicit null id is kept apart from a missing one."""
+        features = [
+            {"type": "Feature", "id": None, "geometry": None, "properties": {}},
+            {"type": "Feature", "geometry": None, "properties": {}},
+        ]
+
+        decoded = decode_binary(encode_binary(features))
+        assert decoded == features
+        assert "id" in decoded[0] and "id" not in decoded[1]
+
+    def test_quantization(self):
+        """Test that coordinates are rounded to the requested precision."""
+        point = {"type": "Point", "coordinates": [1.23456, 2.0]}
+
+        assert decode_binary(encode_binary(point, precision=2))["coordinates"] == [1.23, 2.0]
+
+    def test_smaller_than_json(self):
+        """Test that a dense line is much smaller than its JSON encoding."""
+        line = {
+            "type": "LineString",
+            "coordinates": [[13.0 + idx * 1e-5, 52.0 + idx * 2e-5] for idx in range(1000)],
+        }
+
+        assert len(encode_binary(line)) * 5 < len(json.dumps(line))
+
+    @pytest.mark.parametrize("precision", [None, 2])
+    def test_mixed_dimensions(self, precision):
+        """Test that geometries mixing 2-D and 3-D positions are rejected."""
+        line = {"type": "LineString", "coordinates": [[1.0, 2.0], [3.0, 4.0, 5.0]]}
+
+        with pytest.raises(ValueError, match="mixing 2-D and 3-D"):
+            encode_binary(line, precision=precision)
+        with pytest.raises(ValueError, match="mixing 2-D and 3-D"):
+            GeoJSONSchema().dumps_binary(
+                {"type": "MultiPoint", "coordinates": [[1.0, 2.0, 3.0], [4.0, 5.0]]}
+            )
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"JSON",
+            b"GJB\x01\x00\x00\x00",
+            b"GJB\x01\x00\x00\x00\x01\x02",
+            b"GJB\x01\x00\x00\x00\x63",
+            b"GJB\x01\x00\x00\x00\x00",
+            b"GJB\x01\x00\x00\x00\x01\x02\x02\x04\x00\x00",
+        ],
+    )
+    def test_invalid(self, data):
+        """Test that malformed payloads raise ValidationError."""
+        with pytest.raises(ValidationError):
+            decode_binary(data)
+
+
+class TestGeoJSONSchemaBinary:
+    """Test suite for GeoJSONSchema.dumps_binary and loads_binary."""
+
+    def test_round_trip(self, feature_collection):
+        """Test that loads_binary returns what load returns."""
+        schema = GeoJSONSchema()
+        loaded = schema.load(feature_collection)
+
+        assert schema.loads_binary(schema.dumps_binary(loaded)) == loaded
+
+    def test_many(self, valid_point_data, valid_polygon_data):
+        """Test binary payloads in many mode."""
+        schema = GeoJSONSchema(many=True)
+        data = [valid_point_data, valid_polygon_data]
+
+        assert schema.loads_binary(schema.dumps_binary(data)) == schema.load(data)
+
+    def test_validates(self):
+        """Test that decoded objects are validated like JSON input."""
+        payload = encode_binary({"type": "Point", "coordinates": [200.0, 0.0]})
+
+        with pytest.raises(ValidationError, match="Longitude"):
+            GeoJSONSchema().loads_binary(payload)
@@ -0,0 +1,194 @@
+"""Tests for the columnar FeatureCollection layout."""
+
+import math
+from array import array
+
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_geojson import FeatureCollectionSchema, GeoJSONSchema
+from marshmallow_geojson.columnar import from_columnar
+
+
+@pytest.fixture
+def mixed_feature_collection():
+    """FeatureCollection with every geometry type, a null geometry and mixed properties."""
+    square = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]
+    geometries = [
+        {"type": "Point", "coordinates": [1.0, 2.0, 3.0]},
+        {"type": "MultiPoint", "coordinates": [[1.0, 2.0], [3.0, 4.0]]},
+        {"type": "LineString", "coordinates": [[0.0, 0.0], [1.0, 1.0]]},
+        {
+            "type": "MultiLineString",
+            "coordinates": [[[0.0, 0.0], [1.0, 1.0]], [[2.0, 2.0], [3.0, 3.0]]],
+        },
+        {"type": "Polygon", "coordinates": [square, square]},
+        {"type": "MultiPolygon", "coordinates": [[square], [square, square]]},
+        {
+            "type": "GeometryCollection",
+            "geometries": [{"type": "Point", "coordinates": [5.0, 5.0]}],
+        },
+        None,
+    ]
+    return {
+        "type": "FeatureCollection",
+        "bbox": [0.0, 0.0, 5.0, 5.0],
+        "features": [
+            {
+                "type": "Feature",
+                "id": idx if idx % 2 else None,
+                "geometry": geometry,
+                "properties": {"name": f"f{idx}", **({"extra": idx} if idx > 3 else {})},
+            }
+            for idx, geometry in enumerate(geometries)
+        ],
+    }
+
+
+class TestColumnarLayout:
+    """Test suite for FeatureCollectionSchema.load(..., layout="columnar")."""
+
+    def test_columns(self):
+        """Test the columns built for a simple FeatureCollection."""
+        data = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "id": "a",
+                    "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1], [2, 0]]},
+                    "properties": {"name": "line"},
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [5, 6]},
+                    "properties": {"rank": 1},
+                },
+            ],
+        }
+
+        result = FeatureCollectionSchema().load(data, layout="columnar")
+
+        assert set(result) == {"type", "columns"}
+        assert result["type"] == "FeatureCollection"
+        columns = result["columns"]
+        assert columns["id"] == ["a", None]
+        assert columns["geometry_type"] == ["LineString", "Point"]
+        assert columns["x"] == array("d", [0, 1, 2, 5])
+        assert columns["y"] == array("d", [0, 1, 0, 6])
+        assert columns["z"] is None
+        assert list(columns["geometry_offsets"]) == [0, 1, 2]
+        assert list(columns["part_offsets"]) == [0, 1, 2]
+        assert list(columns["ring_offsets"]) == [0, 3, 4]
+        assert columns["properties"] == {"name": ["line", None], "rank": [None, 1]}
+
+    def test_mixed_dimensions(self):
+        """Test that 2-D positions hold NaN altitudes when other positions are 3-D."""
+        data = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": c},
+                    "properties": {},
+                }
+                for c in ([1, 2], [3, 4, 5])
+            ],
+        }
+
+        result = FeatureCollectionSchema().load(data, layout="columnar")
+
+        assert math.isnan(result["columns"]["z"][0])
+        assert result["columns"]["z"][1] == 5
+
+    def test_round_trip(self, mixed_feature_collection):
+        """Test that dumping the columnar layout matches dumping the regular layout."""
+        schema = FeatureCollectionSchema()
+        columnar = schema.load(mixed_feature_collection, layout="columnar")
+        regular = schema.load(mixed_feature_collection)
+
+        dumped = schema.dump(columnar)
+        assert dumped["bbox"] == regular["bbox"]
+        for feature, expected in zip(dumped["features"], regular["features"], strict=True):
+            assert feature["geometry"] == expected["geometry"]
+            assert feature.get("id") == expected.get("id")
+            for key, value in feature["properties"].items():
+                assert expected["properties"].get(key) == value
+
+        assert GeoJSONSchema().dump(columnar) == dumped
+
+    def test_foreign_members(self, mixed_feature_collection):
+        """Test that foreign members named like columns are kept."""
+        foreign = {"id": "collection", "x": [1, 2], "layout": "columnar"}
+        mixed_feature_collection.update(foreign)
+        schema = FeatureCollectionSchema()
+
+        columnar = schema.load(mixed_feature_collection, layout="columnar")
+        assert {key: columnar[key] for key in foreign} == foreign
+        assert columnar["columns"]["id"] == [None, 1, None, 3, None, 5, None, 7]
+
+        regular = from_columnar(columnar)
+        assert {key: regular[key] for key in foreign} == foreign
+        assert [feature.get("id") for feature in regular["features"]] == columnar["columns"]["id"]
+        assert schema.dump(columnar) == schema.dump(regular)
+
+    def test_regular_collection_not_columnar(self, mixed_feature_collection):
+        """Test that only the full columnar shape is dumped as columns."""
+        schema = FeatureCollectionSchema()
+        regular = schema.load(mixed_feature_collection)
+        for extra in ({"layout": "columnar"}, {"columns": {"x": []}}):
+            data = {key: value for key, value in regular.items() if key != "features"}
+            assert schema.dump({**regular, **extra})["features"]
+            assert "features" not in schema.dump({**data, **extra})
+
+    def test_reserved_columns_member(self, mixed_feature_collection):
+        """Test that a "columns" member cannot be overwritten by the columns."""
+        mixed_feature_collection["columns"] = ["a", "b"]
+
+        with pytest.raises(ValidationError) as exc_info:
+            FeatureCollectionSchema().load(mixed_feature_collection, layout="columnar")
+        assert "columns" in exc_info.value.messages
+
+    def test_threads(self, mixed_feature_collection):
+        """Test that the columnar layout honours the threads option."""
+        expected = FeatureCollectionSchema().load(mixed_feature_collection, layout="columnar")
+
+        result = FeatureCollectionSchema(threads=3).load(
+            mixed_feature_collection, layout="columnar"
+        )
+        assert result["columns"]["ring_offsets"] == expected["columns"]["ring_offsets"]
+        assert FeatureCollectionSchema().dump(result) == FeatureCollectionSchema().dump(expected)
+
+    def test_errors_keyed_by_index(self, mixed_feature_collection):
+        """Test that invalid features are reported by index."""
+        mixed_feature_collection["features"][2]["geometry"]["coordinates"] = [[0, 0]]
+
+        with pytest.raises(ValidationError) as exc_info:
+            FeatureCollectionSchema().load(mixed_feature_collection, layout="columnar")
+        assert list(exc_info.value.messages["features"]) == [2]
+
+    def test_unsampled_invalid_values(self, mixed_feature_collection):
+        """Test that features outside the sample with invalid values raise ValidationError."""
+        features = mixed_feature_collection["features"]
+        features[1]["geometry"]["coordinates"] = [["a", 2.0]]
+        features[2]["geometry"]["coordinates"] = 5
+        features[3]["properties"] = ["name"]
+        schema = FeatureCollectionSchema(validation="sample", sample_rate=0.0)
+
+        with pytest.raises(ValidationError) as exc_info:
+            schema.load(mixed_feature_collection, layout="columnar")
+        messages = exc_info.value.messages["features"]
+        assert sorted(messages) == [1, 2, 3]
+        assert "coordinates" in messages[1]["geometry"]
+        assert messages[3] == {"properties": ["Not a valid mapping type."]}
+
+    def test_invalid_features_member(self):
+        """Test that a missing "features" member is reported like a regular load."""
+        with pytest.raises(ValidationError) as exc_info:
+            FeatureCollectionSchema().load({"type": "FeatureCollection"}, layout="columnar")
+        assert "features" in exc_info.value.messages
+
+    def test_invalid_layout(self, mixed_feature_collection):
+        """Test that unknown layouts are rejected."""
+        with pytest.raises(ValueError, match="layout"):
+            FeatureCollectionSchema().load(mixed_feature_collection, layout="rows")
@@ -6,7 +6,7 @@ import json
 import pytest
 from marshmallow.exceptions import ValidationError
 
-from marshmallow_geojson import FeatureCollectionSchema
+from marshmallow_geojson import FeatureCollectionSchema, GeoJSONSchema, PolygonSchema
 from marshmallow_geojson.object_type import FEATURE_COLLECTION
 
 
@@ -126,3 +126,145 @@ class TestFeatureCollectionSchema:
         assert fc_data["features"][1]["geometry"]["type"] == "LineString"
         assert fc_data["features"][2]["geometry"] is not None
         assert fc_data["features"][2]["geometry"]["type"] == "Polygon"
+
+    def test_feature_collection_threads(self, valid_feature_collection_data):
+        """Test that threaded validation preserves feature order."""
+        data = copy.deepcopy(valid_feature_collection_data)
+        data["features"] = data["features"] * 5
+
+        expected = FeatureCollectionSchema().load(data)
+        fc_data = FeatureCollectionSchema(threads=3).load(data)
+
+        assert fc_data == expected
+
+    def test_feature_collection_threads_errors(self, valid_feature_collection_data):
+        """Test that threaded validation reports errors by feature index."""
+        data = copy.deepcopy(valid_feature_collection_data)
+        data["features"] = data["features"] * 3
+        data["features"][4] = {**data["features"][4], "type": "Point"}
+
+        schema = FeatureCollectionSchema(threads=2)
+        with pytest.raises(ValidationError) as exc_info:
+            schema.load(data)
+
+        assert list(exc_info.value.messages["features"]) == [4]
+        assert "Invalid feature type" in str(exc_info.value.messages["features"][4])
+
+    def test_load_incremental_reuses_unchanged_features(self, valid_feature_collection_data):
+        """Test that unchanged features are reused from the previous result."""
+        schema = FeatureCollectionSchema()
+        previous = schema.load(valid_feature_collection_data)
+
+        data = copy.deepcopy(valid_feature_collection_data)
+        data["features"][1]["properties"] = {"name": "changed"}
+        data["features"].append(
+            {"type": "Feature", "geometry": None, "properties": {}, "id": "new"},
+        )
+
+        result, changes = schema.load_incremental(data, previous)
+
+        assert result == schema.load(data)
+        assert result["features"][0] is previous["features"][0]
+        assert changes == {"added": [2], "changed": [1], "removed": [], "unchanged": [0]}
+
+    def test_load_incremental_matches_by_id(self):
+        """Test that features are matched by id regardless of position."""
+        features = [
+            {"type": "Feature", "geometry": None, "properties": {"n": n}, "id": n} for n in range(4)
+        ]
+        schema = FeatureCollectionSchema()
+        previous = schema.load({"type": "FeatureCollection", "features": features})
+
+        data = {"type": "FeatureCollection", "features": [features[3], features[0], features[1]]}
+        result, changes = schema.load_incremental(data, previous)
+
+        assert [feature["id"] for feature in result["features"]] == [3, 0, 1]
+        assert result["features"][0] is previous["features"][3]
+        assert changes == {"added": [], "changed": [], "removed": [2], "unchanged": [0, 1, 2]}
+
+    def test_load_incremental_errors(self, valid_feature_collection_data):
+        """Test that re-validation errors are keyed by the new feature index."""
+        schema = FeatureCollectionSchema()
+        previous = schema.load(valid_feature_collection_data)
+
+        data = copy.deepcopy(valid_feature_collection_data)
+        data["features"][1]["geometry"]["coordinates"][0][0] = [200, 0]
+
+        with pytest.raises(ValidationError) as exc_info:
+            schema.load_incremental(data, previous)
+
+        assert list(exc_info.value.messages["features"]) == [1]
+
+
+def parcel_records(*geometries):
+    """FeatureCollection with one feature per geometry, copied from JSON."""
+    return json.loads(
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {"type": "Feature", "geometry": geometry, "properties": {"record": idx}}
+                    for idx, geometry in enumerate(geometries)
+                ],
+            }
+        )
+    )
+
+
+class TestDedupeGeometries:
+    """Test suite for the dedupe_geometries option."""
+
+    parcel = {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]}
+    point = {"type": "Point", "coordinates": [1, 2]}
+
+    def test_shared(self):
+        """Test that equal geometries are validated once and shared."""
+        data = parcel_records(self.parcel, self.point, self.parcel, self.parcel, None)
+        result = FeatureCollectionSchema(dedupe_geometries=True).load(data)
+
+        features = result["features"]
+        assert result == FeatureCollectionSchema().load(data)
+        assert features[0]["geometry"] is features[2]["geometry"] is features[3]["geometry"]
+        assert features[0]["geometry"] is not features[1]["geometry"]
+        assert [feature["properties"]["record"] for feature in features] == [0, 1, 2, 3, 4]
+
+    def test_disabled(self):
+        """Test that geometries are not shared by default."""
+        features = FeatureCollectionSchema().load(parcel_records(self.parcel, self.parcel))[
+            "features"
+        ]
+        assert features[0]["geometry"] is not features[1]["geometry"]
+
+    def test_validated_once(self, monkeypatch):
+        """Test that the geometry schema runs once per distinct geometry."""
+        calls = []
+        validate = PolygonSchema.validate_geometry_data
+
+        def counting_validate(self, *args, **kwargs):
+            calls.append(1)
+            return validate(self, *args, **kwargs)
+
+        monkeypatch.setattr(PolygonSchema, "validate_geometry_data", counting_validate)
+        FeatureCollectionSchema(dedupe_geometries=True).load(parcel_records(*[self.parcel] * 10))
+        assert len(calls) == 1
+
+    def test_errors(self):
+        """Test that every feature with an invalid geometry is reported."""
+        invalid = {"type": "Point", "coordinates": [200, 0]}
+        data = parcel_records(invalid, self.point, invalid)
+        with pytest.raises(ValidationError) as exc_info:
+            FeatureCollectionSchema(dedupe_geometries=True).load(data)
+        assert sorted(exc_info.value.messages["features"]) == [0, 2]
+
+    def test_threads(self):
+        """Test that deduplication works with worker threads."""
+        data = parcel_records(*[self.parcel, self.point] * 20)
+        result = FeatureCollectionSchema(dedupe_geometries=True, threads=4).load(data)
+        assert result == FeatureCollectionSchema().load(data)
+
+    def test_load_file(self, tmp_path):
+        """Test that streamed features share geometries across batches."""
+        path = tmp_path / "parcels.geojson"
+        path.write_text(json.dumps(parcel_records(*[self.parcel] * 2500)))
+        result = GeoJSONSchema(dedupe_geometries=True).load_file(path)
+        assert len({id(feature["geometry"]) for feature in result["features"]}) == 1
@@ -1,6 +1,8 @@
 """Tests for GeoJSONSchema."""
 
+import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from marshmallow.exceptions import ValidationError
@@ -127,3 +129,50 @@ class TestGeoJSONSchema:
             match="Invalid input type.",
         ):
             g_schema.loads(data_text)
+
+    def test_async_load(self, valid_point_data):
+        """Test loading GeoJSON from a coroutine."""
+        g_schema = GeoJSONSchema()
+        g_data = asyncio.run(g_schema.async_load(valid_point_data))
+
+        assert valid_point_data["type"] == g_data["type"]
+        assert valid_point_data["coordinates"] == g_data["coordinates"]
+
+    def test_async_loads_with_executor(self, valid_point_data):
+        """Test loading GeoJSON from a coroutine with a custom executor."""
+        data_text = json.dumps([valid_point_data])
+
+        g_schema = GeoJSONSchema(many=True)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            g_data_list = asyncio.run(g_schema.async_loads(data_text, executor=executor))
+
+        assert len(g_data_list) == 1
+        assert valid_point_data["coordinates"] == g_data_list[0]["coordinates"]
+
+    def test_async_load_error(self, valid_point_data):
+        """Test that async loading propagates ValidationError."""
+        invalid_data = {**valid_point_data, "type": "NotPoint"}
+
+        g_schema = GeoJSONSchema()
+        with pytest.raises(
+            ValidationError,
+            match="Unknown object class for NotPoint.",
+        ):
+            asyncio.run(g_schema.async_load(invalid_data))
+
+    def test_load_many_threads(self, valid_point_data, valid_feature_collection_data):
+        """Test loading multiple GeoJSON objects with a thread pool."""
+        data = [valid_point_data, valid_feature_collection_data] * 3
+
+        g_schema = GeoJSONSchema(many=True, threads=2)
+        g_data_list = g_schema.load(data)
+
+        assert g_data_list == GeoJSONSchema(many=True).load(data)
+
+    def test_load_many_threads_error(self, valid_point_data):
+        """Test that threaded loading raises the first failing object's error."""
+        data = [valid_point_data, {"type": "Point", "coordinates": [200, 0]}]
+
+        g_schema = GeoJSONSchema(many=True, threads=2)
+        with pytest.raises(ValidationError, match="Longitude must be between -180, 180"):
+            g_schema.load(data)
@@ -11,9 +11,10 @@ This module tests features that are unique to marshmallow-geojson:
 import json
 
 import pytest
+from marshmallow import post_load
 from marshmallow.exceptions import ValidationError
 
-from marshmallow_geojson import GeoJSONSchema, GeometriesSchema
+from marshmallow_geojson import GeoJSONSchema, GeometriesSchema, LineStringSchema, PointSchema
 
 
 class TestGeoJSONSchemaUniversal:
@@ -347,6 +348,148 @@ class TestGeometriesSchema:
         assert "Unknown object class for Feature" in str(exc_info.value)
 
 
+class TestDispatch:
+    """Test the shared dispatch tables of GeoJSONSchema and GeometriesSchema."""
+
+    def test_shared_between_instances(self):
+        """Test that instances with the same options share one table."""
+        assert GeoJSONSchema().dispatch() is GeoJSONSchema().dispatch()
+        assert GeometriesSchema().dispatch() is GeometriesSchema(many=True).dispatch()
+
+    def test_options(self):
+        """Test that tables depend on the options."""
+        table = GeoJSONSchema(partial=["bbox", "id"]).dispatch()
+        assert table is GeoJSONSchema(partial=("bbox", "id")).dispatch()
+        assert table is not GeoJSONSchema().dispatch()
+        assert GeoJSONSchema(threads=2).dispatch() is GeoJSONSchema().dispatch()
+        collection = GeoJSONSchema(threads=2).dispatch(collection=True)
+        assert collection is not GeoJSONSchema().dispatch(collection=True)
+        assert collection["FeatureCollection"][0].__self__.threads == 2
+
+    def test_subclass(self):
+        """Test that subclasses get their own table."""
+
+        class CustomGeometriesSchema(GeometriesSchema):
+            pass
+
+        table = CustomGeometriesSchema().dispatch()
+        assert table is not GeometriesSchema().dispatch()
+        assert set(table) == set(GeometriesSchema().object_type_map)
+
+    def test_bound_methods(self, valid_point_data):
+        """Test that tables hold load and dump methods of schema instances."""
+        load, dump = GeometriesSchema().dispatch()["Point"]
+        assert isinstance(load.__self__, GeometriesSchema.point_schema)
+        assert dump(load(valid_point_data)) == valid_point_data
+
+    def test_unhashable_options(self, valid_feature_collection_data):
+        """Test that unhashable options build a table that is not cached."""
+        schema = GeoJSONSchema(sample_seed=bytearray(b"seed"))
+        assert schema.dispatch(collection=True) is not schema.dispatch(collection=True)
+        assert schema.load(valid_feature_collection_data)["type"] == "FeatureCollection"
+
+
+class TestLoadManyGrouped:
+    """Test the grouped validation of GeoJSONSchema(many=True)."""
+
+    @staticmethod
+    def mixed(valid_point_data, valid_linestring_data, valid_feature_point_geometry):
+        """Mixed objects with the types interleaved."""
+        return [
+            valid_point_data,
+            valid_linestring_data,
+            valid_feature_point_geometry,
+            valid_point_data,
+            valid_linestring_data,
+            valid_point_data,
+        ]
+
+    def test_order(self, valid_point_data, valid_linestring_data, valid_feature_point_geometry):
+        """Test that results are returned in the original order."""
+        items = self.mixed(valid_point_data, valid_linestring_data, valid_feature_point_geometry)
+        results = GeoJSONSchema(many=True).load(items)
+        assert results == [GeoJSONSchema().load(item) for item in items]
+
+    def test_one_load_per_type(
+        self, monkeypatch, valid_point_data, valid_linestring_data, valid_feature_point_geometry
+    ):
+        """Test that each type is validated with one many=True load."""
+        calls = []
+        do_load = LineStringSchema._do_load
+
+        def counting_do_load(self, data, *args, many=None, **kwargs):
+            if many:
+                calls.append(len(data))
+            return do_load(self, data, *args, many=many, **kwargs)
+
+        monkeypatch.setattr(LineStringSchema, "_do_load", counting_do_load)
+        items = self.mixed(valid_point_data, valid_linestring_data, valid_feature_point_geometry)
+        GeoJSONSchema(many=True).load(items)
+        assert calls == [2]
+
+    def test_plain_points(self, monkeypatch, valid_point_data):
+        """Test that plain Points skip the schema and other Points use it."""
+        calls = []
+        do_load = PointSchema._do_load
+
+        def counting_do_load(self, data, *args, many=None, **kwargs):
+            calls.append(data)
+            return do_load(self, data, *args, many=many, **kwargs)
+
+        monkeypatch.setattr(PointSchema, "_do_load", counting_do_load)
+        with_bbox = {**valid_point_data, "bbox": [-180, -90, 180, 90]}
+        items = [valid_point_data, with_bbox, valid_point_data]
+        results = GeoJSONSchema(many=True).load(items)
+        assert calls == [[with_bbox]]
+        assert results == [PointSchema().load(item) for item in items]
+
+    def test_errors_by_index(self, valid_point_data, valid_linestring_data):
+        """Test that errors are keyed by the original index."""
+        invalid_point = {"type": "Point", "coordinates": [200, 0]}
+        items = [
+            valid_point_data,
+            valid_linestring_data,
+            invalid_point,
+            {"type": "Circle"},
+            valid_point_data,
+        ]
+        result, errors = GeoJSONSchema(many=True)._load_many(items, partial=None, unknown=None)
+        assert sorted(errors) == [2, 3]
+        assert "Longitude" in str(errors[2])
+        assert result[0] == result[-1] == GeoJSONSchema().load(valid_point_data)
+        for threads in (None, 2):
+            with pytest.raises(ValidationError) as exc_info:
+                GeoJSONSchema(many=True, threads=threads).load(items)
+            assert exc_info.value.messages == errors
+
+    def test_hooks_with_errors(self, valid_linestring_data):
+        """Test that valid objects of a failing group still run their hooks."""
+
+        class MarkedLineStringSchema(LineStringSchema):
+            @post_load
+            def mark(self, data, **kwargs):
+                return {**data, "marked": True}
+
+        class MarkedGeoJSONSchema(GeoJSONSchema):
+            line_string_schema = MarkedLineStringSchema
+
+        invalid = {"type": "LineString", "coordinates": [[200, 0], [0, 0]]}
+        schema = MarkedGeoJSONSchema(many=True)
+        result, errors = schema._load_many(
+            [valid_linestring_data, invalid, valid_linestring_data], partial=None, unknown=None
+        )
+        assert list(errors) == [1]
+        assert result[0]["marked"] and result[-1]["marked"]
+
+    def test_threads(self, valid_point_data, valid_linestring_data, valid_feature_point_geometry):
+        """Test that threaded validation gives the same result."""
+        items = (
+            self.mixed(valid_point_data, valid_linestring_data, valid_feature_point_geometry) * 4
+        )
+        expected = GeoJSONSchema(many=True).load(items)
+        assert GeoJSONSchema(many=True, threads=3).load(items) == expected
+
+
 class TestGeoJSONSchemaLoadsDumps:
     """Test loads() and dumps() methods with various types."""
 
@@ -139,3 +139,96 @@ class TestGeometryCollectionSchema:
         assert gc_data["geometries"][3]["type"] == "MultiLineString"
         assert gc_data["geometries"][4]["type"] == "Polygon"
         assert gc_data["geometries"][5]["type"] == "MultiPolygon"
+
+
+POINT = {"type": "Point", "coordinates": [1, 2]}
+INVALID_POINT = {"type": "Point", "coordinates": [200, 2]}
+
+
+def collection(*geometries, **members):
+    """GeometryCollection of the given geometries."""
+    return {"type": GEOMETRY_COLLECTION, "geometries": list(geometries), **members}
+
+
+def nested(depth):
+    """GeometryCollection nested ``depth`` levels deep around a Point."""
+    data = POINT
+    for _ in range(depth):
+        data = collection(data)
+    return data
+
+
+class TestNestedCollections:
+    """Test suite for nested GeometryCollection loading."""
+
+    def test_deep_nesting(self):
+        """Test that deep nesting does not exhaust the Python stack."""
+        result = GeometryCollectionSchema().load(nested(3000))
+        for _ in range(3000):
+            result = result["geometries"][0]
+        assert result == {"type": "Point", "coordinates": [1.0, 2.0]}
+
+    def test_nested_errors(self):
+        """Test that errors and partial results keep the nested structure."""
+        data = collection(POINT, collection(INVALID_POINT, collection(POINT, INVALID_POINT)))
+        with pytest.raises(ValidationError) as exc_info:
+            GeometryCollectionSchema().load(data)
+        message = {"coordinates": "Longitude must be between -180, 180"}
+        assert exc_info.value.messages == {
+            "geometries": {1: {"geometries": {0: message, 1: {"geometries": {1: message}}}}}
+        }
+        point = {"type": "Point", "coordinates": [1.0, 2.0]}
+        assert exc_info.value.valid_data == collection(point, collection(collection(point)))
+
+    def test_members_and_geometries_errors(self):
+        """Test that member errors are reported with geometry errors."""
+        with pytest.raises(ValidationError) as exc_info:
+            GeometryCollectionSchema().load(collection(INVALID_POINT, bbox=[1]))
+        assert set(exc_info.value.messages) == {"bbox", "geometries"}
+        assert exc_info.value.valid_data == {"type": GEOMETRY_COLLECTION}
+
+    def test_max_depth(self):
+        """Test that collections deeper than max_depth are rejected unvalidated."""
+        schema = GeometryCollectionSchema(max_depth=2)
+        assert schema.load(nested(2)) == GeometryCollectionSchema().load(nested(2))
+        data = collection(POINT, collection(collection(INVALID_POINT)))
+        with pytest.raises(ValidationError) as exc_info:
+            schema.load(data)
+        assert exc_info.value.messages == {
+            "geometries": {
+                1: {
+                    "geometries": {
+                        0: {"_schema": ["GeometryCollection nesting exceeds max_depth of 2."]}
+                    }
+                }
+            }
+        }
+
+    def test_flatten(self):
+        """Test that flatten returns the leaf geometries in document order."""
+        line = {"type": "LineString", "coordinates": [[0, 0], [1, 1]]}
+        data = collection(POINT, collection(line, collection(POINT)), line, bbox=[0, 0, 1, 2])
+        result = GeometryCollectionSchema(flatten=True).load(data)
+        assert [geometry["type"] for geometry in result["geometries"]] == [
+            "Point",
+            "LineString",
+            "Point",
+            "LineString",
+        ]
+        assert result["bbox"] == [0.0, 0.0, 1.0, 2.0]
+
+    def test_flatten_errors(self):
+        """Test that flattened loading reports errors with nested keys."""
+        data = collection(POINT, collection(INVALID_POINT, POINT))
+        with pytest.raises(ValidationError) as exc_info:
+            GeometryCollectionSchema(flatten=True).load(data)
+        assert list(exc_info.value.messages["geometries"][1]["geometries"]) == [0]
+        assert len(exc_info.value.valid_data["geometries"]) == 2
+
+    def test_many(self):
+        """Test that many=True keys errors by collection index."""
+        schema = GeometryCollectionSchema(many=True, max_depth=1)
+        assert len(schema.load([collection(POINT), collection()])) == 2
+        with pytest.raises(ValidationError) as exc_info:
+            schema.load([collection(POINT), nested(2)])
+        assert list(exc_info.value.messages) == [1]
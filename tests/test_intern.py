@@ -0,0 +1,138 @@
+"""Tests for property key and value sharing."""
+
+import json
+import tracemalloc
+
+import pytest
+
+from marshmallow_geojson import FeatureCollectionSchema, GeoJSONSchema, PropertyTable
+
+CATEGORIES = ["residential", "primary", "secondary", "service"]
+
+
+def make_collection(count, **extra):
+    """FeatureCollection whose features each hold their own property strings."""
+    return json.loads(
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "type": "Feature",
+                        "geometry": {"type": "Point", "coordinates": [idx % 180, 0]},
+                        "properties": {
+                            "highway": CATEGORIES[idx % len(CATEGORIES)],
+                            "surface": "asphalt",
+                            "name": f"Street {idx}",
+                            "lanes": 2,
+                            **extra,
+                        },
+                    }
+                    for idx in range(count)
+                ],
+            }
+        )
+    )
+
+
+def retained_size(load):
+    """Bytes allocated by ``load()`` and still held by its result."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = load()
+        return tracemalloc.get_traced_memory()[0] - before, result
+    finally:
+        tracemalloc.stop()
+
+
+class TestPropertyTable:
+    """Test suite for PropertyTable."""
+
+    def test_properties(self):
+        """Test that keys are interned and short values shared."""
+        table = PropertyTable()
+        first = table.properties({"".join(["na", "me"]): "".join(["a", "b"]), "n": 1})
+        second = table.properties({"".join(["na", "me"]): "".join(["a", "b"]), "n": 1})
+        assert first == second == {"name": "ab", "n": 1}
+        assert list(first)[0] is list(second)[0]
+        assert first["name"] is second["name"]
+
+    def test_bounded(self):
+        """Test that the table stops growing at max_size."""
+        table = PropertyTable(max_size=2)
+        for idx in range(10):
+            table.properties({"id": str(idx)})
+        assert len(table) == 2
+
+    def test_max_length(self):
+        """Test that long values are not stored."""
+        table = PropertyTable(max_length=3)
+        table.properties({"a": "abcd", "b": "abc"})
+        assert table.values == {"abc": "abc"}
+
+    def test_intern(self):
+        """Test that Features of FeatureCollections are walked."""
+        collection = make_collection(4)
+        table = PropertyTable()
+        assert table.intern(collection) is collection
+        surfaces = {id(feature["properties"]["surface"]) for feature in collection["features"]}
+        assert len(surfaces) == 1
+        assert table.intern({"type": "Point", "coordinates": [0, 0]}) == {
+            "type": "Point",
+            "coordinates": [0, 0],
+        }
+
+
+class TestInternProperties:
+    """Test suite for the intern_properties option."""
+
+    def test_feature_collection_schema(self):
+        """Test that loaded features share property strings."""
+        schema = FeatureCollectionSchema(intern_properties=True)
+        result = schema.load(make_collection(8))
+        assert result == make_collection(8)
+        highways = {id(feature["properties"]["highway"]) for feature in result["features"]}
+        assert len(highways) == len(CATEGORIES)
+        assert schema.property_table is not None
+        assert FeatureCollectionSchema().property_table is None
+
+    def test_shared_table(self):
+        """Test that a table can be shared by several schemas."""
+        table = PropertyTable()
+        first = FeatureCollectionSchema(intern_properties=table).load(make_collection(2))
+        second = GeoJSONSchema(intern_properties=table).load(make_collection(2))
+        surface = second["features"][1]["properties"]["surface"]
+        assert first["features"][0]["properties"]["surface"] is surface
+
+    @pytest.mark.parametrize("many", [False, True])
+    def test_geojson_schema_features(self, many):
+        """Test that GeoJSONSchema interns Features and FeatureCollections."""
+        schema = GeoJSONSchema(many=many, intern_properties=True)
+        features = make_collection(2)["features"]
+        result = schema.load(features if many else features[0])
+        collections = schema.load([make_collection(1)] if many else make_collection(1))
+        first = (result[0] if many else result)["properties"]["surface"]
+        collection = collections[0] if many else collections
+        assert first is collection["features"][0]["properties"]["surface"]
+
+    def test_load_file(self, tmp_path):
+        """Test that streamed features share property strings across batches."""
+        path = tmp_path / "roads.geojson"
+        path.write_text(json.dumps(make_collection(2500)))
+        result = GeoJSONSchema(intern_properties=True).load_file(path)
+        surfaces = {id(feature["properties"]["surface"]) for feature in result["features"]}
+        assert len(surfaces) == 1
+
+    def test_memory(self):
+        """Test that interning reduces the memory held by loaded features."""
+        extra = {f"attribute_{idx}": "unknown" for idx in range(20)}
+        plain, _ = retained_size(
+            lambda: FeatureCollectionSchema().load(make_collection(500, **extra))
+        )
+        interned, _ = retained_size(
+            lambda: FeatureCollectionSchema(intern_properties=True).load(
+                make_collection(500, **extra)
+            )
+        )
+        assert interned < plain * 0.8
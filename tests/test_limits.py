@@ -0,0 +1,178 @@
+"""Tests for input size limits."""
+
+import json
+from decimal import Decimal
+
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_geojson import GeoJSONSchema
+from marshmallow_geojson.limits import InputLimits, count_positions
+
+
+def point_feature(idx, **properties):
+    """Feature with a Point geometry."""
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [idx % 180, 0]},
+        "properties": properties,
+    }
+
+
+def feature_collection(count, **properties):
+    """FeatureCollection of ``count`` Point features."""
+    return {
+        "type": "FeatureCollection",
+        "features": [point_feature(idx, **properties) for idx in range(count)],
+    }
+
+
+def square(size):
+    """Polygon with one ring of ``size`` positions."""
+    ring = [[idx % 10, 0] for idx in range(size - 1)] + [[0, 0]]
+    return {"type": "Polygon", "coordinates": [ring]}
+
+
+def truncated(data, count):
+    """JSON of a FeatureCollection cut after ``count`` features, then garbage."""
+    text = json.dumps(data)
+    features = [json.dumps(feature) for feature in data["features"][:count]]
+    prefix = text[: text.index('"features": [') + len('"features": [')]
+    return prefix + ", ".join(features) + ", {not json"
+
+
+class TestCountPositions:
+    """Test suite for count_positions."""
+
+    @pytest.mark.parametrize(
+        ("coordinates", "depth", "count"),
+        [
+            ([1, 2], 0, 1),
+            ([[1, 2], [3, 4]], 1, 2),
+            ([[[1, 2], [3, 4]], [[5, 6]]], 2, 3),
+            ([[[[1, 2]], [[3, 4], [5, 6]]], [[[7, 8]]]], 3, 4),
+            ([[[1, 2]], "x", 5], 2, 1),
+        ],
+    )
+    def test_count(self, coordinates, depth, count):
+        """Test that positions are counted at the given depth."""
+        assert count_positions(coordinates, depth) == count
+
+
+class TestInputLimits:
+    """Test suite for InputLimits."""
+
+    def test_geometry_collection_members(self):
+        """Test that each member of a GeometryCollection is limited separately."""
+        limits = InputLimits(max_vertices_per_geometry=5, max_total_vertices=8)
+        collection = {"type": "GeometryCollection", "geometries": [square(5), square(4)]}
+        with pytest.raises(ValidationError, match="max_total_vertices"):
+            limits.check(collection)
+        assert limits.vertices == 9
+
+    def test_unknown_objects(self):
+        """Test that malformed objects are left to validation."""
+        limits = InputLimits(max_features=1, max_total_vertices=1)
+        for obj in ["x", {"type": "Circle"}, {"type": "Polygon"}, {"type": "Feature"}]:
+            limits.check(obj)
+        assert limits.features == 1
+        assert limits.vertices == 0
+
+
+class TestGeoJSONSchemaLimits:
+    """Test suite for the size limits of GeoJSONSchema."""
+
+    @pytest.mark.parametrize("limit", [0, -1, 1.5, "10"])
+    def test_invalid_limit(self, limit):
+        """Test that limits must be positive integers."""
+        with pytest.raises(ValueError, match="max_features must be a positive integer"):
+            GeoJSONSchema(max_features=limit)
+
+    @pytest.mark.parametrize("many", [False, True])
+    def test_within_limits(self, many):
+        """Test that input within the limits loads as without limits."""
+        data = feature_collection(20, name="a")
+        text = json.dumps([data, point_feature(1)] if many else data)
+        schema = GeoJSONSchema(
+            many=many,
+            max_bytes=len(text),
+            max_features=21,
+            max_vertices_per_geometry=1,
+            max_total_vertices=21,
+            max_properties=1,
+        )
+        assert schema.loads(text) == GeoJSONSchema(many=many).loads(text)
+
+    def test_max_bytes(self, tmp_path):
+        """Test that larger input is rejected before parsing."""
+        schema = GeoJSONSchema(max_bytes=50)
+        with pytest.raises(ValidationError, match="max_bytes"):
+            schema.loads("[" * 100)
+        with pytest.raises(ValidationError, match="max_bytes"):
+            schema.loads(json.dumps({"type": "Point", "coordinates": [0, 0], "name": "é" * 20}))
+        path = tmp_path / "large.geojson"
+        path.write_text(json.dumps(feature_collection(2)))
+        with pytest.raises(ValidationError, match="max_bytes"):
+            schema.load_file(path)
+
+    def test_max_features_rejects_early(self):
+        """Test that features are counted before the rest is parsed."""
+        text = truncated(feature_collection(20), 12)
+        with pytest.raises(json.JSONDecodeError):
+            GeoJSONSchema().loads(text)
+        with pytest.raises(ValidationError) as exc_info:
+            GeoJSONSchema(max_features=10).loads(text)
+        assert exc_info.value.messages == {"_schema": ["Input has more than max_features (10)."]}
+
+    def test_max_features_many(self):
+        """Test that objects of a top-level array are counted as decoded."""
+        text = json.dumps([point_feature(idx) for idx in range(5)])[:-1] + ", {not json"
+        with pytest.raises(ValidationError, match="max_features"):
+            GeoJSONSchema(many=True, max_features=4).loads(text)
+
+    def test_max_features_decoded_collection(self):
+        """Test that collections with "features" before "type" are counted."""
+        data = feature_collection(3)
+        text = json.dumps({"features": data["features"], "type": "FeatureCollection"})
+        with pytest.raises(ValidationError, match="max_features"):
+            GeoJSONSchema(max_features=2).loads(text)
+
+    def test_max_vertices_per_geometry(self):
+        """Test that a single large geometry is rejected before validation."""
+        text = json.dumps(
+            {"type": "Feature", "geometry": square(50), "properties": {}},
+        )
+        with pytest.raises(ValidationError) as exc_info:
+            GeoJSONSchema(max_vertices_per_geometry=49).loads(text)
+        assert "max_vertices_per_geometry (49)" in str(exc_info.value)
+        assert GeoJSONSchema(max_vertices_per_geometry=50).loads(text)["geometry"]
+
+    def test_max_total_vertices(self, tmp_path):
+        """Test that positions are added up across features."""
+        path = tmp_path / "squares.geojson"
+        path.write_text(
+            json.dumps(
+                {
+                    "type": "FeatureCollection",
+                    "features": [{"type": "Feature", "geometry": square(10), "properties": {}}] * 5,
+                }
+            )
+        )
+        assert len(GeoJSONSchema(max_total_vertices=50).load_file(path)["features"]) == 5
+        with pytest.raises(ValidationError, match="max_total_vertices"):
+            GeoJSONSchema(max_total_vertices=49).load_file(path)
+
+    def test_max_properties(self):
+        """Test that features with too many properties are rejected."""
+        text = json.dumps(point_feature(0, **{f"p{idx}": idx for idx in range(5)}))
+        with pytest.raises(ValidationError, match="max_properties"):
+            GeoJSONSchema(max_properties=4).loads(text)
+
+    def test_decoder_options(self):
+        """Test that decoder options are passed on with limits set."""
+        text = json.dumps(feature_collection(2))
+        schema = GeoJSONSchema(max_features=2)
+        result = schema.loads(text, parse_int=Decimal)
+        assert result == GeoJSONSchema().loads(text, parse_int=Decimal)
+        with pytest.raises(ValidationError, match="max_features"):
+            GeoJSONSchema(max_features=1).loads(text, parse_int=Decimal)
@@ -1,6 +1,7 @@
 """Tests for MultiPointSchema."""
 
 import json
+from array import array
 
 import pytest
 from marshmallow.exceptions import ValidationError
@@ -89,3 +90,76 @@ class TestMultiPointSchema:
 
         assert mp_data["type"] == MULTI_POINT
         assert len(mp_data["coordinates"]) == 0
+
+    def test_multi_point_dump_buffer_coordinates(self):
+        """Test that a 2-D buffer dumps as a list of positions."""
+        buffer = memoryview(array("d", [1.0, 2.0, 3.0, 4.0])).cast("B").cast("d", (2, 2))
+        data = {"type": "MultiPoint", "coordinates": buffer}
+
+        assert MultiPointSchema().dump(data)["coordinates"] == [[1.0, 2.0], [3.0, 4.0]]
+
+
+class TestCoordinateArray:
+    """Test suite for the coordinate_array option."""
+
+    def test_load(self, valid_multi_point_data):
+        """Test that coordinates are loaded into a matrix."""
+        result = MultiPointSchema(coordinate_array=True).load(valid_multi_point_data)
+        expected = MultiPointSchema().load(valid_multi_point_data)
+        assert result["type"] == MULTI_POINT
+        assert result["coordinates"].shape == (len(expected["coordinates"]), 2)
+        assert result["coordinates"].tolist() == expected["coordinates"]
+
+    def test_dump(self, valid_multi_point_data):
+        """Test that a loaded matrix dumps as nested lists."""
+        schema = MultiPointSchema(coordinate_array=True)
+        assert json.loads(schema.dumps(schema.load(valid_multi_point_data))) == json.loads(
+            MultiPointSchema().dumps(valid_multi_point_data)
+        )
+
+    def test_mixed_dimensions_round_trip(self):
+        """Test that positions without an altitude dump without the NaN they hold."""
+        data = {"type": MULTI_POINT, "coordinates": [[1.0, 2.0], [3.0, 4.0, 5.0]]}
+        schema = MultiPointSchema(coordinate_array=True)
+
+        loaded = schema.load(data)
+        dumped = schema.dumps(loaded)
+
+        assert json.loads(dumped) == data
+        assert json.loads(schema.dumps(schema.loads(dumped))) == data
+
+    @pytest.mark.parametrize("options", [{"only": ("type",)}, {"exclude": ("coordinates",)}])
+    def test_only_and_exclude(self, options):
+        """Test that only and exclude apply to plain MultiPoints."""
+        data = {"type": MULTI_POINT, "coordinates": [[1, 2], [3, 4]]}
+
+        schema = MultiPointSchema(coordinate_array=True, unknown="exclude", **options)
+        assert schema.load(data) == {"type": MULTI_POINT}
+        schema = MultiPointSchema(coordinate_array=True, **options)
+        assert schema.load(data) == MultiPointSchema(**options).load(data)
+
+    def test_other_members(self):
+        """Test that other members are kept."""
+        data = {"type": MULTI_POINT, "coordinates": [[1, 2], [3, 4]], "bbox": [1, 2, 3, 4]}
+        result = MultiPointSchema(coordinate_array=True).load(data)
+        assert result["bbox"] == [1.0, 2.0, 3.0, 4.0]
+        assert result["coordinates"].tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_errors(self):
+        """Test that errors match regular loading."""
+        data = {"type": MULTI_POINT, "coordinates": [[1, 2], [200, 0]]}
+        with pytest.raises(ValidationError) as expected:
+            MultiPointSchema().load(data)
+        with pytest.raises(ValidationError) as exc_info:
+            MultiPointSchema(coordinate_array=True).load(data)
+        assert exc_info.value.messages == expected.value.messages
+
+    def test_many(self, valid_multi_point_data):
+        """Test that many=True loads every MultiPoint and keys errors by index."""
+        invalid = {"type": MULTI_POINT, "coordinates": [[0, 0, 0, 0]]}
+        schema = MultiPointSchema(coordinate_array=True, many=True)
+        result = schema.load([valid_multi_point_data, valid_multi_point_data])
+        assert [item["coordinates"].shape[1] for item in result] == [2, 2]
+        with pytest.raises(ValidationError) as exc_info:
+            schema.load([valid_multi_point_data, invalid])
+        assert list(exc_info.value.messages) == [1]
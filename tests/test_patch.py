@@ -0,0 +1,175 @@
+"""Tests for JSON Patch support in GeoJSONSchema."""
+
+import copy
+from unittest import mock
+
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_geojson import GeoJSONSchema, PointSchema, PolygonSchema
+
+
+@pytest.fixture
+def validated_collection(valid_feature_collection_data):
+    """A validated FeatureCollection with a Point and a Polygon feature."""
+    return GeoJSONSchema().load(valid_feature_collection_data)
+
+
+class TestApplyPatch:
+    """Test suite for GeoJSONSchema.apply_patch."""
+
+    def test_replace_vertex(self, validated_collection):
+        """Test moving a polygon vertex re-validates only that polygon."""
+        original = copy.deepcopy(validated_collection)
+        patch = [
+            {
+                "op": "replace",
+                "path": "/features/1/geometry/coordinates/0/1",
+                "value": [-80.7, 35.2],
+            },
+        ]
+
+        with (
+            mock.patch.object(
+                PolygonSchema, "load", autospec=True, side_effect=PolygonSchema.load
+            ) as load,
+            mock.patch.object(
+                PointSchema, "load", autospec=True, side_effect=PointSchema.load
+            ) as point,
+        ):
+            result = GeoJSONSchema().apply_patch(validated_collection, patch)
+
+        assert load.call_count == 1
+        assert point.call_count == 0
+        assert result["features"][1]["geometry"]["coordinates"][0][1] == [-80.7, 35.2]
+        assert result["features"][0] is validated_collection["features"][0]
+        assert validated_collection == original
+
+    def test_invalid_vertex(self, validated_collection):
+        """Test that validation errors are nested under the patched object."""
+        patch = [{"op": "replace", "path": "/features/1/geometry/coordinates/0/0", "value": [0, 0]}]
+
+        with pytest.raises(ValidationError) as exc_info:
+            GeoJSONSchema().apply_patch(validated_collection, patch)
+
+        messages = exc_info.value.messages["features"][1]["geometry"]
+        assert "Linear Rings must start and end at the same coordinate" in str(messages)
+
+    def test_add_and_remove_features(self, validated_collection):
+        """Test adding and removing features with index shifting."""
+        feature = {"type": "Feature", "geometry": None, "properties": {"name": "new"}}
+        patch = [
+            {"op": "add", "path": "/features/0", "value": feature},
+            {"op": "remove", "path": "/features/1"},
+            {"op": "add", "path": "/features/-", "value": {"type": "Point"}},
+        ]
+
+        with pytest.raises(ValidationError) as exc_info:
+            GeoJSONSchema().apply_patch(validated_collection, patch)
+
+        assert list(exc_info.value.messages["features"]) == [2]
+        assert "Invalid feature type" in str(exc_info.value.messages)
+
+        result = GeoJSONSchema().apply_patch(validated_collection, patch[:2])
+        assert [f["properties"] for f in result["features"]] == [{"name": "new"}, {}]
+
+    @pytest.mark.parametrize("op", ["replace", "add"])
+    def test_whole_features_array(self, validated_collection, op):
+        """Test that replacing the features array validates the new features."""
+        invalid = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [500, 0]},
+            "properties": {},
+        }
+        patch = [{"op": op, "path": "/features", "value": [invalid]}]
+
+        with pytest.raises(ValidationError) as exc_info:
+            GeoJSONSchema().apply_patch(validated_collection, patch)
+
+        assert list(exc_info.value.messages["features"]) == [0]
+        assert "Longitude" in str(exc_info.value.messages)
+
+        valid = copy.deepcopy(validated_collection["features"][:1])
+        result = GeoJSONSchema().apply_patch(
+            validated_collection, [{"op": op, "path": "/features", "value": valid}]
+        )
+        assert result["features"] == valid
+
+    def test_whole_geometries_array(self, valid_geometry_collection_data):
+        """Test that replacing the geometries array validates the new members."""
+        patch = [
+            {
+                "op": "replace",
+                "path": "/geometries",
+                "value": [{"type": "LineString", "coordinates": [[0, 0]]}],
+            },
+        ]
+
+        with pytest.raises(ValidationError) as exc_info:
+            GeoJSONSchema().apply_patch(valid_geometry_collection_data, patch)
+
+        assert list(exc_info.value.messages["geometries"]) == [0]
+
+    def test_remove_feature_not_validated(self, validated_collection):
+        """Test that removing a feature does not validate the others."""
+        patch = [{"op": "remove", "path": "/features/0"}]
+
+        with mock.patch.object(
+            PolygonSchema, "load", autospec=True, side_effect=PolygonSchema.load
+        ) as load:
+            result = GeoJSONSchema().apply_patch(validated_collection, patch)
+
+        assert load.call_count == 0
+        assert result["features"] == validated_collection["features"][1:]
+
+    def test_remove_feature_geometry(self, validated_collection):
+        """Test removing a required member re-validates the parent feature."""
+        patch = [{"op": "remove", "path": "/features/0/geometry"}]
+
+        with pytest.raises(ValidationError) as exc_info:
+            GeoJSONSchema().apply_patch(validated_collection, patch)
+
+        assert exc_info.value.messages == {
+            "features": {0: {"geometry": ["Missing data for required field."]}},
+        }
+
+    def test_move_copy_and_test(self, validated_collection):
+        """Test move, copy and test operations."""
+        patch = [
+            {"op": "test", "path": "/features/0/geometry/type", "value": "Point"},
+            {"op": "copy", "from": "/features/0", "path": "/features/-"},
+            {"op": "move", "from": "/features/1/properties", "path": "/features/2/properties"},
+            {"op": "add", "path": "/features/1/properties", "value": {"moved": True}},
+        ]
+
+        result = GeoJSONSchema().apply_patch(validated_collection, patch)
+
+        assert len(result["features"]) == 3
+        assert result["features"][2]["geometry"] == result["features"][0]["geometry"]
+        assert result["features"][1]["properties"] == {"moved": True}
+
+    def test_replace_root(self, validated_collection, valid_point_data):
+        """Test replacing the whole document."""
+        result = GeoJSONSchema().apply_patch(
+            validated_collection,
+            [{"op": "replace", "path": "", "value": valid_point_data}],
+        )
+
+        assert result == GeoJSONSchema().load(valid_point_data)
+
+    @pytest.mark.parametrize(
+        "patch,message",
+        [
+            ({"op": "add"}, "JSON Patch must be an array of operations."),
+            ([{"op": "frobnicate", "path": "/type"}], "invalid operation"),
+            ([{"op": "remove", "path": "/features/9"}], "does not exist"),
+            ([{"op": "remove", "path": "/features/01"}], "does not exist"),
+            ([{"op": "replace", "path": "type", "value": 1}], "invalid JSON Pointer"),
+            ([{"op": "test", "path": "/type", "value": "Feature"}], "test failed"),
+            ([{"op": "move", "from": "/features", "path": "/features/0"}], "its children"),
+        ],
+    )
+    def test_invalid_patch(self, validated_collection, patch, message):
+        """Test that invalid patches raise ValidationError."""
+        with pytest.raises(ValidationError, match=message):
+            GeoJSONSchema().apply_patch(validated_collection, patch)
@@ -1,12 +1,15 @@
 """Tests for PointSchema."""
 
 import json
+import math
+from array import array
 
 import pytest
 from marshmallow.exceptions import ValidationError
 
 from marshmallow_geojson import PointSchema
 from marshmallow_geojson.object_type import POINT
+from marshmallow_geojson.point import plain_point
 from tests.test_utils import assert_coordinates_equal
 
 
@@ -146,3 +149,94 @@ class TestPointSchema:
 
         error_str = str(exc_info.value)
         assert "2 or 3 elements" in error_str or "must have" in error_str
+
+    def test_point_dump_buffer_coordinates(self):
+        """Test that Point dumps buffer-protocol coordinates as plain lists."""
+        data = {"type": "Point", "coordinates": array("d", [125.6, 10.1])}
+        schema = PointSchema()
+
+        dumped = schema.dump(data)
+        assert dumped["coordinates"] == [125.6, 10.1]
+        assert type(dumped["coordinates"]) is list
+        assert json.loads(schema.dumps(data))["coordinates"] == [125.6, 10.1]
+
+
+class TestPlainPoint:
+    """Test suite for plain_point."""
+
+    @pytest.mark.parametrize(
+        "coordinates", [[125.6, 10.1], [-180, 90], [1, 2, 3], [0.5, -0.5, -10.25]]
+    )
+    def test_matches_schema_load(self, coordinates):
+        """Test that plain Points load as with PointSchema."""
+        data = {"type": POINT, "coordinates": coordinates}
+        assert plain_point(data) == PointSchema().load(data)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"type": POINT, "coordinates": [200, 0]},
+            {"type": POINT, "coordinates": [0, 91]},
+            {"type": POINT, "coordinates": [0, float("nan")]},
+            {"type": POINT, "coordinates": [0, 0, 10**400]},
+            {"type": POINT, "coordinates": [True, 0]},
+            {"type": POINT, "coordinates": ["1.5", 0]},
+            {"type": POINT, "coordinates": [0]},
+            {"type": POINT, "coordinates": [0, 0, 0, 0]},
+            {"type": POINT, "coordinates": (0, 0)},
+            {"type": POINT, "coordinates": [0, 0], "bbox": [0, 0, 0, 0]},
+            {"type": "MultiPoint", "coordinates": [0, 0]},
+            [POINT, [0, 0]],
+        ],
+    )
+    def test_needs_schema(self, data):
+        """Test that other objects are left to the schema."""
+        assert plain_point(data) is None
+
+
+class TestLoadManyArray:
+    """Test suite for PointSchema.load_many_array."""
+
+    def test_matrix(self):
+        """Test that Points are packed into an (n, 2) float64 matrix."""
+        points = [{"type": POINT, "coordinates": [idx - 50, idx / 4]} for idx in range(100)]
+        matrix = PointSchema().load_many_array(points)
+        assert matrix.format == "d"
+        assert matrix.shape == (100, 2)
+        assert matrix.tolist() == [PointSchema().load(point)["coordinates"] for point in points]
+
+    def test_altitude(self):
+        """Test that positions without altitude hold NaN in a 3D matrix."""
+        points = [{"type": POINT, "coordinates": [1, 2, 3]}, {"type": POINT, "coordinates": [4, 5]}]
+        rows = PointSchema().load_many_array(points).tolist()
+        assert rows[0] == [1.0, 2.0, 3.0]
+        assert rows[1][:2] == [4.0, 5.0]
+        assert math.isnan(rows[1][2])
+
+    def test_other_members(self):
+        """Test that Points with other members are loaded through the schema."""
+        points = [
+            {"type": POINT, "coordinates": [1, 2], "bbox": [1, 2, 1, 2]},
+            {"type": POINT, "coordinates": [3, 4]},
+        ]
+        assert PointSchema().load_many_array(points).tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_empty(self):
+        """Test that no Points give an empty view."""
+        assert PointSchema().load_many_array([]).tolist() == []
+
+    def test_errors(self):
+        """Test that errors are keyed by index and match PointSchema.load."""
+        points = [
+            {"type": POINT, "coordinates": [0, 0]},
+            {"type": POINT, "coordinates": [0, 100]},
+            {"type": POINT, "coordinates": [0, float("nan")]},
+            {"type": POINT, "coordinates": [0, 0]},
+        ]
+        with pytest.raises(ValidationError) as exc_info:
+            PointSchema().load_many_array(points)
+        assert sorted(exc_info.value.messages) == [1, 2]
+        for idx in (1, 2):
+            with pytest.raises(ValidationError) as item_info:
+                PointSchema().load(points[idx])
+            assert exc_info.value.messages[idx] == item_info.value.messages
@@ -1,6 +1,7 @@
 """Tests for PolygonSchema."""
 
 import json
+from array import array
 
 import pytest
 from marshmallow.exceptions import ValidationError
@@ -118,3 +119,24 @@ class TestPolygonSchema:
         p_data = schema.load(data)
         assert p_data["type"] == POLYGON
         assert len(p_data["coordinates"][0]) == 4
+
+    def test_polygon_dump_buffer_rings(self):
+        """Test that rings given as buffers are dumped alongside list rings."""
+        ring = array("d", [0, 0, 1, 0, 1, 1, 0, 0])
+        data = {
+            "type": "Polygon",
+            "coordinates": [
+                memoryview(ring).cast("B").cast("d", (4, 2)),
+                [[0.2, 0.2], [0.4, 0.2], [0.2, 0.4], [0.2, 0.2]],
+            ],
+        }
+
+        dumped = PolygonSchema().dump(data)
+        assert dumped["coordinates"][0] == [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]
+        assert dumped["coordinates"][1][1] == [0.4, 0.2]
+
+    def test_polygon_dump_integer_buffer(self):
+        """Test that non-float buffers fall back to per-value serialization."""
+        data = {"type": "Polygon", "coordinates": [[array("l", [0, 0]), array("l", [1, 0])]]}
+
+        assert PolygonSchema().dump(data)["coordinates"] == [[[0.0, 0.0], [1.0, 0.0]]]
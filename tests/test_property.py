@@ -0,0 +1,244 @@
+"""Tests for compiled properties schemas."""
+
+import datetime
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from marshmallow import RAISE, ValidationError, validates
+from marshmallow.fields import Bool, Date, DateTime, Float, Int, Nested, Raw, Str
+from marshmallow.validate import Length
+
+from marshmallow_geojson import FeatureCollectionSchema, FeatureSchema, PropertiesSchema
+from marshmallow_geojson.feature_collection import FeatureList
+from marshmallow_geojson.property import compile_properties
+
+
+class CityPropertiesSchema(PropertiesSchema):
+    """Properties schema with fast-path and regular fields."""
+
+    name = Str(required=True)
+    population = Int()
+    area = Float(allow_none=True)
+    capital = Bool(data_key="isCapital")
+    founded = DateTime()
+    code = Str(validate=Length(equal=2))
+    tags = Raw()
+
+
+class CityFeatureSchema(FeatureSchema):
+    """Feature schema with compiled properties."""
+
+    properties_schema = CityPropertiesSchema
+
+
+def city(**properties):
+    """City feature with the given properties."""
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [-74.006, 40.7128]},
+        "properties": properties,
+    }
+
+
+class TestCompileProperties:
+    """Test suite for compile_properties."""
+
+    @pytest.mark.parametrize(
+        "properties",
+        [
+            {"name": "New York", "population": 8336817, "area": 783.8, "isCapital": False},
+            {"name": "Paris", "population": "2102650", "area": None, "founded": "0250-01-01"},
+            {"name": "Bern", "isCapital": "yes", "code": "BE", "tags": ["a"], "extra": {"x": 1}},
+            {"population": 1.5, "area": float("nan"), "code": "BER", "isCapital": "maybe"},
+            {"name": 1, "area": "big", "founded": "never"},
+        ],
+    )
+    def test_matches_schema_load(self, properties):
+        """Test that results and errors match Schema.load."""
+        schema = CityPropertiesSchema()
+        try:
+            expected = schema.load(properties)
+        except ValidationError as error:
+            with pytest.raises(ValidationError) as info:
+                compile_properties(CityPropertiesSchema)(properties)
+            assert info.value.messages == error.messages
+            assert info.value.valid_data == error.valid_data
+        else:
+            assert compile_properties(CityPropertiesSchema)(properties) == expected
+
+    def test_values_unchanged(self):
+        """Test that fast-path values are returned as is."""
+        tags = ["a", "b"]
+        result = compile_properties(CityPropertiesSchema)({"name": "Bern", "tags": tags})
+        assert result == {"name": "Bern", "tags": tags}
+        assert result["tags"] is tags
+
+    def test_cached(self):
+        """Test that a schema class is compiled once."""
+        assert compile_properties(CityPropertiesSchema) is compile_properties(CityPropertiesSchema)
+
+    def test_unknown(self):
+        """Test that the unknown option of the schema is honored."""
+
+        class StrictSchema(PropertiesSchema):
+            class Meta:
+                unknown = RAISE
+
+            name = Str()
+
+        with pytest.raises(ValidationError) as info:
+            compile_properties(StrictSchema)({"name": "a", "other": 1})
+        assert info.value.messages == {"other": ["Unknown field."]}
+
+    def test_hooks_use_schema_load(self):
+        """Test that schemas with hooks fall back to Schema.load."""
+
+        class HookedSchema(PropertiesSchema):
+            name = Str()
+
+            @validates("name")
+            def validate_name(self, value, **kwargs):
+                if value != value.title():
+                    raise ValidationError("Name must be titled.")
+
+        with pytest.raises(ValidationError) as info:
+            compile_properties(HookedSchema)({"name": "bern"})
+        assert info.value.messages == {"name": ["Name must be titled."]}
+
+
+class TestFeatureSchemaProperties:
+    """Test suite for FeatureSchema.properties_schema."""
+
+    def test_load(self):
+        """Test that properties are loaded with the properties schema."""
+        feature = CityFeatureSchema().load(city(name="Bern", population="133115", isCapital=True))
+        assert feature["properties"] == {"name": "Bern", "population": 133115, "capital": True}
+
+    def test_errors(self):
+        """Test that property errors are nested under properties."""
+        with pytest.raises(ValidationError) as info:
+            CityFeatureSchema().load(city(population="many"))
+        assert info.value.messages == {
+            "properties": {
+                "name": ["Missing data for required field."],
+                "population": ["Not a valid integer."],
+            }
+        }
+
+    def test_not_a_mapping(self):
+        """Test that non-object properties are rejected."""
+        with pytest.raises(ValidationError) as info:
+            CityFeatureSchema().load({**city(), "properties": ["Bern"]})
+        assert info.value.messages == {"properties": ["Not a valid mapping type."]}
+
+    def test_null(self):
+        """Test that null properties are accepted."""
+        assert CityFeatureSchema().load({**city(), "properties": None})["properties"] is None
+
+    def test_default_is_dict(self):
+        """Test that FeatureSchema accepts arbitrary properties by default."""
+        properties = {"name": 1, "nested": {"a": [1, 2]}}
+        assert FeatureSchema().load(city(**properties))["properties"] == properties
+
+    def test_dump(self):
+        """Test that JSON properties dump as they are."""
+        feature = city(name="Bern", population=133115)
+        assert CityFeatureSchema().dump(feature)["properties"] == feature["properties"]
+
+    def test_round_trip(self):
+        """Test that properties dump through the properties schema."""
+
+        class EventPropertiesSchema(PropertiesSchema):
+            day = Date(data_key="eventDay")
+            name = Str()
+
+        schema = FeatureSchema.with_properties(EventPropertiesSchema)()
+        data = city(eventDay="2024-05-01", name="Fair", extra=[1, 2])
+
+        feature = schema.load(data)
+        assert feature["properties"] == {
+            "day": datetime.date(2024, 5, 1),
+            "name": "Fair",
+            "extra": [1, 2],
+        }
+        assert json.loads(schema.dumps(feature)) == data
+        assert schema.load(json.loads(schema.dumps(feature))) == feature
+
+    def test_many(self):
+        """Test that properties are compiled for many=True loads."""
+        schema = CityFeatureSchema(many=True)
+        result = schema.load([city(name="Bern"), city(name="Paris", population=2102650)])
+        assert [feature["properties"]["name"] for feature in result] == ["Bern", "Paris"]
+
+
+class TestWithProperties:
+    """Test suite for the with_properties factories."""
+
+    def test_feature_schema(self):
+        """Test that FeatureSchema.with_properties sets the properties schema."""
+        schema_class = FeatureSchema.with_properties(CityPropertiesSchema)
+        assert issubclass(schema_class, FeatureSchema)
+        assert schema_class.__name__ == "CityFeatureSchema"
+        assert schema_class.properties_schema is CityPropertiesSchema
+        feature = schema_class().load(city(name="Bern", isCapital=True))
+        assert feature["properties"] == {"name": "Bern", "capital": True}
+
+    def test_cached(self):
+        """Test that subclasses are created once, also from several threads."""
+        with ThreadPoolExecutor(8) as executor:
+            classes = set(
+                executor.map(
+                    lambda _: FeatureCollectionSchema.with_properties(CityPropertiesSchema),
+                    range(32),
+                )
+            )
+        assert len(classes) == 1
+        assert classes.pop() is FeatureCollectionSchema.with_properties(CityPropertiesSchema)
+
+    def test_feature_collection_schema(self):
+        """Test that features of the collection use the properties schema."""
+        schema_class = FeatureCollectionSchema.with_properties(CityPropertiesSchema)
+        assert schema_class.__name__ == "CityFeatureCollectionSchema"
+        data = {
+            "type": "FeatureCollection",
+            "features": [city(name="Bern", population="133115"), city(population=1)],
+        }
+        with pytest.raises(ValidationError) as info:
+            schema_class(threads=2).load(data)
+        assert info.value.messages == {
+            "features": {1: {"properties": {"name": ["Missing data for required field."]}}}
+        }
+        assert info.value.valid_data["features"][0]["properties"]["population"] == 133115
+
+    def test_shared_feature_schema(self):
+        """Test that every collection schema instance shares one feature schema."""
+        schemas = [
+            FeatureCollectionSchema.with_properties(CityPropertiesSchema)(),
+            FeatureCollectionSchema.with_properties(CityPropertiesSchema)(threads=4),
+        ]
+        nested = {id(schema.fields["features"].inner.schema) for schema in schemas}
+        assert len(nested) == 1
+        assert type(schemas[0].fields["features"].inner.schema) is FeatureSchema.with_properties(
+            CityPropertiesSchema
+        )
+
+    def test_subclass_feature_schema(self):
+        """Test that the nested feature schema of a subclass is kept."""
+
+        class StrictFeatureSchema(FeatureSchema):
+            class Meta:
+                unknown = RAISE
+
+        class StrictCollectionSchema(FeatureCollectionSchema):
+            features = FeatureList(Nested(StrictFeatureSchema()), required=True)
+
+        schema = StrictCollectionSchema.with_properties(CityPropertiesSchema)()
+        feature_schema = schema.fields["features"].inner.schema
+        assert isinstance(feature_schema, StrictFeatureSchema)
+        assert feature_schema.properties_schema is CityPropertiesSchema
+
+    def test_invalid_properties_schema(self):
+        """Test that a non-schema properties schema is rejected."""
+        with pytest.raises(TypeError, match="Expected a PropertiesSchema subclass"):
+            FeatureSchema.with_properties(dict)
@@ -0,0 +1,117 @@
+"""Tests for sampling-based validation."""
+
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_geojson import FeatureCollectionSchema, GeoJSONSchema
+
+
+def make_features(count, invalid=()):
+    """Build Point features, with out-of-range longitudes at ``invalid`` indices."""
+    return [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [500 if idx in invalid else idx, 0]},
+            "properties": {"idx": idx},
+        }
+        for idx in range(count)
+    ]
+
+
+class TestFeatureCollectionSampling:
+    """Test suite for FeatureCollectionSchema sampling mode."""
+
+    def test_sample_mode_skips_unsampled_coordinates(self):
+        """Test that coordinates are only validated for sampled features."""
+        data = {"type": "FeatureCollection", "features": make_features(10, invalid={3})}
+
+        result = FeatureCollectionSchema(validation="sample", sample_rate=0.0).load(data)
+        assert result["features"][3] is data["features"][3]
+
+        schema = FeatureCollectionSchema(validation="sample", sample_rate=1.0)
+        with pytest.raises(ValidationError) as exc_info:
+            schema.load(data)
+        assert list(exc_info.value.messages["features"]) == [3]
+
+    def test_sample_is_seeded(self):
+        """Test that the same seed picks the same sample."""
+        schema = FeatureCollectionSchema(validation="sample", sample_rate=0.3, sample_seed=7)
+
+        assert schema.sample(50) == schema.sample(50)
+        assert len(schema.sample(50)) == 15
+
+    def test_sample_mode_checks_structure(self):
+        """Test that structure is checked for every feature."""
+        features = make_features(10)
+        features[7] = {**features[7], "coordinates": [0, 0]}
+        features[8] = {**features[8], "geometry": {"type": "Circle", "coordinates": [0, 0]}}
+        data = {"type": "FeatureCollection", "features": features}
+        schema = FeatureCollectionSchema(validation="sample", sample_rate=0.0)
+
+        with pytest.raises(ValidationError) as exc_info:
+            schema.load(data)
+
+        messages = exc_info.value.messages["features"]
+        assert sorted(messages) == [7, 8]
+        assert 'Feature objects MUST NOT contain "coordinates" member' in str(messages[7])
+        assert messages[8] == {"geometry": {"_schema": "Unknown object class for Circle."}}
+
+    def test_load_sampled_report(self):
+        """Test that load_sampled reports sampled errors and extrapolates rates."""
+        data = {"type": "FeatureCollection", "features": make_features(100, invalid=range(50))}
+        schema = FeatureCollectionSchema(sample_rate=0.2, sample_seed=42)
+
+        result, report = schema.load_sampled(data)
+
+        assert len(result["features"]) == 100
+        assert report["total"] == 100
+        assert len(report["sampled"]) == 20
+        assert report["sampled"] == sorted(schema.sample(100))
+        assert set(report["errors"]) == {idx for idx in report["sampled"] if idx < 50}
+        assert report["error_rate"] == len(report["errors"]) / 20
+        assert report["estimated_errors"] == round(report["error_rate"] * 100)
+
+    def test_invalid_options(self):
+        """Test that invalid sampling options are rejected."""
+        with pytest.raises(ValueError, match="validation must be one of"):
+            FeatureCollectionSchema(validation="partial")
+        with pytest.raises(ValueError, match="sample_rate must be between 0 and 1"):
+            FeatureCollectionSchema(validation="sample", sample_rate=2)
+
+
+class TestGeoJSONSampling:
+    """Test suite for GeoJSONSchema sampling mode."""
+
+    def test_many_sample_mode(self):
+        """Test sampling objects in many=True mode."""
+        items = [feature["geometry"] for feature in make_features(10, invalid={4})]
+        schema = GeoJSONSchema(many=True, validation="sample", sample_rate=0.0)
+
+        result = schema.load(items)
+
+        assert result[4] is items[4]
+
+    def test_many_load_sampled(self, valid_feature_collection_data):
+        """Test load_sampled keys structural errors by object index."""
+        items = [valid_feature_collection_data, {"type": "Point", "geometry": None}]
+        schema = GeoJSONSchema(many=True, sample_rate=0.0)
+
+        with pytest.raises(ValidationError) as exc_info:
+            schema.load_sampled(items)
+
+        assert list(exc_info.value.messages) == [1]
+
+        result, report = schema.load_sampled(items[:1])
+        assert result == items[:1]
+        assert report["sampled"] == []
+
+    def test_single_feature_collection_load_sampled(self):
+        """Test that a single FeatureCollection is sampled by feature."""
+        data = {"type": "FeatureCollection", "features": make_features(10, invalid={0})}
+        schema = GeoJSONSchema(sample_rate=1.0)
+
+        result, report = schema.load_sampled(data)
+
+        assert len(result["features"]) == 10
+        assert list(report["errors"]) == [0]
+        assert report["error_rate"] == 0.1
@@ -0,0 +1,203 @@
+"""Tests for memory-mapped, incremental GeoJSON file loading."""
+
+import json
+
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_geojson import GeoJSONSchema
+from marshmallow_geojson.stream import TextStream, iter_array, iter_members
+
+
+def make_features(count, invalid=()):
+    """Build Point features, with out-of-range longitudes at ``invalid`` indices."""
+    return [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [500 if idx in invalid else idx % 180, 0.5],
+            },
+            "properties": {"name": f"feature é {idx}"},
+        }
+        for idx in range(count)
+    ]
+
+
+class TestTextStream:
+    """Test suite for incremental JSON decoding."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+    def test_values_across_chunks(self, chunk_size):
+        """Test that values split across chunks (including numbers and UTF-8) decode."""
+        document = {"type": "X", "values": [12345, -0.25, "héllo ☃", None, True, {"a": []}]}
+        stream = TextStream(
+            json.dumps(document, ensure_ascii=False).encode(), chunk_size=chunk_size
+        )
+
+        members = {}
+        for key in iter_members(stream):
+            members[key] = list(iter_array(stream)) if key == "values" else stream.value()
+        stream.finish()
+
+        assert members == document
+
+    def test_invalid_json(self):
+        """Test that malformed documents raise JSONDecodeError."""
+        stream = TextStream(b"[1, 2 3]", chunk_size=2)
+
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_array(stream))
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 1024])
+    def test_values_truncated_by_chunks(self, chunk_size):
+        """Test that strings, escapes and literals split across chunks decode."""
+        document = [
+            "a long string value",
+            'é\\"\n',
+            "\U0001f30d",
+            True,
+            False,
+            None,
+            float("-inf"),
+            float("inf"),
+            {"a": [1e-5, -2]},
+        ]
+        stream = TextStream(json.dumps(document).encode(), chunk_size=chunk_size)
+
+        assert list(iter_array(stream)) == document
+
+    def test_malformed_value_not_read_ahead(self):
+        """Test that a malformed element fails without decoding the rest."""
+        features = json.dumps(make_features(5000))
+        document = f'\n[{{"type": "Feature" "geometry": null}}, {features[1:]}'.encode()
+        stream = TextStream(document, chunk_size=4096)
+
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            list(iter_array(stream))
+
+        assert stream.bytes_read <= 2 * 4096
+        assert exc_info.value.pos == 21
+        assert (exc_info.value.lineno, exc_info.value.colno) == (2, 21)
+
+    def test_error_offset(self):
+        """Test that errors report their position in the whole document."""
+        document = json.dumps([[idx, "\n"] for idx in range(500)], indent=1) + "x"
+        stream = TextStream(document.encode(), chunk_size=64)
+
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            list(iter_array(stream))
+            stream.finish()
+
+        assert exc_info.value.pos == len(document) - 1
+        assert exc_info.value.lineno == document.count("\n") + 1
+        assert exc_info.value.colno == 2
+
+    def test_extra_data(self):
+        """Test that trailing data after the document is rejected."""
+        stream = TextStream(b"[1] [2]")
+        list(iter_array(stream))
+
+        with pytest.raises(json.JSONDecodeError):
+            stream.finish()
+
+
+class TestLoadFile:
+    """Test suite for GeoJSONSchema.load_file."""
+
+    def write(self, tmp_path, data, **kwargs):
+        path = tmp_path / "data.geojson"
+        path.write_text(json.dumps(data, ensure_ascii=False, **kwargs), encoding="utf-8")
+        return path
+
+    def test_feature_collection(self, tmp_path):
+        """Test that a FeatureCollection file loads like the in-memory document."""
+        data = {
+            "type": "FeatureCollection",
+            "bbox": [0, 0, 179, 1],
+            "features": make_features(2500),
+        }
+        path = self.write(tmp_path, data, indent=2)
+
+        schema = GeoJSONSchema()
+        assert schema.load_file(path) == schema.load(data)
+        assert schema.load_file(str(path)) == schema.load(data)
+
+    def test_feature_collection_with_threads(self, tmp_path):
+        """Test that streamed features honour the threads option."""
+        data = {"type": "FeatureCollection", "features": make_features(50)}
+        path = self.write(tmp_path, data)
+
+        assert GeoJSONSchema(threads=4).load_file(path) == GeoJSONSchema().load(data)
+
+    def test_feature_errors_keyed_by_index(self, tmp_path):
+        """Test that feature errors are keyed by their index in the file."""
+        data = {"type": "FeatureCollection", "features": make_features(2100, invalid={5, 2050})}
+        path = self.write(tmp_path, data)
+
+        with pytest.raises(ValidationError) as exc_info:
+            GeoJSONSchema().load_file(path)
+        assert sorted(exc_info.value.messages["features"]) == [5, 2050]
+
+    def test_envelope_errors_merged(self, tmp_path):
+        """Test that FeatureCollection member errors are reported with feature errors."""
+        data = {
+            "type": "FeatureCollection",
+            "features": make_features(3, invalid={1}),
+            "bbox": [1, 2, 3],
+        }
+        path = self.write(tmp_path, data)
+
+        with pytest.raises(ValidationError) as exc_info:
+            GeoJSONSchema().load_file(path)
+        assert set(exc_info.value.messages) == {"bbox", "features"}
+        assert list(exc_info.value.messages["features"]) == [1]
+
+    def test_type_after_features(self, tmp_path):
+        """Test that a FeatureCollection whose type follows its features still loads."""
+        features = make_features(3)
+        path = tmp_path / "data.geojson"
+        path.write_text(json.dumps({"features": features, "type": "FeatureCollection"}))
+
+        result = GeoJSONSchema().load_file(path)
+        assert result == GeoJSONSchema().load({"type": "FeatureCollection", "features": features})
+
+    def test_geometry(self, tmp_path, valid_polygon_data):
+        """Test that other GeoJSON objects load from a file."""
+        path = self.write(tmp_path, valid_polygon_data)
+
+        assert GeoJSONSchema().load_file(path) == GeoJSONSchema().load(valid_polygon_data)
+
+    def test_many(self, tmp_path, valid_point_data, valid_polygon_data):
+        """Test that arrays of GeoJSON objects load in many mode."""
+        data = [valid_point_data, valid_polygon_data]
+        path = self.write(tmp_path, data)
+
+        assert GeoJSONSchema(many=True).load_file(path) == GeoJSONSchema(many=True).load(data)
+
+        with pytest.raises(ValidationError):
+            GeoJSONSchema().load_file(path)
+        with pytest.raises(ValidationError):
+            GeoJSONSchema().load_file(self.write(tmp_path, valid_point_data), many=True)
+
+    def test_many_errors(self, tmp_path, valid_point_data):
+        """Test that errors of every batch are keyed by their index in the file."""
+        invalid = {"type": "Point", "coordinates": [200, 0]}
+        data = [valid_point_data] * 2500
+        data[3] = data[2400] = invalid
+        path = self.write(tmp_path, data)
+
+        with pytest.raises(ValidationError) as exc_info:
+            GeoJSONSchema(many=True).load_file(path)
+        assert sorted(exc_info.value.messages) == [3, 2400]
+        with pytest.raises(ValidationError) as exc_info:
+            GeoJSONSchema(many=True).load(data)
+        assert sorted(exc_info.value.messages) == [3, 2400]
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file raises JSONDecodeError."""
+        path = tmp_path / "empty.geojson"
+        path.write_bytes(b"")
+
+        with pytest.raises(json.JSONDecodeError):
+            GeoJSONSchema().load_file(path)
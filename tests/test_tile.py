@@ -0,0 +1,127 @@
+"""Tests for tile bucketing."""
+
+import pytest
+
+from marshmallow_geojson import FeatureCollectionSchema, tile_index
+from marshmallow_geojson.tile import tile_bounds, tile_x, tile_y
+
+
+def feature(geometry, **members):
+    """Feature with the given geometry and extra members."""
+    return {"type": "Feature", "geometry": geometry, "properties": {}, **members}
+
+
+def collection(*features):
+    """Validated FeatureCollection of the given features."""
+    return FeatureCollectionSchema().load({"type": "FeatureCollection", "features": list(features)})
+
+
+class TestTileCoordinates:
+    """Test suite for the tile coordinate helpers."""
+
+    def test_tile_x(self):
+        """Test that longitudes map to columns, the east edge to the last one."""
+        assert tile_x(-180, 2) == 0
+        assert tile_x(-0.1, 2) == 1
+        assert tile_x(0, 2) == 2
+        assert tile_x(180, 2) == 3
+
+    def test_tile_y(self):
+        """Test that latitudes map to rows, clamped at the Mercator limit."""
+        assert tile_y(89, 1) == 0
+        assert tile_y(1, 1) == 0
+        assert tile_y(-1, 1) == 1
+        assert tile_y(-89, 1) == 1
+
+    def test_tile_bounds(self):
+        """Test that edge tiles reach the poles."""
+        assert tile_bounds(0, 0, 0) == (-180, -90, 180, 90)
+        west, south, east, north = tile_bounds(1, 0, 1)
+        assert (west, south, east, north) == (0, 0, 180, 90)
+        west, south, east, north = tile_bounds(1, 1, 2)
+        assert (west, east) == (-90, 0)
+        assert south == pytest.approx(0)
+        assert north == pytest.approx(66.51326044311186)
+
+
+class TestTileIndex:
+    """Test suite for tile_index."""
+
+    def test_zoom_zero(self):
+        """Test that every feature lands in the single zoom 0 tile."""
+        data = collection(
+            feature({"type": "Point", "coordinates": [10, 10]}),
+            feature({"type": "Point", "coordinates": [-10, -10]}),
+        )
+        tiles = tile_index(data, 0)
+        assert list(tiles) == [(0, 0, 0)]
+        assert tiles[(0, 0, 0)]["features"] == data["features"]
+
+    def test_assignment(self):
+        """Test that features land in every tile their bounds touch."""
+        point = feature({"type": "Point", "coordinates": [10, 10]})
+        line = feature({"type": "LineString", "coordinates": [[-10, 10], [10, -10]]})
+        tiles = tile_index(collection(point, line), 1)
+        assert sorted(tiles) == [(1, 0, 0), (1, 0, 1), (1, 1, 0), (1, 1, 1)]
+        assert tiles[(1, 1, 0)]["type"] == "FeatureCollection"
+        assert len(tiles[(1, 1, 0)]["features"]) == 2
+        assert len(tiles[(1, 0, 1)]["features"]) == 1
+
+    def test_null_geometry(self):
+        """Test that features without a geometry are not assigned."""
+        assert tile_index(collection(feature(None)), 0) == {}
+
+    def test_bbox_member(self):
+        """Test that the bbox member is used instead of the coordinates."""
+        point = feature({"type": "Point", "coordinates": [10, 10]}, bbox=[-100, 10, 10, 10])
+        tiles = tile_index(collection(point), 2)
+        assert sorted(tiles) == [(2, 0, 1), (2, 1, 1), (2, 2, 1)]
+
+    def test_antimeridian_bbox(self):
+        """Test that a bbox with west > east wraps around the antimeridian."""
+        line = feature(
+            {
+                "type": "MultiLineString",
+                "coordinates": [[[170, 10], [180, 10]], [[-180, 10], [-170, 10]]],
+            },
+            bbox=[170, 10, -170, 10],
+        )
+        tiles = tile_index(collection(line), 2)
+        assert sorted(tiles) == [(2, 0, 1), (2, 3, 1)]
+
+    def test_clip_line(self):
+        """Test that lines are clipped to each tile."""
+        line = feature(
+            {"type": "LineString", "coordinates": [[-10, 10], [10, 10]]}, bbox=[-10, 10, 10, 10]
+        )
+        tiles = tile_index(collection(line), 1, clip=True)
+        assert tiles[(1, 0, 0)]["features"][0]["geometry"]["coordinates"] == [[-10, 10], [0, 10]]
+        assert tiles[(1, 1, 0)]["features"][0]["geometry"]["coordinates"] == [[0, 10], [10, 10]]
+        assert tiles[(1, 1, 0)]["features"][0]["bbox"] == [0, 10, 10, 10]
+        assert line["geometry"]["coordinates"] == [[-10, 10], [10, 10]]
+
+    def test_clip_polygon(self):
+        """Test that clipped polygons are valid FeatureCollections."""
+        square = [[-10, -10], [10, -10], [10, 10], [-10, 10], [-10, -10]]
+        tiles = tile_index(
+            collection(feature({"type": "Polygon", "coordinates": [square]})), 1, clip=True
+        )
+        assert len(tiles) == 4
+        for (_, x, y), tile in tiles.items():
+            FeatureCollectionSchema().load(tile)
+            ring = tile["features"][0]["geometry"]["coordinates"][0]
+            xs = {position[0] for position in ring}
+            ys = {position[1] for position in ring}
+            assert xs == ({-10, 0} if x == 0 else {0, 10})
+            assert ys == ({0, 10} if y == 0 else {-10, 0})
+
+    def test_clip_drops_empty(self):
+        """Test that features whose bbox touches a tile but geometry does not are dropped."""
+        line = feature({"type": "LineString", "coordinates": [[-10, 10], [10, -10]]})
+        tiles = tile_index(collection(line), 1, clip=True)
+        assert sorted(tiles) == [(1, 0, 0), (1, 1, 1)]
+
+    def test_negative_zoom(self):
+        """Test that a negative zoom is rejected."""
+        with pytest.raises(ValueError, match="zoom must not be negative"):
+            tile_index(collection(), -1)
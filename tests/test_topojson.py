@@ -0,0 +1,198 @@
+"""Tests for TopoJSON conversion."""
+
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_geojson import FeatureCollectionSchema, from_topojson, to_topojson
+
+
+def square(x, y):
+    """Counter-clockwise unit square ring with its lower left corner at (x, y)."""
+    return [[x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1], [x, y]]
+
+
+def rotate(ring):
+    """Ring rotated to start at its smallest position, without the closing position."""
+    start = ring.index(min(ring[:-1]))
+    return ring[start:-1] + ring[:start]
+
+
+def feature(geometry, **properties):
+    """Feature with the given geometry and properties."""
+    return {"type": "Feature", "geometry": geometry, "properties": properties}
+
+
+@pytest.fixture
+def adjacent_polygons():
+    """Two squares sharing an edge, and one sharing a vertex."""
+    return FeatureCollectionSchema().load(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                feature({"type": "Polygon", "coordinates": [square(0, 0)]}, name="a"),
+                feature({"type": "Polygon", "coordinates": [square(1, 0)]}, name="b"),
+                feature({"type": "MultiPolygon", "coordinates": [[square(2, 1)]]}, name="c"),
+            ],
+        }
+    )
+
+
+class TestToTopoJSON:
+    """Test suite for to_topojson."""
+
+    def test_shared_arcs(self, adjacent_polygons):
+        """Test that the shared edge is stored once and referenced in reverse."""
+        topology = to_topojson(adjacent_polygons, quantization=None)
+
+        geometries = topology["objects"]["collection"]["geometries"]
+        first, second = geometries[0]["arcs"][0], geometries[1]["arcs"][0]
+        shared = [index for index in first if ~index in second]
+        assert len(shared) == 1
+        assert topology["arcs"][shared[0]] == [[1, 0], [1, 1]]
+        # The shared edge, the rest of each of the first two squares (the
+        # second one cut where it touches the third), and the third square.
+        assert len(topology["arcs"]) == 5
+        assert geometries[2]["properties"] == {"name": "c"}
+
+    def test_quantization(self, adjacent_polygons):
+        """Test that quantized arcs are delta-encoded integers."""
+        topology = to_topojson(adjacent_polygons, quantization=4)
+
+        assert topology["bbox"] == [0, 0, 3, 2]
+        assert topology["transform"] == {"scale": [1.0, 2 / 3], "translate": [0, 0]}
+        for arc in topology["arcs"]:
+            assert all(isinstance(value, int) for position in arc for value in position)
+
+    def test_identical_rings(self):
+        """Test that rings without junctions are matched regardless of start."""
+        ring = square(0, 0)
+        rotated = ring[2:-1] + ring[:3]
+        collection = FeatureCollectionSchema().load(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    feature({"type": "Polygon", "coordinates": [ring]}),
+                    feature({"type": "Polygon", "coordinates": [rotated[::-1]]}),
+                ],
+            }
+        )
+
+        topology = to_topojson(collection, quantization=None)
+
+        assert len(topology["arcs"]) == 1
+        geometries = topology["objects"]["collection"]["geometries"]
+        assert [geometry["arcs"] for geometry in geometries] == [[[0]], [[~0]]]
+
+    def test_invalid_quantization(self, adjacent_polygons):
+        """Test that a quantization below 2 is rejected."""
+        with pytest.raises(ValueError, match="quantization"):
+            to_topojson(adjacent_polygons, quantization=1)
+
+
+class TestFromTopoJSON:
+    """Test suite for from_topojson."""
+
+    @pytest.mark.parametrize("quantization", [None, 601])
+    def test_round_trip(self, adjacent_polygons, quantization):
+        """Test that polygons are rebuilt from their arcs.
+
+        Rings start at a junction once rebuilt, so they are compared
+        regardless of their first position.
+        """
+        collection = from_topojson(to_topojson(adjacent_polygons, quantization=quantization))
+
+        polygons = [feature["geometry"]["coordinates"] for feature in collection["features"]]
+        rings = [rotate(ring) for ring in polygons[0] + polygons[1] + polygons[2][0]]
+        expected = [rotate(square(0, 0)), rotate(square(1, 0)), rotate(square(2, 1))]
+        for ring, expected_ring in zip(rings, expected, strict=True):
+            assert ring == [pytest.approx(position) for position in expected_ring]
+        assert collection["features"][1]["properties"] == {"name": "b"}
+
+    def test_round_trip_all_types(self, valid_feature_collection_data):
+        """Test that every geometry type, ids and null geometries survive."""
+        validated = FeatureCollectionSchema().load(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {"type": "Feature", "id": 7, "geometry": None, "properties": None},
+                    feature({"type": "Point", "coordinates": [-180.0, -90.0]}),
+                    feature({"type": "MultiPoint", "coordinates": [[1.0, 2.0], [180.0, 90.0]]}),
+                    feature({"type": "LineString", "coordinates": [[0.0, 0.0], [5.0, 5.0]]}),
+                    feature(
+                        {
+                            "type": "MultiLineString",
+                            "coordinates": [[[0.0, 0.0], [5.0, 5.0]], [[5.0, 5.0], [6.0, 5.0]]],
+                        }
+                    ),
+                    feature(
+                        {
+                            "type": "GeometryCollection",
+                            "geometries": [{"type": "Point", "coordinates": [3.0, 3.0]}],
+                        }
+                    ),
+                ],
+            }
+        )
+
+        assert from_topojson(to_topojson(validated, quantization=None)) == validated
+        quantized = from_topojson(to_topojson(validated))
+        assert quantized["features"][1]["geometry"]["coordinates"] == [-180.0, -90.0]
+        assert quantized["features"][2]["geometry"]["coordinates"][1] == [180.0, 90.0]
+
+    def test_single_object(self):
+        """Test converting a topology whose object is a single geometry."""
+        topology = {
+            "type": "Topology",
+            "objects": {"line": {"type": "LineString", "arcs": [0, ~1]}},
+            "arcs": [[[0, 0], [1, 1]], [[2, 0], [1, 1]]],
+        }
+
+        collection = from_topojson(topology)
+
+        assert collection["features"][0]["geometry"] == {
+            "type": "LineString",
+            "coordinates": [[0, 0], [1, 1], [2, 0]],
+        }
+
+    @pytest.mark.parametrize(
+        ("topology", "object_name"),
+        [
+            ({"type": "FeatureCollection", "features": []}, None),
+            ({"type": "Topology", "arcs": []}, None),
+            ({"type": "Topology", "objects": {"a": {}, "b": {}}, "arcs": []}, None),
+            ({"type": "Topology", "objects": {"a": {}}, "arcs": []}, "b"),
+            (
+                {"type": "Topology", "objects": {"a": {"type": "LineString", "arcs": [3]}}},
+                None,
+            ),
+            (
+                {
+                    "type": "Topology",
+                    "objects": {"a": {"type": "LineString", "arcs": [3]}},
+                    "arcs": [],
+                },
+                None,
+            ),
+            (
+                {"type": "Topology", "objects": {"a": {"type": "Circle", "arcs": []}}, "arcs": []},
+                None,
+            ),
+        ],
+    )
+    def test_malformed(self, topology, object_name):
+        """Test that malformed topologies raise ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            from_topojson(topology, object_name)
+        assert exc_info.value.messages["_schema"][0].startswith("Invalid TopoJSON")
+
+    def test_validates(self):
+        """Test that the rebuilt FeatureCollection is validated."""
+        topology = {
+            "type": "Topology",
+            "objects": {"a": {"type": "Polygon", "arcs": [[0]]}},
+            "arcs": [[[0, 0], [1, 0], [0, 0]]],
+        }
+
+        with pytest.raises(ValidationError) as exc_info:
+            from_topojson(topology)
+        assert "features" in exc_info.value.messages
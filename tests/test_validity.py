@@ -0,0 +1,143 @@
+"""Tests for strict Polygon and MultiPolygon validity checks."""
+
+import math
+
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_geojson import MultiPolygonSchema, PolygonSchema
+from marshmallow_geojson.validity import multi_polygon_error, polygon_error
+
+SHELL = [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]]
+HOLE = [[1, 1], [1, 3], [3, 3], [3, 1], [1, 1]]
+
+
+def square(x, y, size=1):
+    """Square ring with its lower left corner at (x, y)."""
+    return [[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]
+
+
+class TestPolygonError:
+    """Test suite for polygon_error."""
+
+    @pytest.mark.parametrize(
+        "coordinates",
+        [
+            [SHELL],
+            [SHELL, HOLE],
+            # Repeated consecutive positions are allowed.
+            [[[0, 0], [4, 0], [4, 0], [4, 4], [0, 4], [0, 0]]],
+            # A hole may touch the shell at a single point.
+            [SHELL, [[0, 2], [1, 3], [1, 1], [0, 2]]],
+            # Holes may touch each other at a single point.
+            [SHELL, square(1, 1), square(2, 2)],
+            # Collinear consecutive edges.
+            [[[0, 0], [2, 0], [4, 0], [4, 4], [0, 4], [0, 0]]],
+        ],
+    )
+    def test_valid(self, coordinates):
+        """Test that valid polygons pass."""
+        assert polygon_error(coordinates) is None
+
+    @pytest.mark.parametrize(
+        ("coordinates", "message"),
+        [
+            (
+                [[[0, 0], [2, 2], [2, 0], [0, 2], [0, 0]]],
+                "ring 0 edge 2-3 crosses ring 0 edge 0-1 at [1.0, 1.0]",
+            ),
+            (
+                [[[0, 0], [2, 0], [1, 0], [1, 1], [0, 0]]],
+                "ring 0 edge 1-2 overlaps ring 0 edge 0-1",
+            ),
+            (
+                [[[0, 0], [2, 0], [2, 2], [1, 0], [0, 2], [0, 0]]],
+                "ring 0 edge 3-4 touches ring 0 edge 0-1 at [1, 0]",
+            ),
+            (
+                [[[0, 0], [2, 0], [1, 1], [2, 2], [0, 2], [1, 1], [0, 0]]],
+                "ring 0 touches itself at vertices 2 and 5",
+            ),
+            ([[[0, 0], [1, 0], [1, 0], [0, 0]]], "ring 0 has fewer than 3 distinct positions"),
+            ([SHELL, square(3, 3, 2)], "ring 1 edge 3-4 crosses ring 0 edge 2-3 at [3.0, 4.0]"),
+            ([SHELL, [[0, 1], [0, 3], [1, 2], [0, 1]]], "ring 1 edge 0-1 overlaps ring 0"),
+            ([SHELL, square(5, 5)], "ring 1 lies outside the exterior ring"),
+            ([SHELL, HOLE, square(1.5, 1.5)], "ring 2 lies inside ring 1"),
+        ],
+    )
+    def test_invalid(self, coordinates, message):
+        """Test that errors name the offending rings and vertices."""
+        assert message in polygon_error(coordinates)
+
+    def test_large_ring(self):
+        """Test a ring with many vertices, valid and with a single crossing."""
+        count = 20_000
+        ring = [
+            [math.cos(2 * math.pi * idx / count) * 50, math.sin(2 * math.pi * idx / count) * 50]
+            for idx in range(count)
+        ]
+        ring.append(ring[0])
+        assert polygon_error([ring]) is None
+
+        ring[100], ring[101] = ring[101], ring[100]
+        assert "ring 0 edge 99-100 crosses ring 0 edge 101-102" in polygon_error([ring])
+
+
+class TestMultiPolygonError:
+    """Test suite for multi_polygon_error."""
+
+    @pytest.mark.parametrize(
+        "coordinates",
+        [
+            [[square(0, 0)], [square(2, 0)]],
+            # Polygons may touch at a single point.
+            [[square(0, 0)], [square(1, 1)]],
+            # An island in a lake.
+            [[SHELL, HOLE], [square(1.5, 1.5)]],
+        ],
+    )
+    def test_valid(self, coordinates):
+        """Test that valid multipolygons pass."""
+        assert multi_polygon_error(coordinates) is None
+
+    @pytest.mark.parametrize(
+        ("coordinates", "message"),
+        [
+            ([[SHELL], [square(1, 1)]], "polygon 1 overlaps polygon 0"),
+            ([[square(1, 1)], [SHELL]], "polygon 0 overlaps polygon 1"),
+            ([[SHELL, HOLE], [square(0.5, 0.5)]], "polygon 1 ring 0 edge"),
+            ([[square(0, 0)], [square(1, 0)]], "polygon 1 ring 0 edge 3-4 overlaps polygon 0"),
+            ([[square(10, 10)], [SHELL, square(5, 5)]], "polygon 1 ring 1 lies outside"),
+        ],
+    )
+    def test_invalid(self, coordinates, message):
+        """Test that errors name the offending polygons, rings and vertices."""
+        assert message in multi_polygon_error(coordinates)
+
+
+class TestStrictValiditySchemas:
+    """Test suite for the validity option of the polygon schemas."""
+
+    def test_polygon_schema(self):
+        """Test that strict mode reports errors under coordinates."""
+        data = {"type": "Polygon", "coordinates": [[[0, 0], [2, 2], [2, 0], [0, 2], [0, 0]]]}
+
+        assert PolygonSchema().load(data) == data
+        with pytest.raises(ValidationError) as exc_info:
+            PolygonSchema(validity="strict").load(data)
+        assert list(exc_info.value.messages) == ["coordinates"]
+        assert "crosses" in exc_info.value.messages["coordinates"][0]
+
+    def test_multi_polygon_schema(self):
+        """Test strict mode on MultiPolygonSchema."""
+        data = {"type": "MultiPolygon", "coordinates": [[SHELL], [square(1, 1)]]}
+
+        with pytest.raises(ValidationError, match="polygon 1 overlaps polygon 0"):
+            MultiPolygonSchema(validity="strict").load(data)
+        valid = {"type": "MultiPolygon", "coordinates": [[SHELL, HOLE]]}
+        assert MultiPolygonSchema(validity="strict").load(valid) == valid
+
+    def test_invalid_mode(self):
+        """Test that unknown validity modes are rejected."""
+        with pytest.raises(ValueError, match="validity"):
+            PolygonSchema(validity="lenient")
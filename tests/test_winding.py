@@ -0,0 +1,161 @@
+"""Tests for ring winding order validation and rewinding."""
+
+import pytest
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_geojson import (
+    GeoJSONSchema,
+    MultiPolygonSchema,
+    PolygonSchema,
+    RightHandRule,
+)
+from marshmallow_geojson.winding import rewind, ring_area
+
+CCW = [[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0], [0.0, 0.0]]
+CW = CCW[::-1]
+HOLE_CW = [[1.0, 1.0], [1.0, 2.0], [2.0, 2.0], [2.0, 1.0], [1.0, 1.0]]
+HOLE_CCW = HOLE_CW[::-1]
+
+
+def copy(coordinates):
+    """Deep copy of nested coordinate lists."""
+    if coordinates and isinstance(coordinates[0], list):
+        return [copy(item) for item in coordinates]
+    return list(coordinates)
+
+
+class TestRingArea:
+    """Test suite for signed ring areas."""
+
+    def test_sign(self):
+        """Test that counterclockwise rings have a positive area."""
+        assert ring_area(CCW) == 16.0
+        assert ring_area(CW) == -16.0
+        assert ring_area([[0, 0], [1, 1], [2, 2], [0, 0]]) == 0
+
+
+class TestRightHandRule:
+    """Test suite for the RightHandRule validator."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            [CCW],
+            [CCW, HOLE_CW],
+            [[CCW], [CCW, HOLE_CW]],
+            [[[0, 0], [1, 1], [2, 2], [0, 0]]],
+        ],
+    )
+    def test_valid(self, value):
+        """Test that correctly oriented polygons and multipolygons pass."""
+        assert RightHandRule()(value) is value
+
+    @pytest.mark.parametrize(
+        ("value", "message"),
+        [
+            ([CW], "Exterior ring must be counterclockwise"),
+            ([CCW, HOLE_CW, HOLE_CCW], "Interior ring 2 must be clockwise"),
+            ([[CCW], [CW]], "Polygon 1: Exterior ring"),
+        ],
+    )
+    def test_invalid(self, value, message):
+        """Test that misoriented rings are reported."""
+        with pytest.raises(ValidationError, match=message):
+            RightHandRule()(value)
+
+    @pytest.mark.parametrize(
+        "value",
+        [[], [[]], [[[]]], [[[[]]]], [[], [CW]], [[[]], [CW]], [CCW, [[0, 0], [1]]]],
+    )
+    def test_malformed(self, value):
+        """Test that empty and malformed rings are left to the ring validators."""
+        assert RightHandRule()(value) is value
+
+
+class TestRewind:
+    """Test suite for the rewind option."""
+
+    def test_polygon_schema(self):
+        """Test that PolygonSchema reorients rings on load and dump."""
+        data = {"type": "Polygon", "coordinates": [CW, HOLE_CCW]}
+        schema = PolygonSchema(rewind=True)
+
+        assert schema.load(data)["coordinates"] == [CCW, HOLE_CW]
+        assert schema.dump(data)["coordinates"] == [CCW, HOLE_CW]
+        assert data["coordinates"] == [CW, HOLE_CCW]
+        assert PolygonSchema().load(data)["coordinates"] == [CW, HOLE_CCW]
+
+    def test_multi_polygon_schema(self):
+        """Test that MultiPolygonSchema reorients the rings of every polygon."""
+        data = {"type": "MultiPolygon", "coordinates": [[CCW], [CW, HOLE_CCW]]}
+
+        loaded = MultiPolygonSchema(rewind=True).load(data)
+
+        assert loaded["coordinates"] == [[CCW], [CCW, HOLE_CW]]
+
+    def test_geojson_schema_nested(self):
+        """Test that GeoJSONSchema reorients polygons nested in features."""
+        data = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "GeometryCollection",
+                        "geometries": [{"type": "Polygon", "coordinates": [CW]}],
+                    },
+                    "properties": {},
+                },
+                {"type": "Feature", "geometry": None, "properties": {}},
+            ],
+        }
+        schema = GeoJSONSchema(rewind=True)
+
+        loaded = schema.load(data)
+        assert loaded["features"][0]["geometry"]["geometries"][0]["coordinates"] == [CCW]
+        dumped = schema.dump(data)
+        assert dumped["features"][0]["geometry"]["geometries"][0]["coordinates"] == [CCW]
+
+    def test_geojson_schema_many(self):
+        """Test rewinding in many mode."""
+        data = [
+            {"type": "Polygon", "coordinates": [CW]},
+            {"type": "MultiPolygon", "coordinates": [[CW]]},
+        ]
+
+        loaded = GeoJSONSchema(many=True, rewind=True).load(data)
+
+        assert [item["coordinates"] for item in loaded] == [[CCW], [[CCW]]]
+
+    def test_rewind_in_place(self):
+        """Test that rewind reverses rings in place and ignores other objects."""
+        polygon = {"type": "Polygon", "coordinates": copy([CW, HOLE_CCW])}
+        point = {"type": "Point", "coordinates": [1.0, 2.0]}
+
+        assert rewind(polygon) is polygon
+        assert polygon["coordinates"] == [CCW, HOLE_CW]
+        assert rewind(point) == {"type": "Point", "coordinates": [1.0, 2.0]}
+        assert rewind(None) is None
+
+    @pytest.mark.parametrize("many", [False, True])
+    def test_sampled_input_unchanged(self, many):
+        """Test that features left out by sampling are not rewound in the input."""
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Polygon", "coordinates": [copy(CW)]},
+                "properties": {},
+            }
+            for _ in range(20)
+        ]
+        data = features if many else {"type": "FeatureCollection", "features": features}
+        schema = GeoJSONSchema(
+            many=many, rewind=True, validation="sample", sample_rate=0.25, sample_seed=1
+        )
+
+        result = schema.load(data)
+
+        assert all(feature["geometry"]["coordinates"] == [CW] for feature in features)
+        loaded = result if many else result["features"]
+        rewound = [feature for feature in loaded if feature["geometry"]["coordinates"] == [CCW]]
+        assert 0 < len(rewound) < len(features)
@@ -0,0 +1,183 @@
+"""Tests for WKB/EWKB encoding and decoding."""
+
+import struct
+
+import pytest
+from marshmallow import Schema
+from marshmallow.exceptions import ValidationError
+
+from marshmallow_geojson import GeometriesSchema, WKBGeometryField
+from marshmallow_geojson.wkb import decode_wkb, encode_wkb
+
+POINT_WKB = "0101000000000000000000f03f0000000000000040"
+POINT_EWKB = "0101000020e6100000000000000000f03f0000000000000040"
+
+SQUARE = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]
+
+GEOMETRIES = [
+    {"type": "Point", "coordinates": [1.0, 2.0]},
+    {"type": "Point", "coordinates": [1.0, 2.0, 3.0]},
+    {"type": "LineString", "coordinates": [[0.0, 0.0], [1.0, 1.0]]},
+    {"type": "Polygon", "coordinates": [SQUARE, SQUARE]},
+    {"type": "MultiPoint", "coordinates": [[1.0, 2.0], [3.0, 4.0]]},
+    {"type": "MultiLineString", "coordinates": [[[0.0, 0.0, 1.0], [1.0, 1.0, 2.0]]]},
+    {"type": "MultiPolygon", "coordinates": [[SQUARE], [SQUARE, SQUARE]]},
+    {
+        "type": "GeometryCollection",
+        "geometries": [
+            {"type": "Point", "coordinates": [1.0, 2.0]},
+            {"type": "LineString", "coordinates": [[0.0, 0.0], [1.0, 1.0]]},
+        ],
+    },
+]
+
+
+class TestWKB:
+    """Test suite for the WKB codec."""
+
+    def test_decode_point(self):
+        """Test decoding ISO WKB and PostGIS EWKB points."""
+        assert decode_wkb(POINT_WKB) == ({"type": "Point", "coordinates": [1.0, 2.0]}, None)
+        assert decode_wkb(bytes.fromhex(POINT_EWKB)) == (
+            {"type": "Point", "coordinates": [1.0, 2.0]},
+            4326,
+        )
+
+    def test_encode_point(self):
+        """Test encoding ISO WKB and EWKB with an SRID."""
+        point = {"type": "Point", "coordinates": [1.0, 2.0]}
+
+        assert encode_wkb(point).hex() == POINT_WKB
+        assert encode_wkb(point, srid=4326).hex() == POINT_EWKB
+
+    @pytest.mark.parametrize("geometry", GEOMETRIES)
+    @pytest.mark.parametrize("byte_order", ["little", "big"])
+    @pytest.mark.parametrize("srid", [None, 3857])
+    def test_round_trip(self, geometry, byte_order, srid):
+        """Test that every geometry type round-trips in both byte orders."""
+        data = encode_wkb(geometry, byte_order=byte_order, srid=srid)
+
+        assert decode_wkb(data) == (geometry, srid)
+
+    def test_m_values_dropped(self):
+        """Test that M values of ISO XYM/XYZM geometries are dropped."""
+        xym = struct.pack("<BI3d", 1, 2001, 1.0, 2.0, 9.0)
+        xyzm = struct.pack("<BI4d", 1, 3001, 1.0, 2.0, 3.0, 9.0)
+
+        assert decode_wkb(xym)[0]["coordinates"] == [1.0, 2.0]
+        assert decode_wkb(xyzm)[0]["coordinates"] == [1.0, 2.0, 3.0]
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            POINT_WKB[:-2],
+            POINT_WKB + "00",
+            "02" + POINT_WKB[2:],
+            "zz",
+            struct.pack("<BI", 1, 99),
+            struct.pack("<BI2d", 1, 1, float("nan"), float("nan")),
+            struct.pack("<BII", 1, 2, 2**31),
+            # A MultiPoint whose member is a LineString.
+            struct.pack("<BIIBII4d", 1, 4, 1, 1, 2, 2, 0, 0, 1, 1),
+        ],
+    )
+    def test_invalid(self, data):
+        """Test that malformed WKB raises ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            decode_wkb(data)
+        assert exc_info.value.messages["_schema"][0].startswith("Invalid WKB")
+
+    def test_deeply_nested(self):
+        """Test that deeply nested GeometryCollections decode without recursion."""
+        depth = 10000
+        collection = struct.pack("<BII", 1, 7, 1)
+        data = collection * depth + bytes.fromhex(POINT_WKB)
+
+        geometry, _ = decode_wkb(data)
+        for _ in range(depth):
+            assert geometry["type"] == "GeometryCollection"
+            (geometry,) = geometry["geometries"]
+        assert geometry == {"type": "Point", "coordinates": [1.0, 2.0]}
+
+        with pytest.raises(ValidationError, match="unexpected end of data"):
+            decode_wkb(collection * depth)
+
+
+class TestGeometriesSchemaWKB:
+    """Test suite for GeometriesSchema.load_wkb and dump_wkb."""
+
+    def test_load_wkb(self):
+        """Test that decoded geometries are validated."""
+        schema = GeometriesSchema()
+
+        assert schema.load_wkb(POINT_WKB) == {"type": "Point", "coordinates": [1.0, 2.0]}
+        assert (
+            schema.load_wkb([POINT_WKB, POINT_EWKB], many=True)
+            == [{"type": "Point", "coordinates": [1.0, 2.0]}] * 2
+        )
+
+    def test_load_wkb_many_errors(self):
+        """Test that many=True errors are keyed by item index."""
+        invalid = encode_wkb({"type": "Point", "coordinates": [200.0, 0.0]})
+
+        with pytest.raises(ValidationError) as exc_info:
+            GeometriesSchema().load_wkb([POINT_WKB, "zz", POINT_WKB, invalid], many=True)
+
+        messages = exc_info.value.messages
+        assert sorted(messages) == [1, 3]
+        assert messages[1]["_schema"][0].startswith("Invalid WKB")
+        assert "Longitude" in str(messages[3])
+
+    @pytest.mark.parametrize(
+        ("geometry", "message"),
+        [
+            ({"type": "Point", "coordinates": [200.0, 0.0]}, "Longitude"),
+            (
+                {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1]]]},
+                "same coordinate",
+            ),
+        ],
+    )
+    def test_load_wkb_validates(self, geometry, message):
+        """Test that WKB input gets the same checks as GeoJSON input."""
+        with pytest.raises(ValidationError, match=message):
+            GeometriesSchema().load_wkb(encode_wkb(geometry))
+
+    def test_dump_wkb(self):
+        """Test encoding validated geometries."""
+        schema = GeometriesSchema()
+        point = {"type": "Point", "coordinates": [1.0, 2.0]}
+
+        assert schema.dump_wkb(point).hex() == POINT_WKB
+        assert [data.hex() for data in schema.dump_wkb([point], many=True, srid=4326)] == [
+            POINT_EWKB
+        ]
+
+
+class TestWKBGeometryField:
+    """Test suite for WKBGeometryField."""
+
+    class PlaceSchema(Schema):
+        geom = WKBGeometryField(srid=4326, as_hex=True)
+
+    def test_load(self):
+        """Test that the field decodes and validates WKB."""
+        assert self.PlaceSchema().load({"geom": POINT_EWKB}) == {
+            "geom": {"type": "Point", "coordinates": [1.0, 2.0]}
+        }
+
+    def test_load_invalid(self):
+        """Test that invalid values are reported under the field name."""
+        with pytest.raises(ValidationError) as exc_info:
+            self.PlaceSchema().load({"geom": 12})
+        assert exc_info.value.messages == {"geom": ["Not a valid WKB geometry."]}
+
+        with pytest.raises(ValidationError) as exc_info:
+            self.PlaceSchema().load({"geom": encode_wkb({"type": "Point", "coordinates": [0, 95]})})
+        assert "geom" in exc_info.value.messages
+
+    def test_dump(self):
+        """Test that the field dumps hexadecimal EWKB."""
+        data = {"geom": {"type": "Point", "coordinates": [1.0, 2.0]}}
+
+        assert self.PlaceSchema().dump(data) == {"geom": POINT_EWKB}